@@ -0,0 +1,205 @@
+import bisect
+import json
+import logging
+import os
+import struct
+import threading
+from array import array
+from datetime import date
+
+from dashboard.data import DATA_DIR
+
+logger = logging.getLogger(__name__)
+
+# One JSON object per line ({"date": "YYYY-MM-DD", "activity": "..."}),
+# oldest first. Lines are only ever appended; the index stores each line's
+# byte offset and date so a page or a date range is read with one seek.
+LOG_PATH = os.path.join(DATA_DIR, "activities.jsonl")
+
+# Index records: byte offset of the line, date as a proleptic ordinal
+_RECORD = struct.Struct("<qi")
+
+PAGE_SIZE = 10
+
+
+def display_date(iso):
+    day = date.fromisoformat(iso)
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+class ActivityLog:
+    # Process-wide; catches up with lines appended by other processes on
+    # the next read, indexing only the new tail of the file
+
+    def __init__(self, path, index_path=None):
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        self.offsets = array("q")
+        self.ordinals = array("i")
+        self.indexed_to = 0
+        self.sorted = True
+        self._signature = None
+        self._lock = threading.Lock()
+        self._load_index()
+
+    # Index maintenance
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return
+        raw = raw[:len(raw) - len(raw) % _RECORD.size]
+        for offset, ordinal in _RECORD.iter_unpack(raw):
+            self._add(offset, ordinal)
+        # Trust the saved index only if its last entry still points at a
+        # whole line; otherwise the log was rewritten and is reindexed
+        end = self._line_end(self.offsets[-1]) if self.offsets else 0
+        if end is None:
+            logger.warning("Activity index %s does not match the log, rebuilding", self.index_path)
+            self.offsets, self.ordinals, self.sorted = array("q"), array("i"), True
+            end = 0
+        self.indexed_to = end
+
+    def _line_end(self, offset):
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                line = f.readline()
+            if not line.endswith(b"\n"):
+                return None
+            json.loads(line)
+        except (OSError, ValueError):
+            return None
+        return offset + len(line)
+
+    def _add(self, offset, ordinal):
+        if self.ordinals and ordinal < self.ordinals[-1]:
+            self.sorted = False
+        self.offsets.append(offset)
+        self.ordinals.append(ordinal)
+
+    def refresh(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return
+        with self._lock:
+            if signature == self._signature:
+                return
+            if stat.st_size < self.indexed_to:
+                # Truncated: not append-only any more, start over
+                self.offsets, self.ordinals, self.sorted = array("q"), array("i"), True
+                self.indexed_to = 0
+            added = self._index_tail()
+            self._signature = signature
+        if added:
+            self._save_index(added)
+
+    def _index_tail(self):
+        added = 0
+        with open(self.path, "rb") as f:
+            f.seek(self.indexed_to)
+            offset = self.indexed_to
+            for line in f:
+                # A line still being written is picked up next time
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    entry = json.loads(line)
+                    self._add(offset, date.fromisoformat(entry["date"]).toordinal())
+                    added += 1
+                offset += len(line)
+        self.indexed_to = offset
+        return added
+
+    def _save_index(self, added):
+        # Append the new records; a read-only data directory just means the
+        # index is rebuilt in memory on start-up
+        start = len(self.offsets) - added
+        try:
+            mode = "ab" if start and os.path.getsize(self.index_path) == start * _RECORD.size else "wb"
+        except OSError:
+            mode = "wb"
+        if mode == "wb":
+            start = 0
+        try:
+            with open(self.index_path, mode) as f:
+                f.write(b"".join(_RECORD.pack(self.offsets[i], self.ordinals[i]) for i in range(start, len(self.offsets))))
+        except OSError as exc:
+            logger.debug("Activity index not saved: %s", exc)
+
+    # Queries
+
+    def version(self):
+        self.refresh()
+        return f"{len(self.offsets)}:{self.indexed_to}"
+
+    def date_range(self):
+        self.refresh()
+        if not self.ordinals:
+            return None
+        if self.sorted:
+            return date.fromordinal(self.ordinals[0]), date.fromordinal(self.ordinals[-1])
+        return date.fromordinal(min(self.ordinals)), date.fromordinal(max(self.ordinals))
+
+    def matching(self, start=None, end=None):
+        # Index positions (oldest first) with start <= date <= end
+        self.refresh()
+        count = len(self.offsets)
+        if start is None and end is None:
+            return range(count)
+        lo = start.toordinal() if start is not None else -2**31
+        hi = end.toordinal() if end is not None else 2**31 - 1
+        if self.sorted:
+            return range(bisect.bisect_left(self.ordinals, lo, 0, count), bisect.bisect_right(self.ordinals, hi, 0, count))
+        return [i for i in range(count) if lo <= self.ordinals[i] <= hi]
+
+    def read(self, positions):
+        # Contiguous positions are read with a single seek
+        positions = sorted(positions)
+        entries = []
+        if not positions:
+            return entries
+        with open(self.path, "rb") as f:
+            i = 0
+            while i < len(positions):
+                j = i
+                while j + 1 < len(positions) and positions[j + 1] == positions[j] + 1:
+                    j += 1
+                first, last = positions[i], positions[j]
+                end = self.offsets[last + 1] if last + 1 < len(self.offsets) else self.indexed_to
+                f.seek(self.offsets[first])
+                chunk = f.read(end - self.offsets[first])
+                entries.extend(json.loads(line) for line in chunk.splitlines() if line.strip())
+                i = j + 1
+        return entries
+
+    def page(self, number=0, per_page=PAGE_SIZE, start=None, end=None):
+        # Page 0 holds the newest entries. Returns (entries newest first,
+        # total matching entries).
+        positions = self.matching(start, end)
+        total = len(positions)
+        stop = max(total - number * per_page, 0)
+        chosen = positions[max(stop - per_page, 0):stop]
+        entries = [
+            {"date": display_date(entry["date"]), "activity": entry["activity"]}
+            for entry in reversed(self.read(chosen))
+        ]
+        return entries, total
+
+    def append(self, day, activity):
+        line = json.dumps({"date": day.isoformat(), "activity": activity}, ensure_ascii=False) + "\n"
+        # O_APPEND keeps concurrent single-line writes whole
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+
+log = ActivityLog(LOG_PATH)
@@ -0,0 +1,42 @@
+import os
+
+import streamlit as st
+
+from dashboard import metrics
+
+# The metrics panel shows for ?admin=<token> when this is set
+ADMIN_TOKEN = os.environ.get("DASHBOARD_ADMIN_TOKEN")
+
+
+@st.cache_resource(show_spinner=False)
+def ensure_exporters():
+    # Once per process: sidecar /metrics endpoint and/or textfile writer
+    return metrics.start_exporters()
+
+
+def session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return None
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+def _query_param(name):
+    if hasattr(st, "query_params"):
+        return st.query_params.get(name)
+    values = st.experimental_get_query_params().get(name)
+    return values[0] if values else None
+
+
+def is_admin():
+    return bool(ADMIN_TOKEN) and _query_param("admin") == ADMIN_TOKEN
+
+
+def render_admin_panel():
+    with st.sidebar.expander("Metrics (admin)"):
+        st.metric("Active sessions", metrics.sessions.active())
+        st.markdown("**Reruns by session**")
+        st.table([{"session": sid, "reruns": count} for sid, count in metrics.sessions.top()])
+        st.code(metrics.registry.exposition(), language="text")
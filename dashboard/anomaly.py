@@ -0,0 +1,277 @@
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from dashboard import aua
+from dashboard.data import DATA_DIR, FrozenList, freeze
+from dashboard.shared_cache import _FileLock
+
+logger = logging.getLogger(__name__)
+
+# Detector state (state.npz) and the flags raised so far (flags.npz)
+ANOMALY_DIR = os.environ.get("DASHBOARD_ANOMALY_DIR", os.path.join(DATA_DIR, "anomalies"))
+
+# Daily changes the rolling statistics cover, per series
+WINDOW = 60
+
+# Changes a series needs before it can be flagged
+MIN_HISTORY = 20
+
+# A day's change is flagged when its robust score, (change - median) /
+# (1.4826 x MAD) over the window, reaches this. On fat-tailed synthetic
+# series (tools/detect_anomalies.py --bench) it flags 0.03% of normal days
+# and finds about 90% of injected jumps of 5-20%.
+THRESHOLD = 12.0
+
+# Floor on the MAD so a series that has not moved at all is not flagged
+# for its first cent of change
+MIN_MAD = 1e-5
+
+# Flags kept, newest first
+MAX_FLAGS = 1000
+
+_MAD_SCALE = 1.4826
+
+
+class RollingState:
+    # Rolling statistics of the daily log change of every series, one row
+    # per series: a ring buffer of the last `window` changes with its
+    # running sum and sum of squares, so each day is an O(1) update per
+    # series, done for all series in one NumPy pass. Median and MAD are
+    # taken over the fixed-size buffer.
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.day = None  # last day applied, as datetime64[D]
+        self.series = []
+        self._rows = {}
+        self.last = np.empty(0)
+        self.buffer = np.empty((0, window))
+        self.position = np.empty(0, dtype=np.int64)
+        self.count = np.empty(0, dtype=np.int64)
+        self.total = np.empty(0)
+        self.total_sq = np.empty(0)
+
+    def _grow(self, names):
+        # Row index of every name, adding rows for series not seen before
+        rows = np.fromiter((self._rows.get(name, -1) for name in names), dtype=np.int64, count=len(names))
+        new = [name for name, row in zip(names, rows) if row < 0]
+        if new:
+            new = list(dict.fromkeys(new))
+            start = len(self.series)
+            self.series.extend(new)
+            self._rows.update((name, start + i) for i, name in enumerate(new))
+            extra = len(new)
+            self.last = np.concatenate([self.last, np.full(extra, np.nan)])
+            self.buffer = np.concatenate([self.buffer, np.full((extra, self.window), np.nan)])
+            self.position = np.concatenate([self.position, np.zeros(extra, dtype=np.int64)])
+            self.count = np.concatenate([self.count, np.zeros(extra, dtype=np.int64)])
+            self.total = np.concatenate([self.total, np.zeros(extra)])
+            self.total_sq = np.concatenate([self.total_sq, np.zeros(extra)])
+            rows = np.fromiter((self._rows[name] for name in names), dtype=np.int64, count=len(names))
+        return rows
+
+    def update(self, day, names, values):
+        # Apply one day: scores every series' change against its window
+        # before the change is added, and returns the flagged points as a
+        # dict of arrays
+        values = np.asarray(values, dtype=np.float64)
+        rows = self._grow(names)
+        previous = self.last[rows]
+        moved = (previous > 0) & (values > 0) & np.isfinite(values)
+        r = rows[moved]
+        change = np.log(values[moved] / previous[moved])
+
+        # Scores only for series with enough history
+        n = self.count[r]
+        scored = np.flatnonzero(n >= MIN_HISTORY)
+        window = self.buffer[r[scored]]
+        median = np.nanmedian(window, axis=1)
+        mad = np.maximum(np.nanmedian(np.abs(window - median[:, None]), axis=1), MIN_MAD)
+        score = np.full(len(r), np.nan)
+        score[scored] = (change[scored] - median) / (_MAD_SCALE * mad)
+        mean = self.total[r] / np.maximum(n, 1)
+        std = np.sqrt(np.maximum(self.total_sq[r] - n * mean**2, 0) / np.maximum(n - 1, 1))
+        # Shown next to the robust score only; undefined (NaN) without two
+        # changes or any spread, e.g. a series flat for its whole window
+        defined = (n >= 2) & (std > 0)
+        zscore = np.full(len(r), np.nan)
+        zscore[defined] = (change[defined] - mean[defined]) / std[defined]
+        # The robust score alone decides (NaN, i.e. too little history, is
+        # never flagged); MIN_MAD lets a jump off a flat window be flagged
+        flagged = np.abs(np.nan_to_num(score)) >= THRESHOLD
+
+        # Slide the window: the change replaces the oldest one
+        slot = self.position[r]
+        oldest = self.buffer[r, slot]
+        had = ~np.isnan(oldest)
+        oldest = np.where(had, oldest, 0.0)
+        self.total[r] += change - oldest
+        self.total_sq[r] += change**2 - oldest**2
+        self.count[r] += ~had
+        self.buffer[r, slot] = change
+        self.position[r] = (slot + 1) % self.window
+
+        present = np.isfinite(values) & (values > 0)
+        self.last[rows[present]] = values[present]
+        self.day = np.datetime64(day, "D")
+
+        hit = np.flatnonzero(flagged)
+        return {
+            "series": r[hit],
+            "value": values[moved][hit],
+            "previous": previous[moved][hit],
+            "change": change[hit],
+            "score": score[hit],
+            "zscore": zscore[hit],
+        }
+
+    def save(self, path):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-", suffix=".npz")
+        os.close(fd)
+        try:
+            np.savez(
+                tmp, day=np.array([self.day if self.day is not None else np.datetime64("NaT")], dtype="datetime64[D]"),
+                series=np.array(self.series, dtype=str), last=self.last, buffer=self.buffer,
+                position=self.position, count=self.count, total=self.total, total_sq=self.total_sq,
+            )
+            os.replace(tmp, path)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as saved:
+            state = cls(window=saved["buffer"].shape[1])
+            day = saved["day"][0]
+            state.day = None if np.isnat(day) else day
+            state.series = saved["series"].tolist()
+            state._rows = {name: i for i, name in enumerate(state.series)}
+            for name in ("last", "buffer", "position", "count", "total", "total_sq"):
+                setattr(state, name, saved[name])
+        return state
+
+
+def _days(table):
+    # (day, series names, values) for each day in a date-sorted table
+    if not table.num_rows:
+        return
+    dates = table.column("date").to_numpy()
+    series = table.column("series").to_numpy(zero_copy_only=False)
+    values = table.column("value").to_numpy(zero_copy_only=False)
+    bounds = np.concatenate([[0], np.flatnonzero(dates[1:] != dates[:-1]) + 1, [len(dates)]])
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        yield dates[start], series[start:stop], values[start:stop]
+
+
+class AnomalyDetector:
+    # Process-wide. refresh() applies every day the AUA store has past the
+    # saved state, so history is read once and each new day costs one
+    # vectorized update; state and flags are shared through ANOMALY_DIR.
+
+    def __init__(self, store=aua.store, directory=ANOMALY_DIR):
+        self.store = store
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._signature = None
+        self._flags = FrozenList()
+        self._summary = None
+
+    def _paths(self):
+        return os.path.join(self.directory, "state.npz"), os.path.join(self.directory, "flags.npz")
+
+    def _load(self):
+        state_path, flags_path = self._paths()
+        try:
+            state = RollingState.load(state_path)
+        except (OSError, ValueError, KeyError):
+            return RollingState(), None
+        try:
+            with np.load(flags_path) as saved:
+                flags = {name: saved[name] for name in saved.files}
+        except (OSError, ValueError):
+            flags = None
+        return state, flags
+
+    def _apply(self, state, flags):
+        # Every stored day after state.day, in order
+        start = None if state.day is None else (state.day + np.timedelta64(1, "D")).astype(object)
+        table = self.store.read(start=start)
+        found = []
+        for day, names, values in _days(table):
+            hit = state.update(day, names, values)
+            if len(hit["series"]):
+                hit["date"] = np.full(len(hit["series"]), day)
+                hit["series"] = np.array([state.series[i] for i in hit["series"]], dtype=str)
+                found.append(hit)
+        if found:
+            new = {name: np.concatenate([hit[name] for hit in found])[::-1] for name in found[0]}
+            if flags is not None:
+                new = {name: np.concatenate([new[name], flags[name]]) for name in new}
+            flags = {name: column[:MAX_FLAGS] for name, column in new.items()}
+        return table.num_rows, flags
+
+    def refresh(self):
+        # Returns (rows applied, seconds); a no-op while the store is unchanged
+        signature = self.store.signature()
+        if signature == self._signature:
+            return 0, 0.0
+        began = time.perf_counter()
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with _FileLock(os.path.join(self.directory, ".lock")):
+                state, flags = self._load()
+                applied, flags = self._apply(state, flags)
+                if applied:
+                    state_path, flags_path = self._paths()
+                    state.save(state_path)
+                    if flags is not None:
+                        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-", suffix=".npz")
+                        os.close(fd)
+                        np.savez(tmp, **flags)
+                        os.replace(tmp, flags_path)
+            self._publish(state, flags, signature)
+        seconds = time.perf_counter() - began
+        if applied:
+            logger.info("Applied %d AUA rows to the anomaly detector in %.2fs", applied, seconds)
+        return applied, seconds
+
+    def _publish(self, state, flags, signature):
+        rows = []
+        if flags is not None:
+            for i in range(len(flags["series"])):
+                rows.append({
+                    "date": str(flags["date"][i]),
+                    "series": str(flags["series"][i]),
+                    "value": float(flags["value"][i]),
+                    "previous": float(flags["previous"][i]),
+                    "change": float(np.expm1(flags["change"][i])),
+                    "score": round(float(flags["score"][i]), 2),
+                    "zscore": round(float(flags["zscore"][i]), 2) if np.isfinite(flags["zscore"][i]) else None,
+                })
+        result = freeze(rows)
+        result.data_version = f"anomalies:{signature}"
+        summary = freeze({
+            "series": len(state.series),
+            "through": None if state.day is None else str(state.day),
+            "window": state.window,
+            "threshold": THRESHOLD,
+        })
+        summary.data_version = result.data_version
+        self._flags, self._summary, self._signature = result, summary, signature
+
+    def flags(self):
+        self.refresh()
+        return self._flags
+
+    def summary(self):
+        self.refresh()
+        return self._summary
+
+
+detector = AnomalyDetector()
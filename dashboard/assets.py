@@ -0,0 +1,60 @@
+import html
+import json
+import os
+import re
+
+import streamlit as st
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(ROOT_DIR, "static")
+MANIFEST_PATH = os.path.join(STATIC_DIR, "manifest.json")
+
+# Streamlit serves <app dir>/static under this path when
+# server.enableStaticServing is on (see .streamlit/config.toml)
+STATIC_URL = "app/static"
+
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+@st.cache_resource(show_spinner=False)
+def _load_manifest(mtime_ns):
+    with open(MANIFEST_PATH) as f:
+        entries = json.load(f)
+    # Drop entries whose built file has gone missing so callers fall back
+    return {
+        name: entry for name, entry in entries.items()
+        if os.path.exists(os.path.join(STATIC_DIR, entry["file"]))
+    }
+
+
+def manifest():
+    # Written by tools/build_assets.py; reloaded when the file changes
+    try:
+        mtime_ns = os.stat(MANIFEST_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _load_manifest(mtime_ns)
+
+
+def asset_url(name):
+    entry = manifest().get(name)
+    if entry is None:
+        return None
+    # File names carry the content hash, so they can be cached forever.
+    # Tornado's static handler sends a far-future Cache-Control header
+    # whenever the request has a ?v= argument.
+    return f"{STATIC_URL}/{entry['file']}?v={entry['hash']}"
+
+
+def image_html(name, alt, placeholder=True):
+    url = asset_url(name)
+    if url is not None:
+        return f"<img src='{html.escape(url)}' alt='{html.escape(alt)}' style='width: 100%;'>"
+    if placeholder:
+        return f"<div class='asset-placeholder'>{html.escape(alt)}</div>"
+    return ""
@@ -0,0 +1,191 @@
+import hashlib
+import os
+import tempfile
+import threading
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from dashboard.data import DATA_DIR, FrozenDict, FrozenList
+from dashboard.downsample import lttb
+from dashboard.shared_cache import _FileLock
+
+# Daily AUA/AUM per series (a report line, plan or account), one Parquet
+# file per year (<year>.parquet) of (date, series, value) rows sorted by
+# date. The nightly load records each new day; readers open only the years
+# they ask for.
+AUA_DIR = os.environ.get("DASHBOARD_AUA_DIR", os.path.join(DATA_DIR, "aua"))
+
+# Rows are sorted by date, so small row groups let a date filter skip most
+# of a year's file
+ROW_GROUP_ROWS = 64 * 1024
+
+SCHEMA = pa.schema([("date", pa.date32()), ("series", pa.string()), ("value", pa.float64())])
+
+# Most points per series trend() returns; longer series are downsampled
+MAX_POINTS = 2000
+
+# Derived results (series names, downsampled trends) kept per store version
+MAX_DERIVED = 64
+
+# Period each value of a trend() stands for: every day, or the last value
+# of each month or quarter
+FREQUENCIES = ("D", "M", "Q")
+
+
+class AuaStore:
+
+    def __init__(self, directory=AUA_DIR):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._derived = {}
+
+    def _path(self, year):
+        return os.path.join(self.directory, f"{year}.parquet")
+
+    def years(self):
+        try:
+            filenames = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return sorted(int(f[:-8]) for f in filenames if f.endswith(".parquet") and f[:-8].isdigit())
+
+    def signature(self):
+        # Changes whenever a day is recorded
+        signature = []
+        for year in self.years():
+            try:
+                stat = os.stat(self._path(year))
+            except FileNotFoundError:
+                continue
+            signature.append((year, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def read(self, start=None, end=None, series=None):
+        # Rows with start <= date <= end (either may be None), optionally
+        # only the named series, in date order
+        filters = []
+        if start is not None:
+            filters.append(("date", ">=", start))
+        if end is not None:
+            filters.append(("date", "<=", end))
+        if series is not None:
+            filters.append(("series", "in", list(series)))
+        tables = [
+            pq.read_table(self._path(year), filters=filters or None, schema=SCHEMA)
+            for year in self.years()
+            if (start is None or year >= start.year) and (end is None or year <= end.year)
+        ]
+        if not tables:
+            return SCHEMA.empty_table()
+        return pa.concat_tables(tables)
+
+    def last_date(self):
+        years = self.years()
+        if not years:
+            return None
+        dates = pq.read_table(self._path(years[-1]), columns=["date"]).column("date")
+        return pc.max(dates).as_py() if len(dates) else None
+
+    def _remember(self, key, value):
+        while len(self._derived) >= MAX_DERIVED:
+            self._derived.pop(next(iter(self._derived)))
+        self._derived[key] = value
+        return value
+
+    def date_range(self):
+        # (first, last) recorded date, or (None, None) for an empty store
+        years = self.years()
+        if not years:
+            return None, None
+        key = ("range", self.signature())
+        if key not in self._derived:
+            first = pc.min(pq.read_table(self._path(years[0]), columns=["date"]).column("date")).as_py()
+            self._remember(key, (first, self.last_date()))
+        return self._derived[key]
+
+    def series_names(self):
+        # Every series in the latest year, sorted
+        years = self.years()
+        if not years:
+            return []
+        key = ("series", self.signature())
+        if key not in self._derived:
+            names = pc.unique(pq.read_table(self._path(years[-1]), columns=["series"]).column("series"))
+            self._remember(key, sorted(names.to_pylist()))
+        return self._derived[key]
+
+    def trend(self, series, start=None, end=None, frequency="D", points=MAX_POINTS):
+        # {"series": {name: {"x": dates, "y": values}}, "rows": values read,
+        # "shown": points returned}. Each series is reduced to its period-end
+        # values for "M"/"Q" and then, if still longer than `points`,
+        # downsampled with LTTB; narrowing start/end gives finer detail.
+        signature = self.signature()
+        key = ("trend", signature, tuple(series), start, end, frequency, points)
+        cached = self._derived.get(key)
+        if cached is not None:
+            return cached
+
+        table = self.read(start, end, series)
+        names = table.column("series").combine_chunks().dictionary_encode()
+        codes = names.indices.to_numpy(zero_copy_only=False)
+        dates = table.column("date").to_numpy()
+        values = table.column("value").to_numpy(zero_copy_only=False)
+        # Rows are in date order; a stable sort groups them by series
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(names.dictionary) + 1))
+        found = {}
+        for code, name in enumerate(names.dictionary.to_pylist()):
+            rows = order[bounds[code]:bounds[code + 1]]
+            x, y = dates[rows], values[rows]
+            if frequency != "D":
+                period = x.astype("datetime64[M]").astype(np.int64)
+                if frequency == "Q":
+                    period //= 3
+                last = np.append(period[1:] != period[:-1], True)
+                x, y = x[last], y[last]
+            kept = lttb(x.astype(np.int64), y, points)
+            found[name] = FrozenDict(x=FrozenList(np.datetime_as_string(x[kept]).tolist()), y=FrozenList(y[kept].tolist()))
+        result = FrozenDict(
+            series=FrozenDict((name, found[name]) for name in series if name in found),
+            rows=table.num_rows,
+            shown=sum(len(trace["x"]) for trace in found.values()),
+        )
+        result.data_version = "aua:" + hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return self._remember(key, result)
+
+    def record(self, day, series, values):
+        # Store one day's values; recording the same date again replaces it
+        rows = pa.table(
+            [pa.array(np.full(len(series), np.datetime64(day, "D"))), pa.array(series, pa.string()), pa.array(values, pa.float64())],
+            schema=SCHEMA,
+        )
+        self.record_table(rows)
+
+    def record_table(self, rows):
+        # Store rows of any number of days, replacing the days they cover
+        os.makedirs(self.directory, exist_ok=True)
+        rows = rows.cast(SCHEMA)
+        years = pc.year(rows.column("date"))
+        with self._lock, _FileLock(os.path.join(self.directory, ".lock")):
+            for year in pc.unique(years).to_pylist():
+                new = rows.filter(pc.equal(years, year))
+                path = self._path(year)
+                if os.path.exists(path):
+                    existing = pq.read_table(path, schema=SCHEMA)
+                    keep = pc.invert(pc.is_in(existing.column("date"), pc.unique(new.column("date"))))
+                    new = pa.concat_tables([existing.filter(keep), new])
+                new = new.sort_by([("date", "ascending"), ("series", "ascending")])
+                fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+                os.close(fd)
+                try:
+                    pq.write_table(new, tmp, row_group_size=ROW_GROUP_ROWS)
+                    os.replace(tmp, path)
+                except BaseException:
+                    os.remove(tmp)
+                    raise
+
+
+store = AuaStore()
@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+import threading
+
+from dashboard import metrics
+
+# Dashboard content lives in JSON files under data/ (override with
+# DASHBOARD_DATA_DIR) so a status update is a file edit, not a redeploy
+DATA_DIR = os.environ.get(
+    "DASHBOARD_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data"),
+)
+
+DATASETS = {
+    "project_status_data": "project_status.json",
+    "phase_completion": "phase_completion.json",
+    "challenges": "challenges.json",
+    "achievements": "achievements.json",
+    "ai_ml_roadmap_phases": "ai_ml_roadmap_phases.json",
+    "strategic_recommendations": "strategic_recommendations.json",
+    "team_allocation": "team_allocation.json",
+    "investment_data": "investment_data.json",
+    "risk_data": "risk_data.json",
+    "success_metrics": "success_metrics.json",
+    "timeline_data": "timeline.json",
+    "kpis": "kpis.json",
+    "meta": "meta.json",
+}
+
+
+class FrozenDict(dict):
+    # Read-only dict; still a dict for json, pandas and plotly
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("dashboard data is read-only")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(tuple):
+    pass
+
+
+def freeze(value):
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+class _Entry:
+    __slots__ = ("signature", "version", "value")
+
+    def __init__(self, signature, version, value):
+        self.signature = signature
+        self.version = version
+        self.value = value
+
+
+class DataStore:
+    # Process-wide, so every session shares one parsed copy per file
+
+    def __init__(self, data_dir, datasets):
+        self.data_dir = data_dir
+        self.datasets = datasets
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _path(self, name):
+        return os.path.join(self.data_dir, self.datasets[name])
+
+    def get(self, name):
+        return self._entry(name).value
+
+    def version(self, name):
+        return self._entry(name).version
+
+    def _entry(self, name):
+        path = self._path(name)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(name)
+        if entry is not None and entry.signature == signature:
+            metrics.CACHE_REQUESTS.inc(cache="dataset", result="hit")
+            return entry
+
+        metrics.CACHE_REQUESTS.inc(cache="dataset", result="miss")
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None and entry.signature == signature:
+                return entry
+
+            with open(path, "rb") as f:
+                raw = f.read()
+            version = hashlib.sha1(raw).hexdigest()
+
+            # A touched but unchanged file keeps its parsed value
+            if entry is not None and entry.version == version:
+                entry = _Entry(signature, version, entry.value)
+            else:
+                value = freeze(json.loads(raw))
+                # Lets data_version() skip re-hashing the whole value
+                value.data_version = version
+                entry = _Entry(signature, version, value)
+
+            self._entries[name] = entry
+            return entry
+
+    def versions(self):
+        return {name: self.version(name) for name in self.datasets}
+
+
+store = DataStore(DATA_DIR, DATASETS)
+
+
+def load_dataset(name):
+    return store.get(name)
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+
+from dashboard import activity_log
+from dashboard.data import freeze
+from dashboard.hashing import data_version
+
+# Keys are spread over this many buckets. Two snapshots are compared bucket
+# digest by bucket digest and only differing buckets are opened, so a diff
+# costs O(BUCKETS + changed buckets x bucket size), not O(dataset size).
+BUCKETS = 64
+
+# Digests are computed once per snapshot (data version) and kept here
+DIGEST_CACHE_SIZE = 128
+
+
+def _digest(value):
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).digest()
+
+
+class KeyedDigest:
+    __slots__ = ("root", "buckets", "members")
+
+    def __init__(self, items):
+        # items: {key: value}
+        members = [{} for _ in range(BUCKETS)]
+        for key, value in items.items():
+            members[_digest(key)[0] % BUCKETS][key] = (_digest([key, value]), value)
+        self.members = members
+        self.buckets = [
+            hashlib.sha1(b"".join(sorted(entry for entry, _ in bucket.values()))).digest()
+            for bucket in members
+        ]
+        self.root = hashlib.sha1(b"".join(self.buckets)).digest()
+
+    def changes(self, other):
+        # (key, before value or None, after value or None) for every key
+        # added, removed or changed from self to other
+        if self.root == other.root:
+            return []
+        changed = []
+        for index, (mine, theirs) in enumerate(zip(self.buckets, other.buckets)):
+            if mine == theirs:
+                continue
+            before, after = self.members[index], other.members[index]
+            for key in before.keys() | after.keys():
+                old, new = before.get(key), after.get(key)
+                if old is None or new is None or old[0] != new[0]:
+                    changed.append((key, old and old[1], new and new[1]))
+        return sorted(changed, key=lambda change: str(change[0]))
+
+
+# How each tracked dataset is keyed for diffing
+KEYS = {
+    "phase_completion": lambda value: dict(value),
+    "project_status_data": lambda value: dict(value),
+    "risk_data": lambda value: {
+        risk["Risk"]: {"Impact": risk["Impact"], "Likelihood": risk["Likelihood"]} for risk in value
+    },
+}
+
+
+class _DigestCache:
+    def __init__(self, size=DIGEST_CACHE_SIZE):
+        self.size = size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name, value):
+        key = (name, data_version(value))
+        with self._lock:
+            digest = self._items.get(key)
+            if digest is not None:
+                self._items.move_to_end(key)
+                return digest
+        digest = KeyedDigest(KEYS[name](value))
+        with self._lock:
+            self._items[key] = digest
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+        return digest
+
+
+digests = _DigestCache()
+
+
+def diff_snapshots(before, after, since=None, until=None):
+    # before/after: {dataset name: value} for the tracked datasets. since
+    # and until bound the activities counted as new: logged after `since`,
+    # up to and including `until`.
+    changes = {name: digests.get(name, before[name]).changes(digests.get(name, after[name])) for name in KEYS}
+
+    risks_added, risks_removed, risks_rerated = [], [], []
+    for risk, old, new in changes["risk_data"]:
+        if old is None:
+            risks_added.append(dict(new, Risk=risk))
+        elif new is None:
+            risks_removed.append(dict(old, Risk=risk))
+        else:
+            risks_rerated.append({"risk": risk, "before": old, "after": new})
+
+    activities = []
+    if since is not None:
+        log = activity_log.log
+        activities = [
+            {"date": activity_log.display_date(entry["date"]), "activity": entry["activity"]}
+            for entry in reversed(log.read(log.matching(since + timedelta(days=1), until)))
+        ]
+
+    delta = freeze({
+        "since": since.isoformat() if since else None,
+        "until": until.isoformat() if until else None,
+        "phases": [{"phase": key, "before": old, "after": new} for key, old, new in changes["phase_completion"]],
+        "statuses": [{"area": key, "before": old, "after": new} for key, old, new in changes["project_status_data"]],
+        "risks_added": risks_added,
+        "risks_removed": risks_removed,
+        "risks_rerated": risks_rerated,
+        "activities": activities,
+    })
+    # Identifies the delta without hashing it, for the rendered card's cache
+    delta.data_version = data_version([
+        [data_version(before[name]), data_version(after[name])] for name in KEYS
+    ] + [delta["since"], delta["until"], activity_log.log.version()])
+    return delta
+
+
+def is_empty(delta):
+    return not any(delta[key] for key in ("phases", "statuses", "risks_added", "risks_removed", "risks_rerated", "activities"))
@@ -0,0 +1,451 @@
+import hashlib
+import inspect
+import json
+import logging
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+from dashboard import metrics
+from dashboard.data import FrozenDict, FrozenList
+from dashboard.hashing import data_version
+from dashboard.shared_cache import cached_call
+
+try:
+    import orjson  # plotly.io also picks it up as a JSON engine
+    JSON_ENGINE = "orjson"
+except ImportError:
+    orjson = None
+    JSON_ENGINE = "json"
+
+logger = logging.getLogger(__name__)
+
+# The chart config st.plotly_chart sends by default (Streamlit 1.65)
+PLOTLY_CONFIG_JSON = "{}"
+# plotly.js's height for figures that do not set one
+PLOTLY_DEFAULT_HEIGHT = 450
+
+# Streamlit releases (major, minor) on which render_figure sends the cached
+# JSON straight to the element queue; every other release gets
+# st.plotly_chart. Verified on 1.65.0 with tools/check_figure_path.py, which
+# compares the element against what st.plotly_chart sends; run it before
+# widening the range.
+DIRECT_CHART_VERSIONS = ((1, 65), (1, 65))
+
+
+def _streamlit_version():
+    return tuple(int(re.match(r"\d*", part).group() or 0) for part in st.__version__.split(".")[:2])
+
+
+_direct_charts = DIRECT_CHART_VERSIONS[0] <= _streamlit_version() <= DIRECT_CHART_VERSIONS[1]
+_plotly_chart_takes_key = "key" in inspect.signature(st.plotly_chart).parameters
+
+
+def build_phase_completion_figure(phase_completion):
+    # Create a horizontal bar chart
+    fig = go.Figure()
+
+    for phase, completion in phase_completion.items():
+        fig.add_trace(go.Bar(
+            y=[phase],
+            x=[completion],
+            orientation='h',
+            marker=dict(
+                color=px.colors.sequential.Blues[int(completion/20)],
+                line=dict(color='rgb(8,48,107)', width=1)
+            ),
+            text=[f"{completion}%"],
+            textposition='auto',
+            name=phase
+        ))
+
+    fig.update_layout(
+        height=300,
+        margin=dict(l=0, r=0, t=10, b=0),
+        xaxis=dict(
+            title='Completion Percentage',
+            range=[0, 100]
+        ),
+        yaxis=dict(
+            title=None,
+            autorange="reversed"
+        )
+    )
+    return fig
+
+
+RISK_LEVELS = ["Low", "Medium", "High"]
+
+# Above this many markers the risk scatter is drawn with WebGL
+SCATTERGL_THRESHOLD = 500
+
+# Longest list of risk names shown in a single hover label
+MAX_HOVER_RISKS = 10
+
+
+def risk_matrix_cells(risk_data):
+    # One row per occupied impact/likelihood cell with the register numbers
+    # (1-based, matching the risk table) and names of the risks in it
+    risk_df = pd.DataFrame(risk_data, columns=["Risk", "Impact", "Likelihood"])
+    risk_df["Number"] = np.arange(1, len(risk_df) + 1)
+    cells = risk_df.groupby(["Impact", "Likelihood"], sort=False).agg(
+        Count=("Risk", "size"),
+        Numbers=("Number", list),
+        Risks=("Risk", list),
+    ).reset_index()
+    return cells.sort_values("Count", ascending=False, kind="stable").reset_index(drop=True)
+
+
+def _risk_hover(impact, likelihood, numbers, risks):
+    lines = [f"Impact: {impact} | Likelihood: {likelihood}"]
+    lines += [f"{number}. {risk}" for number, risk in zip(numbers[:MAX_HOVER_RISKS], risks[:MAX_HOVER_RISKS])]
+    if len(risks) > MAX_HOVER_RISKS:
+        lines.append(f"...and {len(risks) - MAX_HOVER_RISKS} more")
+    return "<br>".join(lines)
+
+
+def _risk_scatter(n_points, **kwargs):
+    scatter = go.Scattergl if n_points > SCATTERGL_THRESHOLD else go.Scatter
+    return scatter(**kwargs)
+
+
+def build_risk_matrix_figure(risk_data, group_overlaps=True):
+    level_index = {level: i for i, level in enumerate(RISK_LEVELS)}
+
+    # Create a risk matrix
+    fig = go.Figure()
+
+    # Add a heatmap for the background
+    fig.add_trace(go.Heatmap(
+        z=[[1, 2, 3], [2, 4, 6], [3, 6, 9]],
+        x=[0, 1, 2],
+        y=[0, 1, 2],
+        colorscale=[
+            [0, 'rgb(220, 250, 220)'],
+            [3/9, 'rgb(255, 255, 200)'],
+            [6/9, 'rgb(255, 200, 200)'],
+            [1, 'rgb(250, 150, 150)']
+        ],
+        showscale=False,
+        hoverinfo='skip'
+    ))
+
+    # All risks go into a single scatter trace
+    if group_overlaps:
+        # Risks sharing a cell collapse into one marker labelled with the count
+        cells = risk_matrix_cells(risk_data)
+        x = cells["Likelihood"].map(level_index).to_numpy()
+        y = cells["Impact"].map(level_index).to_numpy()
+        counts = cells["Count"].to_numpy()
+        text = [str(numbers[0]) if count == 1 else f"×{count}" for numbers, count in zip(cells["Numbers"], counts)]
+        hover = [_risk_hover(*row) for row in zip(cells["Impact"], cells["Likelihood"], cells["Numbers"], cells["Risks"])]
+        sizes = np.minimum(20 + 8 * np.sqrt(counts - 1), 60)
+    else:
+        # Every risk gets its own marker, spread on a deterministic spiral
+        # inside its cell so overlapping risks stay visible
+        risk_df = pd.DataFrame(risk_data, columns=["Risk", "Impact", "Likelihood"])
+        slot = risk_df.groupby(["Impact", "Likelihood"], sort=False).cumcount().to_numpy()
+        radius = 0.35 * np.sqrt(slot / np.maximum(slot.max(initial=0), 1))
+        angle = slot * 2.399963  # golden angle
+        x = risk_df["Likelihood"].map(level_index).to_numpy() + radius * np.cos(angle)
+        y = risk_df["Impact"].map(level_index).to_numpy() + radius * np.sin(angle)
+        numbers = np.arange(1, len(risk_df) + 1)
+        text = numbers.astype(str)
+        hover = [f"{number}. {risk}" for number, risk in zip(numbers, risk_df["Risk"])]
+        sizes = 20 if len(risk_df) <= 50 else 10
+
+    fig.add_trace(_risk_scatter(
+        len(x),
+        x=x,
+        y=y,
+        mode='markers+text',
+        marker=dict(
+            size=sizes,
+            color='rgba(50, 50, 200, 0.7)'
+        ),
+        text=text,
+        textposition="middle center",
+        textfont=dict(color='white'),
+        hovertext=hover,
+        hoverinfo='text',
+        showlegend=False
+    ))
+
+    fig.update_layout(
+        height=400,
+        margin=dict(l=0, r=0, t=20, b=0),
+        xaxis=dict(
+            title='Likelihood',
+            tickvals=[0, 1, 2],
+            ticktext=RISK_LEVELS,
+            range=[-0.5, 2.5]
+        ),
+        yaxis=dict(
+            title='Impact',
+            tickvals=[0, 1, 2],
+            ticktext=RISK_LEVELS,
+            range=[-0.5, 2.5]
+        )
+    )
+    return fig
+
+
+def build_timeline_figure(timeline_data, current_date="2025-03-07"):
+    fig = go.Figure()
+
+    for item in timeline_data:
+        fig.add_trace(go.Bar(
+            name=item["Phase"],
+            y=[item["Phase"]],
+            x=[(datetime.strptime(item["End"], '%Y-%m-%d') - datetime.strptime(item["Start"], '%Y-%m-%d')).days],
+            orientation='h',
+            marker=dict(color=item["Color"]),
+            base=[(datetime.strptime(item["Start"], '%Y-%m-%d') - datetime.strptime("2025-04-01", '%Y-%m-%d')).days],
+            hovertemplate=f"{item['Phase']}<br>Start: {item['Start']}<br>End: {item['End']}<extra></extra>"
+        ))
+
+    # Add a line for current date
+    current = datetime.strptime(current_date, '%Y-%m-%d')
+    fig.add_vline(x=(current - datetime.strptime("2025-04-01", '%Y-%m-%d')).days,
+                  line_dash="dash", line_color="red",
+                  annotation_text=f"Current Date: {current:%B} {current.day}, {current.year}")
+
+    fig.update_layout(
+        height=200,
+        barmode='overlay',
+        xaxis=dict(
+            title="Days from April 1, 2025",
+            tickvals=[0, 91, 183, 274, 365, 456],
+            ticktext=["Apr 2025", "Jul 2025", "Oct 2025", "Jan 2026", "Apr 2026", "Jul 2026"]
+        ),
+        yaxis=dict(
+            title=None
+        ),
+        margin=dict(l=0, r=0, t=10, b=0),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.3,
+            xanchor="center",
+            x=0.5
+        )
+    )
+    return fig
+
+
+def build_burnup_figure(burnup):
+    # Completed scope (sum of phase percentages, in phases) against total
+    # scope over the recorded snapshots; per-phase lines start hidden
+    dates = list(burnup["dates"])
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=dates, y=list(burnup["scope"]), name="Total scope",
+        mode="lines", line=dict(color="#E45F9D", dash="dash", shape="hv"),
+    ))
+    fig.add_trace(go.Scatter(
+        x=dates, y=list(burnup["completed"]), name="Completed",
+        mode="lines+markers", line=dict(color="#8DD3C7", width=3), fill="tozeroy",
+    ))
+    for phase, values in burnup["phases"].items():
+        fig.add_trace(go.Scatter(
+            x=dates, y=[None if v is None else v / 100 for v in values], name=phase,
+            mode="lines", visible="legendonly",
+            hovertemplate=f"{phase}<br>%{{x}}: %{{customdata}}%<extra></extra>",
+            customdata=list(values),
+        ))
+
+    fig.update_layout(
+        height=350,
+        yaxis=dict(title="Phases", rangemode="tozero"),
+        xaxis=dict(title=None),
+        margin=dict(l=0, r=0, t=10, b=0),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+        hovermode="x unified",
+    )
+    return fig
+
+
+def build_risk_exposure_figure(summary):
+    # Portfolio roll-up: number of open risks per impact/likelihood cell
+    # across every project, keyed "Impact|Likelihood"
+    exposure = summary["risk_exposure"]
+    z = [[exposure.get(f"{impact}|{likelihood}", 0) for likelihood in RISK_LEVELS] for impact in RISK_LEVELS]
+    fig = go.Figure(go.Heatmap(
+        z=z, x=RISK_LEVELS, y=RISK_LEVELS,
+        text=z, texttemplate="%{text}",
+        colorscale=[[0, 'rgb(220, 250, 220)'], [0.5, 'rgb(255, 255, 200)'], [1, 'rgb(250, 150, 150)']],
+        showscale=False,
+        hovertemplate="Impact: %{y} | Likelihood: %{x}<br>%{z} risks<extra></extra>",
+    ))
+    fig.update_layout(
+        height=350,
+        xaxis=dict(title="Likelihood"),
+        yaxis=dict(title="Impact"),
+        margin=dict(l=0, r=0, t=10, b=0),
+    )
+    return fig
+
+
+def build_aua_trend_figure(chart):
+    # chart: {"trend": AuaStore.trend(...), "flags": anomaly flags in range}.
+    # WebGL traces throughout: a trace carries up to aua.MAX_POINTS points.
+    fig = go.Figure()
+    for name, trace in chart["trend"]["series"].items():
+        fig.add_trace(go.Scattergl(
+            x=list(trace["x"]), y=list(trace["y"]), name=name, mode="lines",
+            hovertemplate=f"{name}<br>%{{x}}: $%{{y:,.0f}}<extra></extra>",
+        ))
+    flags = chart["flags"]
+    if flags:
+        fig.add_trace(go.Scattergl(
+            x=[flag["date"] for flag in flags], y=[flag["value"] for flag in flags], name="Flagged",
+            mode="markers", marker=dict(color="#E45F9D", size=10, symbol="x"),
+            customdata=[[flag["series"], flag["change"], flag["score"]] for flag in flags],
+            hovertemplate="%{customdata[0]}<br>%{x}: %{customdata[1]:+.2%} (score %{customdata[2]:+.1f})<extra></extra>",
+        ))
+    fig.update_layout(
+        height=400,
+        yaxis=dict(title="AUA", tickprefix="$", rangemode="tozero"),
+        xaxis=dict(title=None),
+        margin=dict(l=0, r=0, t=10, b=0),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+    )
+    return fig
+
+
+FIGURE_BUILDERS = {
+    "phase_completion": build_phase_completion_figure,
+    "risk_matrix": build_risk_matrix_figure,
+    "timeline": build_timeline_figure,
+    "burnup": build_burnup_figure,
+    "risk_exposure": build_risk_exposure_figure,
+    "aua_trend": build_aua_trend_figure,
+}
+
+
+# cache_resource is process-wide, so every session shares one figure per
+# (name, data version). The data itself is not hashed by Streamlit (leading
+# underscore); the explicit version string is the cache key.
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _cached_figure(name, version, options, _data):
+    metrics.record_miss()
+    with metrics.FIGURE_BUILD_SECONDS.time(figure=name):
+        # Another process on this host may already have built it
+        return cached_call(FIGURE_BUILDERS[name], (version, options), _data, **dict(options))
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _cached_risk_matrix_cells(version, _risk_data):
+    metrics.record_miss()
+    cells = FrozenList(
+        FrozenDict(Impact=cell.Impact, Likelihood=cell.Likelihood, Count=int(cell.Count),
+                   Numbers=FrozenList(int(n) for n in cell.Numbers), Risks=FrozenList(cell.Risks))
+        for cell in risk_matrix_cells(_risk_data).itertuples()
+    )
+    for i, cell in enumerate(cells):
+        cell.data_version = f"risk_cell:{version}:{i}"
+    return cells
+
+
+def get_risk_matrix_cells(risk_data):
+    # risk_matrix_cells as read-only rows, grouped once per data version
+    with metrics.cache_lookup("risk_cells"):
+        return _cached_risk_matrix_cells(data_version(risk_data), risk_data)
+
+
+def get_figure(name, data, **options):
+    # Builder options (e.g. group_overlaps) are part of the cache key
+    with metrics.cache_lookup("figure"):
+        return _cached_figure(name, data_version(data), tuple(sorted(options.items())), data)
+
+
+def figure_json(fig):
+    # The figure was validated when it was built; skip doing it again
+    return pio.to_json(fig, validate=False, engine=JSON_ENGINE)
+
+
+def _build_figure_json(name, data, options):
+    fig = get_figure(name, data, **dict(options))
+    # Height travels with the JSON: newer Streamlit sizes charts from it
+    return figure_json(fig), fig.layout.height or PLOTLY_DEFAULT_HEIGHT
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _cached_figure_json(name, version, options, _data):
+    metrics.record_miss()
+    with metrics.FIGURE_BUILD_SECONDS.time(figure=f"{name}.json"):
+        return cached_call(_build_figure_json, (name, version, options), name, _data, options)
+
+
+def _figure_json(name, data, options):
+    key = tuple(sorted(options.items()))
+    version = data_version(data)
+    with metrics.cache_lookup("figure_json"):
+        spec, height = _cached_figure_json(name, version, key, data)
+    return spec, height, hashlib.sha1(repr((name, version, key)).encode("utf-8")).hexdigest()
+
+
+def get_figure_json(name, data, **options):
+    return _figure_json(name, data, options)[0]
+
+
+def _enqueue_plotly_json(spec, height, element_id, use_container_width):
+    # st.plotly_chart rebuilds a go.Figure from whatever it is given (full
+    # validation) and encodes it again, on every rerun. Send the cached JSON
+    # as the chart element directly instead. This uses Streamlit internals,
+    # so only on the versions it was checked against; False (and off for the
+    # rest of the process if it failed) when the caller should fall back.
+    global _direct_charts
+    if not _direct_charts:
+        return False
+    try:
+        from streamlit.elements.lib.layout_utils import LayoutConfig
+        from streamlit.proto.PlotlyChart_pb2 import PlotlyChart
+
+        proto = PlotlyChart()
+        proto.spec = spec
+        proto.config = PLOTLY_CONFIG_JSON
+        proto.theme = "streamlit"
+        # The frontend keeps per-chart state (zoom, pan) under this id
+        proto.id = element_id
+        # _enqueue resolves the active container (columns, tabs, expanders)
+        width = "stretch" if use_container_width else "content"
+        st._main._enqueue("plotly_chart", proto, layout_config=LayoutConfig(width=width, height=height))
+    except Exception:
+        logger.warning("Sending charts directly failed; using st.plotly_chart from now on", exc_info=True)
+        _direct_charts = False
+        return False
+    return True
+
+
+def render_figure(name, data, use_container_width=True, key=None, **options):
+    # Drop-in for st.plotly_chart(get_figure(...)): the figure is encoded
+    # once per data version instead of once per rerun. The element id adds
+    # the call site, or `key` where one call site draws the same chart more
+    # than once, so a chart repeated on a page does not share its id (and
+    # its zoom state) with the other copy.
+    spec, height, content_id = _figure_json(name, data, options)
+    if key is None:
+        caller = inspect.currentframe().f_back
+        key = f"{caller.f_code.co_filename}:{caller.f_lineno}"
+    element_id = f"{content_id}-{hashlib.sha1(str(key).encode('utf-8')).hexdigest()[:12]}"
+    if not _enqueue_plotly_json(spec, height, f"$$ID-{element_id}", use_container_width):
+        # Still skips rebuilding the figure: plotly_chart takes the cached JSON
+        figure = orjson.loads(spec) if orjson is not None else json.loads(spec)
+        if _plotly_chart_takes_key:
+            st.plotly_chart(figure, use_container_width=use_container_width, key=f"figure-{element_id}")
+        else:
+            st.plotly_chart(figure, use_container_width=use_container_width)
+
+
+def invalidate_figures():
+    # Drop every cached figure, e.g. after the underlying data is edited
+    _cached_figure.clear()
+    _cached_figure_json.clear()
+    _cached_risk_matrix_cells.clear()
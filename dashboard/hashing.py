@@ -0,0 +1,12 @@
+import hashlib
+import json
+
+
+def data_version(data):
+    # Stable hash of a JSON-like value; a new version means new derived artifacts.
+    # Values loaded by the data store already carry their file's content hash.
+    version = getattr(data, "data_version", None)
+    if version is not None:
+        return version
+    payload = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
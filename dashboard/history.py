@@ -0,0 +1,318 @@
+import os
+import tempfile
+import threading
+from datetime import date
+
+import numpy as np
+import streamlit as st
+
+from dashboard.data import DATA_DIR, FrozenDict, freeze, load_dataset
+from dashboard.shared_cache import _FileLock
+
+# Weekly snapshots of the tracked datasets, one Arrow IPC file per dataset
+# and year (<dataset>/<year>.arrow), rows sorted by snapshot_date. Files are
+# uncompressed so reads are zero-copy views of a memory map; recording a
+# snapshot rewrites only the current year's file.
+HISTORY_DIR = os.environ.get("DASHBOARD_HISTORY_DIR", os.path.join(DATA_DIR, "history"))
+
+# Derived results (snapshot dates, burn-up series) kept, least recently
+# used dropped first; keys include file signatures, so every recorded
+# snapshot leaves older entries behind
+MAX_DERIVED = 64
+
+
+def display_date(day):
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+def current_as_of():
+    # Date the live data describes, from data/meta.json
+    return date.fromisoformat(load_dataset("meta")["as_of"])
+
+
+def _numpy(column):
+    # date32 comes back as datetime64[D]
+    return column.combine_chunks().to_numpy(zero_copy_only=False)
+
+
+def _number(value):
+    if value is None:
+        return None
+    return int(value) if float(value).is_integer() else float(value)
+
+
+class MappingCodec:
+    # {key: value} <-> rows of (snapshot_date, key, value)
+
+    def __init__(self, value_type):
+        self.value_type = value_type
+
+    def schema(self):
+        import pyarrow as pa
+
+        return pa.schema([("snapshot_date", pa.date32()), ("key", pa.string()), ("value", getattr(pa, self.value_type)())])
+
+    def encode(self, day, value):
+        import pyarrow as pa
+
+        keys = list(value)
+        return pa.table(
+            [pa.array([day] * len(keys), pa.date32()), pa.array(keys, pa.string()),
+             pa.array([value[key] for key in keys], getattr(pa, self.value_type)())],
+            schema=self.schema(),
+        )
+
+    def decode(self, table):
+        values = table.column("value").to_pylist()
+        if self.value_type == "float64":
+            values = [_number(value) for value in values]
+        return dict(zip(table.column("key").to_pylist(), values))
+
+
+class RecordsCodec:
+    # [{field: str, ...}, ...] <-> rows of (snapshot_date, position, fields...)
+
+    def __init__(self, fields):
+        self.fields = fields
+
+    def schema(self):
+        import pyarrow as pa
+
+        return pa.schema(
+            [("snapshot_date", pa.date32()), ("position", pa.int32())]
+            + [(field, pa.string()) for field in self.fields]
+        )
+
+    def encode(self, day, value):
+        import pyarrow as pa
+
+        columns = [pa.array([day] * len(value), pa.date32()), pa.array(range(len(value)), pa.int32())]
+        columns += [pa.array([item.get(field) for item in value], pa.string()) for field in self.fields]
+        return pa.table(columns, schema=self.schema())
+
+    def decode(self, table):
+        rows = table.sort_by("position").select(list(self.fields)).to_pylist()
+        return rows
+
+
+TRACKED = {
+    "project_status_data": MappingCodec("string"),
+    "phase_completion": MappingCodec("float64"),
+    "risk_data": RecordsCodec(("Risk", "Impact", "Likelihood")),
+}
+
+
+class _Segment:
+    __slots__ = ("signature", "table", "dates")
+
+    def __init__(self, signature, table, dates):
+        self.signature = signature
+        self.table = table
+        self.dates = dates
+
+
+class HistoryStore:
+    # Process-wide; segments are re-mapped when their file changes
+
+    def __init__(self, directory, tracked=TRACKED):
+        self.directory = directory
+        self.tracked = tracked
+        self._segments = {}
+        self._derived = {}
+        self._lock = threading.Lock()
+
+    def _dir(self, name):
+        return os.path.join(self.directory, name)
+
+    def years(self, name):
+        try:
+            filenames = os.listdir(self._dir(name))
+        except FileNotFoundError:
+            return []
+        return sorted(int(f[:-6]) for f in filenames if f.endswith(".arrow") and f[:-6].isdigit())
+
+    def _segment(self, name, year):
+        import pyarrow as pa
+
+        path = os.path.join(self._dir(name), f"{year}.arrow")
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        key = (name, year)
+        segment = self._segments.get(key)
+        if segment is not None and segment.signature == signature:
+            return segment
+        with pa.memory_map(path) as source:
+            table = pa.ipc.open_file(source).read_all()
+        dates = _numpy(table.column("snapshot_date"))
+        segment = self._segments[key] = _Segment(signature, table, dates)
+        return segment
+
+    def signature(self, name):
+        return tuple(
+            (year, self._segment(name, year).signature) for year in self.years(name)
+        )
+
+    def dates(self, name=None):
+        # Every recorded snapshot date, of one dataset or of any
+        names = [name] if name else list(self.tracked)
+        key = ("dates", tuple((n, self.signature(n)) for n in names))
+        cached = self._recall(key)
+        if cached is not None:
+            return cached
+        found = set()
+        for n in names:
+            for year in self.years(n):
+                found.update(np.unique(self._segment(n, year).dates).tolist())
+        return self._remember(key, sorted(found))
+
+    def get(self, name, as_of):
+        # Value of `name` in the latest snapshot on or before `as_of`, or
+        # None if nothing that old was recorded
+        target = np.datetime64(as_of, "D")
+        for year in reversed([y for y in self.years(name) if y <= as_of.year]):
+            segment = self._segment(name, year)
+            stop = int(np.searchsorted(segment.dates, target, side="right"))
+            if stop == 0:
+                continue
+            day = segment.dates[stop - 1]
+            start = int(np.searchsorted(segment.dates, day, side="left"))
+            value = freeze(self.tracked[name].decode(segment.table.slice(start, stop - start)))
+            value.data_version = f"history:{name}:{day}:{segment.signature}"
+            return value
+        return None
+
+    def empty(self, name):
+        # The value of a dataset with nothing in it, in the dataset's shape
+        codec = self.tracked[name]
+        value = freeze(codec.decode(codec.schema().empty_table()))
+        value.data_version = f"history:{name}:empty"
+        return value
+
+    def table(self, name):
+        # All snapshots of one dataset as a single (zero-copy) Arrow table
+        import pyarrow as pa
+
+        tables = [self._segment(name, year).table for year in self.years(name)]
+        if not tables:
+            return self.tracked[name].schema().empty_table()
+        return pa.concat_tables(tables)
+
+    def record(self, day, values):
+        # Store one snapshot; recording the same date again replaces it
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock, _FileLock(os.path.join(self.directory, ".lock")):
+            for name, value in values.items():
+                codec = self.tracked[name]
+                rows = codec.encode(day, value)
+                path = os.path.join(self._dir(name), f"{day.year}.arrow")
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                if os.path.exists(path):
+                    with pa.memory_map(path) as source:
+                        existing = pa.ipc.open_file(source).read_all()
+                    keep = pc.not_equal(existing.column("snapshot_date"), pa.scalar(day, pa.date32()))
+                    rows = pa.concat_tables([existing.filter(keep), rows])
+                rows = rows.sort_by([("snapshot_date", "ascending")]).combine_chunks()
+                fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+                os.close(fd)
+                try:
+                    with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, rows.schema) as writer:
+                        writer.write_table(rows)
+                    os.replace(tmp, path)
+                except BaseException:
+                    os.remove(tmp)
+                    raise
+
+    def phase_burnup(self, until=None):
+        # Burn-up series straight from the phase_completion columns: per
+        # snapshot date, the completed scope (sum of phase percentages, in
+        # phases) against the total scope (phases tracked), plus one series
+        # per phase
+        key = ("burnup", self.signature("phase_completion"), until)
+        cached = self._recall(key)
+        if cached is not None:
+            return cached
+
+        table = self.table("phase_completion")
+        dates = _numpy(table.column("snapshot_date"))
+        if until is not None:
+            stop = int(np.searchsorted(dates, np.datetime64(until, "D"), side="right"))
+            table, dates = table.slice(0, stop), dates[:stop]
+        days, day_index = np.unique(dates, return_inverse=True)
+        keys = table.column("key").combine_chunks().dictionary_encode()
+        phase_names = keys.dictionary.to_pylist()
+        values = _numpy(table.column("value"))
+
+        grid = np.full((len(phase_names), len(days)), np.nan)
+        grid[keys.indices.to_numpy(zero_copy_only=False), day_index] = values
+        completed = np.nansum(grid, axis=0) / 100
+        scope = np.sum(~np.isnan(grid), axis=0)
+
+        result = FrozenDict(
+            dates=[str(day) for day in days],
+            completed=[round(float(v), 4) for v in completed],
+            scope=[int(v) for v in scope],
+            phases=FrozenDict(
+                (phase, [None if np.isnan(v) else _number(v) for v in row])
+                for phase, row in zip(phase_names, grid)
+            ),
+        )
+        result.data_version = f"burnup:{key[1]}:{until}"
+        return self._remember(key, result)
+
+    def _recall(self, key):
+        value = self._derived.pop(key, None)
+        if value is not None:
+            # Most recently used last
+            self._derived[key] = value
+        return value
+
+    def _remember(self, key, value):
+        while len(self._derived) >= MAX_DERIVED:
+            self._derived.pop(next(iter(self._derived)), None)
+        self._derived[key] = value
+        return value
+
+
+store = HistoryStore(HISTORY_DIR)
+
+
+# Time travel. The sidebar slider stores the date being viewed in
+# st.session_state["as_of"]; pages read tracked datasets through
+# dataset_as_of() so they show that date's snapshot.
+
+def selected_date():
+    # None while viewing the live data
+    as_of = st.session_state.get("as_of")
+    if as_of is None or as_of >= current_as_of():
+        return None
+    return as_of
+
+
+def viewing_date():
+    return selected_date() or current_as_of()
+
+
+def dataset_as_of(name, live=None):
+    # `live` overrides where the current value comes from (e.g. the
+    # refresher's snapshot); it is used unless an earlier date is selected.
+    # With an earlier date, the latest snapshot on or before it; if none was
+    # recorded that early the page says so and gets an empty value, never
+    # the live one.
+    as_of = selected_date()
+    if as_of is None:
+        return load_dataset(name) if live is None else live
+    value = store.get(name, as_of)
+    if value is None:
+        st.info(f"No {name.replace('_', ' ')} history on or before {display_date(as_of)}.")
+        value = store.empty(name)
+    return value
+
+
+def timeline_options():
+    return sorted(set(store.dates()) | {current_as_of()})
@@ -0,0 +1,113 @@
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+from dashboard.data import FrozenDict, freeze
+
+logger = logging.getLogger(__name__)
+
+# Seconds a page waits for any one source (unless the source sets its own
+# ``timeout``) before it renders with that source's last good value
+SOURCE_TIMEOUT = float(os.environ.get("DASHBOARD_SOURCE_TIMEOUT", "2"))
+
+# Fetch threads shared by every session
+LOADER_THREADS = int(os.environ.get("DASHBOARD_LOADER_THREADS", "8"))
+
+
+class LoadResult:
+    # values: name -> value for every source that produced one, fresh or
+    # stale; stale: name -> time.time() of the stale value's fetch;
+    # errors: name -> why the fresh fetch did not make it
+    __slots__ = ("values", "stale", "errors")
+
+    def __init__(self, values, stale, errors):
+        self.values = values
+        self.stale = stale
+        self.errors = errors
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+    def get(self, name, default=None):
+        return self.values.get(name, default)
+
+
+class SourceLoader:
+    # Process-wide. A page's sources (see dashboard.refresh for the source
+    # interface) are fetched concurrently, so its data costs the slowest
+    # source, not the sum. A source that fails or misses its timeout falls
+    # back to its last good value. A slow fetch keeps running after the
+    # page gives up on it and its result is kept for the next rerun; only
+    # one fetch per source is in flight, so a hung source cannot pile up
+    # threads.
+
+    def __init__(self, max_workers=LOADER_THREADS, timeout=SOURCE_TIMEOUT):
+        self.timeout = timeout
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers, thread_name_prefix="dashboard-source")
+        self._inflight = {}  # name -> future
+        self._last_good = {}  # name -> (value, fetched at)
+        self._lock = threading.Lock()
+
+    def _submit(self, source):
+        with self._lock:
+            future = self._inflight.get(source.name)
+            if future is None:
+                future = self._executor.submit(self._fetch, source)
+                self._inflight[source.name] = future
+            return future
+
+    def _fetch(self, source):
+        try:
+            value = freeze(source.fetch())
+            with self._lock:
+                self._last_good[source.name] = (value, time.time())
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(source.name, None)
+
+    def load(self, sources):
+        # Everything is submitted before anything is waited on; each
+        # source's timeout counts from that moment
+        started = time.monotonic()
+        futures = [(source, self._submit(source)) for source in sources]
+        values, stale, errors = {}, {}, {}
+        for source, future in futures:
+            timeout = getattr(source, "timeout", None) or self.timeout
+            try:
+                values[source.name] = future.result(max(started + timeout - time.monotonic(), 0))
+                continue
+            except concurrent.futures.TimeoutError:
+                errors[source.name] = f"timed out after {timeout:g}s"
+            except Exception as exc:
+                errors[source.name] = repr(exc)
+            logger.warning("Loading %s failed: %s", source.name, errors[source.name])
+            last = self._last_good.get(source.name)
+            if last is not None:
+                values[source.name], stale[source.name] = last
+        return LoadResult(FrozenDict(values), FrozenDict(stale), FrozenDict(errors))
+
+
+loader = SourceLoader()
+
+
+def load_sources(sources):
+    return loader.load(sources)
+
+
+def render_load_notice(result):
+    # One line for the page when any of its sources did not load fresh
+    if not result.errors:
+        return
+    parts = []
+    for name, error in result.errors.items():
+        if name in result.stale:
+            fetched_at = time.strftime("%H:%M:%S", time.localtime(result.stale[name]))
+            parts.append(f"{name} (showing data from {fetched_at}; {error})")
+        else:
+            parts.append(f"{name} (unavailable; {error})")
+    st.warning("Some data sources did not respond: " + ", ".join(parts))
@@ -0,0 +1,267 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Prometheus text exposition is written to this file (for node_exporter's
+# textfile collector) and/or served on this port at /metrics
+METRICS_FILE = os.environ.get("DASHBOARD_METRICS_FILE")
+METRICS_PORT = int(os.environ.get("DASHBOARD_METRICS_PORT", "0"))
+METRICS_FILE_INTERVAL = float(os.environ.get("DASHBOARD_METRICS_FILE_INTERVAL", "15"))
+
+# A session counts as active if it reran within this many seconds
+ACTIVE_SESSION_WINDOW = 300
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help):
+        self.name = name
+        self.help = help
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield self.name, labels, value
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name, help, callback):
+        self.name = name
+        self.help = help
+        self.callback = callback
+
+    def samples(self):
+        yield self.name, (), self.callback()
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][i] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self):
+        with self._lock:
+            items = [(labels, list(series[0]), series[1], series[2]) for labels, series in self._series.items()]
+        for labels, counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", labels + (("le", _format_value(bound)),), cumulative
+            yield f"{self.name}_bucket", labels + (("le", "+Inf"),), count
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def exposition(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class SessionTracker:
+    def __init__(self):
+        self.reruns = {}
+        self.last_seen = {}
+        self._lock = threading.Lock()
+
+    def record(self, session_id):
+        now = time.time()
+        with self._lock:
+            self.reruns[session_id] = self.reruns.get(session_id, 0) + 1
+            self.last_seen[session_id] = now
+            # Forget sessions idle for long enough that they are surely gone
+            if len(self.last_seen) > 1000:
+                cutoff = now - 10 * ACTIVE_SESSION_WINDOW
+                for stale in [sid for sid, seen in self.last_seen.items() if seen < cutoff]:
+                    del self.last_seen[stale]
+                    del self.reruns[stale]
+
+    def active(self):
+        cutoff = time.time() - ACTIVE_SESSION_WINDOW
+        with self._lock:
+            return sum(1 for seen in self.last_seen.values() if seen >= cutoff)
+
+    def top(self, n=10):
+        with self._lock:
+            return sorted(self.reruns.items(), key=lambda item: item[1], reverse=True)[:n]
+
+
+registry = Registry()
+sessions = SessionTracker()
+
+PAGE_RENDER_SECONDS = registry.register(Histogram(
+    "dashboard_page_render_seconds", "Time spent running a page function."))
+PAGE_RERUNS = registry.register(Counter(
+    "dashboard_page_reruns_total", "Script reruns per page."))
+FIGURE_BUILD_SECONDS = registry.register(Histogram(
+    "dashboard_figure_build_seconds", "Time spent building a figure on a cache miss."))
+CACHE_REQUESTS = registry.register(Counter(
+    "dashboard_cache_requests_total", "Artifact cache lookups by cache and result (hit/miss)."))
+SESSION_RERUNS = registry.register(Counter(
+    "dashboard_session_reruns_total", "Script reruns across all sessions."))
+ACTIVE_SESSIONS = registry.register(Gauge(
+    "dashboard_active_sessions", f"Sessions that reran in the last {ACTIVE_SESSION_WINDOW} seconds.",
+    sessions.active))
+SESSIONS_SEEN = registry.register(Gauge(
+    "dashboard_sessions_seen", "Distinct sessions currently tracked.",
+    lambda: len(sessions.last_seen)))
+
+
+_lookup = threading.local()
+
+
+def _lookups():
+    # This thread's open lookups, innermost last; one miss flag each, since
+    # a cached body can itself look up another cache
+    if not hasattr(_lookup, "stack"):
+        _lookup.stack = []
+    return _lookup.stack
+
+
+def record_miss():
+    # Called from inside a cached function body, which only runs on a miss
+    stack = _lookups()
+    if stack:
+        stack[-1] = True
+
+
+@contextmanager
+def cache_lookup(cache):
+    stack = _lookups()
+    stack.append(False)
+    try:
+        yield
+        missed = stack[-1]
+    finally:
+        stack.pop()
+    CACHE_REQUESTS.inc(cache=cache, result="miss" if missed else "hit")
+
+
+def record_rerun(page, session_id=None):
+    PAGE_RERUNS.inc(page=page)
+    SESSION_RERUNS.inc()
+    if session_id is not None:
+        sessions.record(session_id)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.exposition().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def write_metrics_file(path):
+    # Write then rename so the collector never reads a partial file
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(registry.exposition())
+    os.replace(tmp, path)
+
+
+def _file_writer(path, interval):
+    while True:
+        try:
+            write_metrics_file(path)
+        except OSError:
+            pass
+        time.sleep(interval)
+
+
+def start_exporters(port=METRICS_PORT, path=METRICS_FILE):
+    started = []
+    if port:
+        try:
+            server = ThreadingHTTPServer(("0.0.0.0", port), _MetricsHandler)
+        except OSError as exc:
+            # Another replica on this host may already hold the port
+            logger.warning("Metrics endpoint not started on port %s: %s", port, exc)
+        else:
+            threading.Thread(target=server.serve_forever, name="dashboard-metrics-http", daemon=True).start()
+            started.append(server)
+    if path:
+        threading.Thread(target=_file_writer, args=(path, METRICS_FILE_INTERVAL),
+                         name="dashboard-metrics-file", daemon=True).start()
+        started.append(path)
+    return started
@@ -0,0 +1,339 @@
+import bisect
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from dashboard import data
+from dashboard.data import DATA_DIR, FrozenDict, freeze
+
+logger = logging.getLogger(__name__)
+
+# One JSON file per project:
+#   {"name": ..., "owner": ..., "phase": "Execution",
+#    "status": {area: "ON TRACK" | "AT RISK" | ...},
+#    "phase_completion": {phase: percent},
+#    "risks": [{"Risk": ..., "Impact": ..., "Likelihood": ...}]}
+# The Analytics Hub itself is always in the portfolio, read from the
+# dashboard's own datasets (see home_project), so portfolio mode turns on
+# once the directory holds any other project.
+PORTFOLIO_DIR = os.environ.get("DASHBOARD_PORTFOLIO_DIR", os.path.join(DATA_DIR, "portfolio"))
+
+# Seconds between directory scans; a scan only re-reads changed files
+POLL_INTERVAL = float(os.environ.get("DASHBOARD_PORTFOLIO_POLL", "5"))
+
+# Worst first; anything unknown sorts after these
+STATUS_ORDER = ["ESCALATION", "AT RISK", "ON TRACK"]
+OVERALL_AREA = "Overall Project"
+
+SORT_KEYS = ("name", "completion", "status")
+
+HOME_PROJECT_ID = "analytics-hub"
+HOME_DATASETS = {"status": "project_status_data", "phase_completion": "phase_completion", "risks": "risk_data"}
+
+
+def overall_status(status):
+    if OVERALL_AREA in status:
+        return status[OVERALL_AREA]
+    ranked = sorted(status.values(), key=_status_rank)
+    return ranked[0] if ranked else "UNKNOWN"
+
+
+def _status_rank(status):
+    return STATUS_ORDER.index(status) if status in STATUS_ORDER else len(STATUS_ORDER)
+
+
+def home_project():
+    # (raw project, version) for the Analytics Hub, from the dashboard's
+    # datasets and the "project" entry of meta.json
+    raw = dict(data.store.get("meta").get("project", {}))
+    raw.update((field, data.store.get(name)) for field, name in HOME_DATASETS.items())
+    version = ":".join(data.store.version(name) for name in ("meta", *HOME_DATASETS.values()))
+    return raw, version
+
+
+def _content_version(raw):
+    return hashlib.sha1(json.dumps(raw, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _field(raw, name, expected, default, kind):
+    value = raw.get(name, default)
+    if not isinstance(value, expected):
+        raise TypeError(f"{name} must be {kind}, not {type(value).__name__}")
+    return value
+
+
+def _percent(phase, value):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"phase_completion[{phase!r}] must be a number, not {value!r}")
+    return value
+
+
+def _risk(risk):
+    if not isinstance(risk, dict):
+        raise TypeError(f"a risk must be an object, not {type(risk).__name__}")
+    # KeyError for a risk without a level
+    return {"Risk": str(risk.get("Risk", "")), "Impact": str(risk["Impact"]), "Likelihood": str(risk["Likelihood"])}
+
+
+class Project:
+    __slots__ = (
+        "id", "name", "owner", "phase", "status", "overall", "phase_completion", "completion", "risks",
+        "signature", "version", "exposure", "sort_values", "digest",
+    )
+
+    def __init__(self, project_id, raw, signature, version=None):
+        # `signature` tells a rescan whether to re-read the source; `version`
+        # identifies the contents and defaults to a hash of them. Fields are
+        # checked and normalised here (TypeError, KeyError), and everything
+        # the roll-ups need is computed up front, so applying a project to
+        # the portfolio cannot fail half way.
+        if not isinstance(raw, dict):
+            raise TypeError(f"a project must be an object, not {type(raw).__name__}")
+        self.id = project_id
+        self.name = str(raw.get("name", project_id))
+        self.owner = str(raw.get("owner", "Unassigned"))
+        self.phase = str(raw.get("phase", "Unknown"))
+        status = _field(raw, "status", dict, {}, "an object")
+        self.status = freeze({str(area): str(value) for area, value in status.items()})
+        self.overall = overall_status(self.status)
+        phases = _field(raw, "phase_completion", dict, {}, "an object")
+        self.phase_completion = freeze({str(phase): _percent(phase, percent) for phase, percent in phases.items()})
+        values = list(self.phase_completion.values())
+        self.completion = sum(values) / len(values) if values else 0.0
+        self.risks = freeze([_risk(risk) for risk in _field(raw, "risks", (list, tuple), [], "a list")])
+        self.signature = signature
+        self.version = version if version is not None else _content_version(raw)
+
+        self.exposure = [(risk["Impact"], risk["Likelihood"]) for risk in self.risks]
+        self.sort_values = {
+            "name": self.name.lower(),
+            "completion": self.completion,
+            "status": (_status_rank(self.overall), self.name.lower()),
+        }
+        self.digest = int(hashlib.sha1(f"{self.id}:{self.version}".encode("utf-8")).hexdigest(), 16)
+
+    def row(self):
+        return {
+            "id": self.id, "name": self.name, "owner": self.owner, "phase": self.phase,
+            "status": self.overall, "completion": round(self.completion, 1), "risks": len(self.risks),
+        }
+
+
+class Portfolio:
+    # Process-wide. Roll-ups and indexes are adjusted per project as its
+    # file is added, changed or removed, never recomputed over everything.
+    # The content digest XORs a hash of every project's id and version, so
+    # it is updated per project too and is the same in every process that
+    # sees the same files; it keys the shared figure and block caches.
+
+    def __init__(self, directory, home=False):
+        self.directory = directory
+        self.home = home
+        self.projects = {}
+        self.digest = 0
+        self._rejected = {}  # project id -> signature of a file that failed to load
+        self._scanned_at = 0.0
+        self._lock = threading.Lock()
+
+        # Roll-ups
+        self.status_counts = {}
+        self.completion_sum = 0.0
+        self.phase_sums = {}  # phase name -> [sum, count]
+        self.risk_exposure = {}  # (impact, likelihood) -> count
+
+        # Indexes: value -> set of project ids, plus sorted (key, id) lists
+        self.by_status = {}
+        self.by_owner = {}
+        self.by_phase = {}
+        self.sorted_by = {key: [] for key in SORT_KEYS}
+
+    # Maintenance
+
+    def refresh(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._scanned_at < POLL_INTERVAL:
+            return
+        with self._lock:
+            if not force and now - self._scanned_at < POLL_INTERVAL:
+                return
+            try:
+                self._scan()
+            finally:
+                # A failing scan is not retried on every rerun either
+                self._scanned_at = time.monotonic()
+
+    def _scan(self):
+        seen = set()
+        if self.home:
+            seen.add(HOME_PROJECT_ID)
+            raw, version = home_project()
+            current = self.projects.get(HOME_PROJECT_ID)
+            if current is None or current.version != version:
+                try:
+                    self.update(Project(HOME_PROJECT_ID, raw, version, version))
+                except (TypeError, KeyError, ValueError) as exc:
+                    logger.warning("Skipping the Analytics Hub project: %r", exc)
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            project_id = entry.name[:-5]
+            if self.home and project_id == HOME_PROJECT_ID:
+                # Comes from the datasets; a stale copy must not replace it
+                continue
+            seen.add(project_id)
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            current = self.projects.get(project_id)
+            if current is not None and current.signature == signature or self._rejected.get(project_id) == signature:
+                continue
+            try:
+                with open(entry.path, "rb") as f:
+                    raw = f.read()
+                version = hashlib.sha1(raw).hexdigest()
+                if current is not None and current.version == version:
+                    # Touched but unchanged
+                    current.signature = signature
+                    continue
+                project = Project(project_id, json.loads(raw), signature, version)
+            except (OSError, ValueError, TypeError, KeyError) as exc:
+                # Kept out (or at its last good version) until the file changes
+                logger.warning("Skipping unreadable project file %s: %r", entry.path, exc)
+                self._rejected[project_id] = signature
+                continue
+            self._rejected.pop(project_id, None)
+            self.update(project)
+        for project_id in set(self.projects) - seen:
+            self.remove(project_id)
+        for project_id in set(self._rejected) - seen:
+            del self._rejected[project_id]
+
+    def update(self, project):
+        # Add or replace one project; O(size of that project)
+        old = self.projects.get(project.id)
+        if old is not None:
+            self._apply(old, -1)
+        self.projects[project.id] = project
+        self._apply(project, +1)
+
+    def remove(self, project_id):
+        old = self.projects.pop(project_id, None)
+        if old is not None:
+            self._apply(old, -1)
+
+    def _apply(self, project, sign):
+        # Only reads what Project computed; XOR is its own inverse, so
+        # removing a project undoes its addition
+        self.digest ^= project.digest
+        _count(self.status_counts, project.overall, sign)
+        self.completion_sum += sign * project.completion
+        for phase, percent in project.phase_completion.items():
+            sums = self.phase_sums.setdefault(phase, [0.0, 0])
+            sums[0] += sign * percent
+            sums[1] += sign
+            if sums[1] == 0:
+                del self.phase_sums[phase]
+        for cell in project.exposure:
+            _count(self.risk_exposure, cell, sign)
+
+        for index, value in ((self.by_status, project.overall), (self.by_owner, project.owner), (self.by_phase, project.phase)):
+            if sign > 0:
+                index.setdefault(value, set()).add(project.id)
+            else:
+                members = index[value]
+                members.discard(project.id)
+                if not members:
+                    del index[value]
+
+        for key, sort_value in project.sort_values.items():
+            entries = self.sorted_by[key]
+            item = (sort_value, project.id)
+            if sign > 0:
+                bisect.insort(entries, item)
+            else:
+                del entries[bisect.bisect_left(entries, item)]
+
+    # Queries
+
+    def summary(self):
+        self.refresh()
+        with self._lock:
+            return self._summary()
+
+    def _summary(self):
+        count = len(self.projects)
+        summary = FrozenDict(
+            projects=count,
+            status_counts=FrozenDict(sorted(self.status_counts.items(), key=lambda item: _status_rank(item[0]))),
+            average_completion=round(self.completion_sum / count, 1) if count else 0.0,
+            phase_averages=FrozenDict(
+                (phase, round(total / n, 1)) for phase, (total, n) in sorted(self.phase_sums.items())
+            ),
+            risk_exposure=FrozenDict((f"{impact}|{likelihood}", n) for (impact, likelihood), n in self.risk_exposure.items()),
+        )
+        summary.data_version = f"portfolio:{self.digest:040x}"
+        return summary
+
+    def options(self):
+        self.refresh()
+        with self._lock:
+            return {
+                "status": sorted(self.by_status, key=_status_rank),
+                "owner": sorted(self.by_owner),
+                "phase": sorted(self.by_phase),
+            }
+
+    def query(self, status=None, owner=None, phase=None, sort="name", descending=False, limit=50):
+        # (rows, total matches). Filters intersect the index sets, smallest
+        # first; the sorted index is then walked until `limit` rows match.
+        self.refresh()
+        with self._lock:
+            return self._query(status, owner, phase, sort, descending, limit)
+
+    def _query(self, status, owner, phase, sort, descending, limit):
+        filters = [
+            index.get(value, set())
+            for index, value in ((self.by_status, status), (self.by_owner, owner), (self.by_phase, phase))
+            if value is not None
+        ]
+        matches = None
+        if filters:
+            filters.sort(key=len)
+            matches = filters[0].intersection(*filters[1:])
+
+        entries = self.sorted_by[sort]
+        total = len(self.projects) if matches is None else len(matches)
+        if matches is not None and len(matches) * 8 < len(entries):
+            # A narrow filter: sorting its few matches beats walking the index
+            entries = sorted((self.projects[project_id].sort_values[sort], project_id) for project_id in matches)
+        ordered = reversed(entries) if descending else iter(entries)
+        rows = []
+        for _, project_id in ordered:
+            if len(rows) >= limit:
+                break
+            if matches is None or project_id in matches:
+                rows.append(self.projects[project_id].row())
+        return rows, total
+
+
+def _count(counter, key, sign):
+    counter[key] = counter.get(key, 0) + sign
+    if counter[key] == 0:
+        del counter[key]
+
+
+portfolio = Portfolio(PORTFOLIO_DIR, home=True)
+
+
+def portfolio_mode():
+    portfolio.refresh()
+    return len(portfolio.projects) > 1
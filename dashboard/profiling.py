@@ -0,0 +1,435 @@
+import concurrent.futures
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+from dashboard.data import DATA_DIR, freeze
+
+logger = logging.getLogger(__name__)
+
+# Daily custodian balance files (CSV, optionally gzipped) dropped here
+CUSTODIAN_DIR = os.environ.get("DASHBOARD_CUSTODIAN_DIR", os.path.join(DATA_DIR, "custodian"))
+
+# Finished profiles, one JSON file per file content hash
+PROFILE_DIR = os.environ.get("DASHBOARD_PROFILE_DIR", os.path.join(DATA_DIR, "profiles"))
+
+# Bytes of the file parsed per block. Arrow's reader keeps a few dozen
+# blocks in flight, so memory is bounded by that plus the fixed-size
+# sketches (about 100 MiB at 1 MiB blocks), whatever the file size.
+BLOCK_BYTES = int(os.environ.get("DASHBOARD_PROFILE_BLOCK_BYTES", str(2**20)))
+
+# Bump when the profile contents change so old cached profiles are redone
+PROFILE_VERSION = 1
+
+FILE_SUFFIXES = (".csv", ".csv.gz", ".txt")
+
+# Known layouts, matched by file name prefix. Columns not listed here are
+# typed from the first block: "number" if nearly every value parses.
+CUSTODIANS = {
+    "northern_trust": {
+        "label": "Northern Trust",
+        "date_format": "%m/%d/%Y",
+        "types": {
+            "Valuation Date": "date", "Account Number": "string", "Plan ID": "string",
+            "CUSIP": "string", "Security Description": "string", "Shares": "number",
+            "Price": "number", "Market Value": "number", "Currency": "string",
+        },
+    },
+    "state_street": {
+        "label": "State Street",
+        "date_format": "%Y-%m-%d",
+        "types": {
+            "AS_OF_DT": "date", "FUND_ID": "string", "ACCT_ID": "string",
+            "CUSIP": "string", "SEC_NAME": "string", "UNITS": "number",
+            "NAV": "number", "MKT_VAL": "number", "CCY": "string",
+        },
+    },
+}
+
+# Share of a first block's non-null values that must parse for an unlisted
+# column to be typed as a number
+INFER_NUMBER_SHARE = 0.95
+
+NUMBER_PATTERN = r"^[+-]?(\d[\d,]*\.?\d*|\.\d+)([eE][+-]?\d+)?$"
+
+QUANTILES = (0.01, 0.25, 0.5, 0.75, 0.99)
+
+# Offending values kept per column as examples
+MAX_EXAMPLES = 5
+
+
+def custodian_for(filename):
+    for key in CUSTODIANS:
+        if filename.lower().startswith(key):
+            return key
+    return None
+
+
+class HyperLogLog:
+    # Distinct-count sketch: 2**p one-byte registers (4 KiB at p=12),
+    # about 1.6% standard error whatever the number of values
+
+    def __init__(self, p=12):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def add(self, hashes):
+        # hashes: uint64 array
+        bits = 64 - self.p
+        index = (hashes >> np.uint64(bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << bits) - 1)
+        # Position of the first set bit of the remaining bits, 1-based
+        _, exponent = np.frexp(rest.astype(np.float64))
+        rank = np.where(rest == 0, bits + 1, bits - exponent + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small cardinalities: linear counting is more accurate
+            return round(m * np.log(m / zeros))
+        return round(raw)
+
+
+class QuantileSketch:
+    # Compacting quantile sketch (KLL-style, equal level capacities): each
+    # level holds at most k values; a full level is sorted and every other
+    # value moves up a level with twice the weight. Memory is
+    # O(k log(n / k)); rank error is on the order of a percent at k=256.
+
+    def __init__(self, k=256, seed=0):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, values):
+        if not len(values):
+            return
+        self.count += len(values)
+        low, high = float(values.min()), float(values.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        level = 0
+        while level < len(self.levels):
+            buffer = self.levels[level]
+            if len(buffer) > self.k:
+                buffer = np.sort(buffer)
+                keep = buffer[len(buffer) - len(buffer) % 2:]
+                promoted = buffer[self._rng.integers(2):len(buffer) - len(keep):2]
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, qs):
+        if not self.count:
+            return [None for _ in qs]
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** i) for i, level in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values, cumulative = values[order], np.cumsum(weights[order])
+        ranks = np.asarray(qs) * cumulative[-1]
+        positions = np.minimum(np.searchsorted(cumulative, ranks), len(values) - 1)
+        return [float(v) for v in values[positions]]
+
+
+class ColumnProfile:
+    def __init__(self, name, kind, date_format=None):
+        self.name = name
+        self.kind = kind
+        self.date_format = date_format
+        self.count = 0
+        self.nulls = 0
+        self.violations = 0
+        self.examples = []
+        self.distinct = HyperLogLog()
+        self.sketch = QuantileSketch() if kind in ("number", "date") else None
+        self.max_length = 0
+
+    def add(self, array):
+        # array: one block of the column as an Arrow string array
+        self.count += len(array)
+        present = _present(array)
+        self.nulls += len(array) - len(present)
+        if not len(present):
+            return
+        # Arrow's hash table dedupes the block; only its distinct values are
+        # hashed in Python-land
+        self.distinct.add(pd.util.hash_array(pc.unique(present).to_numpy(zero_copy_only=False), categorize=False))
+        self.max_length = max(self.max_length, pc.max(pc.utf8_length(present)).as_py())
+
+        if self.kind == "number":
+            valid, values = _parse_numbers(present)
+        elif self.kind == "date":
+            parsed = pc.strptime(present, format=self.date_format, unit="s", error_is_null=True)
+            valid = pc.is_valid(parsed)
+            # Days since the epoch, so dates share the numeric sketch
+            values = pc.divide(pc.cast(pc.drop_null(parsed), pa.int64()), 86400).to_numpy().astype(np.float64)
+        else:
+            return
+        bad = len(present) - len(values)
+        if bad:
+            self.violations += bad
+            if len(self.examples) < MAX_EXAMPLES:
+                for value in pc.unique(pc.filter(present, pc.invert(valid)))[:MAX_EXAMPLES].to_pylist():
+                    if value not in self.examples and len(self.examples) < MAX_EXAMPLES:
+                        self.examples.append(value)
+        self.sketch.add(values)
+
+    def _value(self, number):
+        if number is None:
+            return None
+        if self.kind == "date":
+            return str(np.datetime64(int(number), "D"))
+        return round(number, 4)
+
+    def result(self):
+        quantiles = {}
+        if self.sketch is not None and self.sketch.count:
+            quantiles = {
+                f"p{round(q * 100):02d}": self._value(value)
+                for q, value in zip(QUANTILES, self.sketch.quantiles(QUANTILES))
+            }
+        return {
+            "name": self.name,
+            "type": self.kind,
+            "count": self.count,
+            "nulls": self.nulls,
+            "null_rate": round(self.nulls / self.count, 4) if self.count else 0.0,
+            "distinct": min(self.distinct.estimate(), self.count - self.nulls),
+            "violations": self.violations,
+            "examples": self.examples,
+            "min": self._value(self.sketch.min) if self.sketch is not None else None,
+            "max": self._value(self.sketch.max) if self.sketch is not None else None,
+            "quantiles": quantiles,
+            "max_length": self.max_length,
+        }
+
+
+def _present(array):
+    # Non-null values with surrounding whitespace trimmed; blank and
+    # whitespace-only cells count as nulls
+    present = pc.utf8_trim_whitespace(pc.drop_null(array))
+    blank = pc.equal(present, "")
+    return pc.filter(present, pc.invert(blank)) if pc.any(blank).as_py() else present
+
+
+def _parse_numbers(array):
+    # (validity mask, float64 values of the valid entries); "1,234.50" is a
+    # number, "N/A" a violation
+    valid = pc.match_substring_regex(array, NUMBER_PATTERN)
+    text = pc.replace_substring(pc.filter(array, valid), ",", "")
+    try:
+        return valid, pc.cast(text, pa.float64()).to_numpy()
+    except pa.ArrowInvalid:
+        # Something the pattern let through; fall back to pandas for the block
+        parsed = pd.to_numeric(pd.Series(array.to_numpy(zero_copy_only=False)).str.replace(",", "", regex=False), errors="coerce")
+        mask = parsed.notna().to_numpy()
+        return pa.array(mask), parsed.to_numpy()[mask].astype(np.float64)
+
+
+def _infer_kind(array):
+    present = _present(array)
+    if not len(present):
+        return "string"
+    valid, _ = _parse_numbers(present)
+    return "number" if pc.mean(pc.cast(valid, pa.int8())).as_py() >= INFER_NUMBER_SHARE else "string"
+
+
+def _header(path):
+    # Column names from the first line; input_stream decompresses .gz
+    with pa.input_stream(path) as stream:
+        return next(csv.reader(io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")))
+
+
+def profile_file(path, block_bytes=BLOCK_BYTES):
+    # One streaming pass over the file in blocks of about block_bytes.
+    # Every column is read as a string so type violations are counted
+    # rather than coerced away.
+    custodian = custodian_for(os.path.basename(path))
+    layout = CUSTODIANS.get(custodian, {})
+    types = layout.get("types", {})
+    started = time.perf_counter()
+    names = _header(path)
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=block_bytes),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in names}, null_values=[""], strings_can_be_null=True,
+        ),
+    )
+    columns = None
+    rows = 0
+    for batch in reader:
+        if columns is None:
+            columns = [
+                ColumnProfile(name, types.get(name) or _infer_kind(batch.column(i)), layout.get("date_format"))
+                for i, name in enumerate(batch.schema.names)
+            ]
+        for i, column in enumerate(columns):
+            column.add(batch.column(i))
+        rows += batch.num_rows
+    return {
+        "file": os.path.basename(path),
+        "custodian": layout.get("label", "Unknown"),
+        "rows": rows,
+        "bytes": os.path.getsize(path),
+        "columns": [column.result() for column in columns or []],
+        "seconds": round(time.perf_counter() - started, 3),
+        "profiled_at": time.time(),
+    }
+
+
+def file_sha1(path, block_size=2**20):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Profiler:
+    # Process-wide. Profiles are cached by file content hash in memory and
+    # in PROFILE_DIR, so a file is profiled once however often it is renamed
+    # or touched. Hashing and profiling run in the background, one file at
+    # a time; the page only stats files, and looks a file up by (path,
+    # size, mtime) until its hash is known. A file is not queued again while
+    # an earlier version of it is still being worked on.
+
+    def __init__(self, directory=CUSTODIAN_DIR, profile_dir=PROFILE_DIR):
+        self.directory = directory
+        self.profile_dir = profile_dir
+        self._executor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="dashboard-profiler")
+        self._hashes = {}  # path -> (signature, sha1)
+        self._profiles = {}  # sha1 -> profile
+        self._inflight = {}  # path -> (signature, future)
+        self.errors = {}  # signature -> why profiling failed; not retried
+        self._lock = threading.Lock()
+
+    def files(self):
+        # Newest first
+        try:
+            entries = [
+                entry for entry in os.scandir(self.directory)
+                if entry.is_file() and entry.name.lower().endswith(FILE_SUFFIXES)
+            ]
+        except FileNotFoundError:
+            return []
+        entries.sort(key=lambda entry: (-entry.stat().st_mtime_ns, entry.name))
+        return [entry.path for entry in entries]
+
+    def signature(self, path):
+        # Identifies the file's current contents without reading them
+        stat = os.stat(path)
+        return (path, stat.st_size, stat.st_mtime_ns)
+
+    def known_hash(self, signature):
+        # The content hash if it was already computed for this signature
+        known = self._hashes.get(signature[0])
+        if known is not None and known[0] == signature:
+            return known[1]
+        return None
+
+    def content_hash(self, path):
+        # Reads the whole file the first time per signature; background
+        # jobs and tools only
+        signature = self.signature(path)
+        sha1 = self.known_hash(signature)
+        if sha1 is None:
+            sha1 = file_sha1(path)
+            self._hashes[path] = (signature, sha1)
+        return sha1
+
+    def _profile_path(self, sha1):
+        return os.path.join(self.profile_dir, f"{sha1}-v{PROFILE_VERSION}.json")
+
+    def cached(self, sha1):
+        profile = self._profiles.get(sha1)
+        if profile is not None:
+            return profile
+        try:
+            with open(self._profile_path(sha1)) as f:
+                profile = freeze(json.load(f))
+        except (OSError, ValueError):
+            return None
+        profile.data_version = f"profile:{sha1}:{PROFILE_VERSION}"
+        self._profiles[sha1] = profile
+        return profile
+
+    def _run(self, path, signature):
+        try:
+            sha1 = self.content_hash(path)
+            # Same contents under another name, or profiled by an earlier process
+            profile = self.cached(sha1)
+            if profile is not None:
+                return profile
+            profile = profile_file(path)
+            profile["sha1"] = sha1
+            os.makedirs(self.profile_dir, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.profile_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(profile, f)
+            os.replace(tmp, self._profile_path(sha1))
+            logger.info("Profiled %s (%d rows) in %.1fs", path, profile["rows"], profile["seconds"])
+            return self.cached(sha1)
+        except Exception as exc:
+            logger.warning("Profiling %s failed: %r", path, exc)
+            self.errors[signature] = repr(exc)
+            raise
+        finally:
+            with self._lock:
+                if self._inflight.get(path, (None,))[0] == signature:
+                    del self._inflight[path]
+
+    def profile(self, path, wait=0.0):
+        # The file's profile, or None while it is still being computed; waits
+        # up to `wait` seconds for a profile that is not cached yet
+        signature = self.signature(path)
+        sha1 = self.known_hash(signature)
+        if sha1 is not None:
+            profile = self.cached(sha1)
+            if profile is not None:
+                return profile
+        if signature in self.errors:
+            return None
+        with self._lock:
+            running = self._inflight.get(path)
+            if running is None:
+                running = (signature, self._executor.submit(self._run, path, signature))
+                self._inflight[path] = running
+            elif running[0] != signature:
+                # Changed since it was queued (e.g. still being written); the
+                # current version is queued once that job finishes
+                return None
+        try:
+            return running[1].result(wait)
+        except concurrent.futures.TimeoutError:
+            return None
+        except Exception:
+            return None
+
+    def error(self, path):
+        return self.errors.get(self.signature(path))
+
+
+profiler = Profiler()
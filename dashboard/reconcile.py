@@ -0,0 +1,361 @@
+import concurrent.futures
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+from dashboard.data import DATA_DIR, freeze
+from dashboard.profiling import CUSTODIANS, NUMBER_PATTERN, custodian_for, profiler
+
+logger = logging.getLogger(__name__)
+
+# Finished reconciliations, one JSON file per pair of file content hashes
+RECON_DIR = os.environ.get("DASHBOARD_RECON_DIR", os.path.join(DATA_DIR, "reconciliation"))
+
+# Input bytes per partition (per side). Larger inputs are hash-partitioned
+# on the normalized key and spilled to disk, so memory is bounded by one
+# partition of each side whatever the total row count.
+PARTITION_BYTES = int(os.environ.get("DASHBOARD_RECON_PARTITION_BYTES", str(64 * 2**20)))
+
+# A break within max(ABS_TOLERANCE, REL_TOLERANCE x balance) dollars is
+# "within tolerance"; under MATCH_EPSILON it is a match
+ABS_TOLERANCE = 1.0
+REL_TOLERANCE = 0.0001
+MATCH_EPSILON = 0.005
+
+# Bump when the summary contents change so cached results are redone
+RECON_VERSION = 1
+
+# Largest breaks kept for the dashboard
+TOP_BREAKS = 20
+
+# Left and right side of every reconciliation, and their key/value columns
+SIDES = ("northern_trust", "state_street")
+FIELDS = {
+    "northern_trust": {"account": "Account Number", "security": "CUSIP", "date": "Valuation Date", "units": "Shares", "value": "Market Value"},
+    "state_street": {"account": "ACCT_ID", "security": "CUSIP", "date": "AS_OF_DT", "units": "UNITS", "value": "MKT_VAL"},
+}
+KEYS = ["account", "security", "date"]
+
+# Breaks last: every class from "mismatched" on is a break
+CLASSES = ("matched", "within_tolerance", "mismatched", "missing_left", "missing_right")
+
+# Normalized rows; dates are days since the epoch so they join as integers
+_SCHEMA = pa.schema([
+    ("account", pa.string()), ("security", pa.string()), ("date", pa.int32()),
+    ("units", pa.float64()), ("value", pa.float64()),
+])
+
+_DATE_TOKEN = re.compile(r"(\d{8})")
+
+
+def _numbers(array):
+    # float64 with nulls where the text is not a number
+    text = pc.utf8_trim_whitespace(array)
+    valid = pc.match_substring_regex(text, NUMBER_PATTERN)
+    text = pc.if_else(valid, pc.replace_substring(text, ",", ""), pa.scalar(None, pa.string()))
+    return pc.cast(text, pa.float64())
+
+
+def _key(array, strip_zeros=False):
+    # Case, whitespace and punctuation differences between custodians are
+    # not breaks; neither are leading zeros on account numbers
+    array = pc.replace_substring_regex(pc.utf8_upper(array), r"[^A-Z0-9]", "")
+    if strip_zeros:
+        array = pc.utf8_ltrim(array, characters="0")
+    return array
+
+
+def normalize(batch, side):
+    # One block of a custodian file -> (table of account, security, date,
+    # units, value with every key present, number of rows dropped as
+    # unparseable)
+    fields = FIELDS[side]
+    date = pc.strptime(
+        pc.utf8_trim_whitespace(batch.column(fields["date"])),
+        format=CUSTODIANS[side]["date_format"], unit="s", error_is_null=True,
+    )
+    table = pa.Table.from_pydict({
+        "account": _key(batch.column(fields["account"]), strip_zeros=True),
+        "security": _key(batch.column(fields["security"])),
+        "date": pc.cast(pc.cast(date, pa.date32()), pa.int32()),
+        "units": _numbers(batch.column(fields["units"])),
+        "value": _numbers(batch.column(fields["value"])),
+    }, schema=_SCHEMA)
+    valid = pc.and_(
+        pc.and_(pc.is_valid(table["date"]), pc.is_valid(table["value"])),
+        pc.and_(pc.not_equal(table["account"], ""), pc.not_equal(table["security"], "")),
+    )
+    valid = pc.fill_null(valid, False)
+    kept = table.filter(valid)
+    return kept, table.num_rows - kept.num_rows
+
+
+def _blocks(path, side):
+    names = list(FIELDS[side].values())
+    reader = pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=2**20),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=names, column_types={name: pa.string() for name in names},
+            null_values=[""], strings_can_be_null=True,
+        ),
+    )
+    for batch in reader:
+        yield batch
+
+
+def _partition_ids(table, partitions):
+    # Stable hash of the normalized key -> partition number
+    h = pd.util.hash_array(table["account"].to_numpy(zero_copy_only=False), categorize=False)
+    h = h * np.uint64(0x100000001B3) ^ pd.util.hash_array(table["security"].to_numpy(zero_copy_only=False), categorize=False)
+    h = h * np.uint64(0x100000001B3) ^ table["date"].to_numpy().astype(np.uint64)
+    return (h % np.uint64(partitions)).astype(np.intp)
+
+
+class _Spill:
+    # One Arrow IPC file per partition for one side
+    def __init__(self, directory, side, partitions, schema):
+        self.paths = [os.path.join(directory, f"{side}-{i}.arrow") for i in range(partitions)]
+        self.writers = [pa.ipc.new_file(path, schema) for path in self.paths]
+
+    def write(self, table, ids):
+        order = np.argsort(ids, kind="stable")
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(ids, minlength=len(self.writers)))])
+        table = table.take(order)
+        for i, writer in enumerate(self.writers):
+            if bounds[i + 1] > bounds[i]:
+                writer.write_table(table.slice(bounds[i], bounds[i + 1] - bounds[i]))
+
+    def close(self):
+        for writer in self.writers:
+            writer.close()
+
+    def read(self, i):
+        with pa.memory_map(self.paths[i]) as source:
+            return pa.ipc.open_file(source).read_all()
+
+
+def _aggregate(table):
+    # Duplicate keys within one side (e.g. the same holding reported in two
+    # sub-accounts) are summed before joining
+    return table.group_by(KEYS, use_threads=False).aggregate([("units", "sum"), ("value", "sum"), ("value", "count")]).rename_columns(
+        KEYS + ["units", "value", "rows"]
+    )
+
+
+def classify(left, right):
+    # Hash join of one partition on the normalized key: (per-class key
+    # counts and break amounts, the largest breaks as a DataFrame)
+    joined = _aggregate(left).join(_aggregate(right), keys=KEYS, join_type="full outer", left_suffix="_left", right_suffix="_right", use_threads=False)
+    in_left = joined["rows_left"].is_valid().to_numpy(zero_copy_only=False)
+    in_right = joined["rows_right"].is_valid().to_numpy(zero_copy_only=False)
+    a = joined["value_left"].fill_null(0.0).to_numpy()
+    b = joined["value_right"].fill_null(0.0).to_numpy()
+    diff = np.abs(a - b)
+    tolerance = np.maximum(ABS_TOLERANCE, REL_TOLERANCE * np.maximum(np.abs(a), np.abs(b)))
+    labels = np.select(
+        [~in_right, ~in_left, diff < MATCH_EPSILON, diff <= tolerance],
+        [CLASSES.index("missing_right"), CLASSES.index("missing_left"), CLASSES.index("matched"), CLASSES.index("within_tolerance")],
+        default=CLASSES.index("mismatched"),
+    )
+    counts = np.bincount(labels, minlength=len(CLASSES))
+    amounts = np.bincount(labels, weights=diff, minlength=len(CLASSES))
+    breaks = np.flatnonzero(labels >= CLASSES.index("mismatched"))
+    if len(breaks) > TOP_BREAKS:
+        breaks = breaks[np.argpartition(diff[breaks], -TOP_BREAKS)[-TOP_BREAKS:]]
+    top = joined.take(breaks).select(KEYS + ["value_left", "value_right"]).to_pandas()
+    top["difference"] = diff[breaks]
+    top["class"] = np.asarray(CLASSES)[labels[breaks]]
+    return (
+        {name: int(counts[i]) for i, name in enumerate(CLASSES)},
+        {name: float(amounts[i]) for i, name in enumerate(CLASSES)},
+        top,
+    )
+
+
+def reconcile(left_path, right_path, partition_bytes=PARTITION_BYTES):
+    started = time.perf_counter()
+    sides = (custodian_for(os.path.basename(left_path)), custodian_for(os.path.basename(right_path)))
+    size = max(os.path.getsize(left_path), os.path.getsize(right_path))
+    partitions = max(1, math.ceil(size / partition_bytes))
+    counts = dict.fromkeys(CLASSES, 0)
+    amounts = dict.fromkeys(CLASSES, 0.0)
+    rows = [0, 0]
+    dropped = [0, 0]
+    top = []
+
+    def add(left, right):
+        part_counts, part_amounts, part_top = classify(left, right)
+        for name in CLASSES:
+            counts[name] += part_counts[name]
+            amounts[name] += part_amounts[name]
+        top.append(part_top)
+        if len(top) > 1:
+            top[:] = [pd.concat(top).nlargest(TOP_BREAKS, "difference")]
+
+    def read(path, side, index, sink=None):
+        tables = []
+        for batch in _blocks(path, side):
+            table, bad = normalize(batch, side)
+            rows[index] += batch.num_rows
+            dropped[index] += bad
+            if sink is None:
+                tables.append(table)
+            else:
+                sink.write(table, _partition_ids(table, partitions))
+        return tables
+
+    if partitions == 1:
+        left = pa.concat_tables(read(left_path, sides[0], 0) or [_SCHEMA.empty_table()])
+        right = pa.concat_tables(read(right_path, sides[1], 1) or [_SCHEMA.empty_table()])
+        add(left, right)
+    else:
+        spill_dir = tempfile.mkdtemp(prefix="dashboard-recon-")
+        try:
+            spills = [_Spill(spill_dir, side, partitions, _SCHEMA) for side in sides]
+            for index, (path, side) in enumerate(zip((left_path, right_path), sides)):
+                read(path, side, index, spills[index])
+                spills[index].close()
+            for i in range(partitions):
+                add(spills[0].read(i), spills[1].read(i))
+        finally:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+
+    total = sum(counts.values())
+    top_breaks = pd.concat(top).nlargest(TOP_BREAKS, "difference")
+    top_breaks = top_breaks.assign(date=top_breaks["date"].astype("int64").astype("datetime64[D]").astype(str))
+    top_breaks = top_breaks.astype(object).where(top_breaks.notna(), None)
+    return {
+        "left": {"file": os.path.basename(left_path), "custodian": CUSTODIANS[sides[0]]["label"], "rows": rows[0], "dropped": dropped[0]},
+        "right": {"file": os.path.basename(right_path), "custodian": CUSTODIANS[sides[1]]["label"], "rows": rows[1], "dropped": dropped[1]},
+        "keys": total,
+        "counts": counts,
+        "amounts": {name: round(value, 2) for name, value in amounts.items()},
+        "match_rate": round((counts["matched"] + counts["within_tolerance"]) / total, 4) if total else 0.0,
+        "top_breaks": top_breaks.to_dict("records"),
+        "partitions": partitions,
+        "seconds": round(time.perf_counter() - started, 3),
+        "reconciled_at": time.time(),
+    }
+
+
+def pairs(paths):
+    # {date token: (left path, right path)} for every date both custodians
+    # delivered a file for, newest first
+    by_date = {}
+    for path in paths:
+        name = os.path.basename(path)
+        side, match = custodian_for(name), _DATE_TOKEN.search(name)
+        if side in SIDES and match:
+            by_date.setdefault(match.group(1), {})[side] = path
+    return {
+        day: (files[SIDES[0]], files[SIDES[1]])
+        for day, files in sorted(by_date.items(), reverse=True)
+        if len(files) == len(SIDES)
+    }
+
+
+class Reconciler:
+    # Process-wide; results are cached per pair of file content hashes and
+    # computed in the background, one pair at a time, like the profiler.
+    # The page only stats the two files: until both hashes are known the
+    # pair is looked up by their (path, size, mtime) signatures, and the
+    # hashing runs in the background job.
+
+    def __init__(self, directory=RECON_DIR):
+        self.directory = directory
+        self._executor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="dashboard-reconcile")
+        self._results = {}
+        self._inflight = {}  # (left path, right path) -> (signatures, future)
+        self.errors = {}  # signatures -> why reconciling failed; not retried
+        self._lock = threading.Lock()
+
+    def _signatures(self, left, right):
+        return profiler.signature(left), profiler.signature(right)
+
+    def _key(self, left, right):
+        # Reads both files the first time per signature; background job only
+        return f"{profiler.content_hash(left)}-{profiler.content_hash(right)}-v{RECON_VERSION}"
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def cached(self, key):
+        result = self._results.get(key)
+        if result is not None:
+            return result
+        try:
+            with open(self._path(key)) as f:
+                result = freeze(json.load(f))
+        except (OSError, ValueError):
+            return None
+        result.data_version = f"recon:{key}"
+        self._results[key] = result
+        return result
+
+    def _run(self, left, right, signatures):
+        try:
+            key = self._key(left, right)
+            result = self.cached(key)
+            if result is not None:
+                return result
+            result = reconcile(left, right)
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(result, f)
+            os.replace(tmp, self._path(key))
+            logger.info("Reconciled %s and %s in %.1fs", left, right, result["seconds"])
+            return self.cached(key)
+        except Exception as exc:
+            logger.warning("Reconciling %s and %s failed: %r", left, right, exc)
+            self.errors[signatures] = repr(exc)
+            raise
+        finally:
+            with self._lock:
+                if self._inflight.get((left, right), (None,))[0] == signatures:
+                    del self._inflight[(left, right)]
+
+    def result(self, left, right, wait=0.0):
+        # The pair's summary, or None while it is still being computed
+        signatures = self._signatures(left, right)
+        hashes = [profiler.known_hash(signature) for signature in signatures]
+        if None not in hashes:
+            result = self.cached(f"{hashes[0]}-{hashes[1]}-v{RECON_VERSION}")
+            if result is not None:
+                return result
+        if signatures in self.errors:
+            return None
+        with self._lock:
+            running = self._inflight.get((left, right))
+            if running is None:
+                running = (signatures, self._executor.submit(self._run, left, right, signatures))
+                self._inflight[(left, right)] = running
+            elif running[0] != signatures:
+                # A file changed since the pair was queued; the current
+                # versions are queued once that job finishes
+                return None
+        try:
+            return running[1].result(wait)
+        except concurrent.futures.TimeoutError:
+            return None
+        except Exception:
+            return None
+
+    def error(self, left, right):
+        return self.errors.get(self._signatures(left, right))
+
+
+reconciler = Reconciler()
@@ -0,0 +1,175 @@
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+from dashboard.data import FrozenDict, load_dataset
+from dashboard.loading import loader as default_loader
+
+logger = logging.getLogger(__name__)
+
+# Seconds between background recomputations of the dashboard snapshot
+REFRESH_INTERVAL = float(os.environ.get("DASHBOARD_REFRESH_INTERVAL", "60"))
+
+# Seconds between fragment reruns of the executive metric tiles and phase
+# chart; 0 turns the auto-refresh off
+TILE_REFRESH_INTERVAL = float(os.environ.get("DASHBOARD_TILE_REFRESH_INTERVAL", "30"))
+CHART_REFRESH_INTERVAL = float(os.environ.get("DASHBOARD_CHART_REFRESH_INTERVAL", "300"))
+
+
+# A source is any object with a ``name`` and a ``fetch()`` returning a
+# JSON-like value; the refresher stores it in the snapshot under ``name``.
+# An optional ``timeout`` (seconds) overrides loading.SOURCE_TIMEOUT.
+class DatasetSource:
+    # Reads one dataset from the file-backed data store
+
+    def __init__(self, name, dataset=None, timeout=None):
+        self.name = name
+        self.dataset = dataset or name
+        self.timeout = timeout
+
+    def fetch(self):
+        return load_dataset(self.dataset)
+
+
+class StaticSource:
+    # Fixed value with optional latency or failure; useful as a local fake
+
+    def __init__(self, name, value, delay=0.0, error=None, timeout=None):
+        self.name = name
+        self.value = value
+        self.delay = delay
+        self.error = error
+        self.timeout = timeout
+
+    def fetch(self):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class Snapshot:
+    __slots__ = ("values", "published_at", "errors")
+
+    def __init__(self, values, published_at, errors):
+        self.values = values
+        self.published_at = published_at
+        self.errors = errors
+
+    def get(self, name, default=None):
+        return self.values.get(name, default)
+
+
+EMPTY_SNAPSHOT = Snapshot(FrozenDict(), 0.0, FrozenDict())
+
+
+class SnapshotRefresher:
+    def __init__(self, sources, interval=REFRESH_INTERVAL, loader=None):
+        self.sources = list(sources)
+        self.interval = interval
+        self.loader = loader or default_loader
+        self._snapshot = EMPTY_SNAPSHOT
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def snapshot(self):
+        # Readers never block: they get whichever snapshot was published last
+        return self._snapshot
+
+    def refresh_once(self):
+        # Sources are fetched concurrently; one that fails or times out
+        # keeps serving its last good value
+        result = self.loader.load(self.sources)
+        snapshot = Snapshot(result.values, time.time(), result.errors)
+        # A single reference assignment is atomic, so readers see either the
+        # old or the new snapshot and never a half-built one
+        self._snapshot = snapshot
+        return snapshot
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.refresh_once()
+        self._thread = threading.Thread(target=self._run, name="dashboard-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh_once()
+            except Exception:
+                logger.exception("Dashboard snapshot refresh failed")
+
+
+DEFAULT_SOURCES = [
+    DatasetSource("kpis"),
+    DatasetSource("phase_completion"),
+]
+
+
+@st.cache_resource(show_spinner=False)
+def get_refresher():
+    # One refresher thread per server process, shared by all sessions
+    refresher = SnapshotRefresher(DEFAULT_SOURCES)
+    refresher.start()
+    return refresher
+
+
+def latest_snapshot():
+    return get_refresher().snapshot
+
+
+def fragment(run_every=None):
+    # st.fragment reruns only the decorated function; it was
+    # st.experimental_fragment before Streamlit 1.37. Older releases have
+    # neither, and the function then just runs with the full page.
+    decorator = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if decorator is None:
+        return lambda func: func
+    return decorator(run_every=run_every or None)
+
+
+def _rerun():
+    (getattr(st, "rerun", None) or st.experimental_rerun)()
+
+
+def poll_while_pending(run_every):
+    # For a section waiting on background work: the decorated function
+    # renders it without blocking and returns True while something is
+    # still pending. The section is a fragment rerunning every `run_every`
+    # seconds only while that is so, and a non-polling fragment otherwise;
+    # when the answer changes the page reruns once to switch between them.
+    def decorate(func):
+        key = f"_pending:{func.__module__}.{func.__qualname__}"
+
+        def settle(polling):
+            pending = bool(func())
+            if pending != polling:
+                st.session_state[key] = pending
+                _rerun()
+
+        @fragment(run_every=run_every)
+        def polling():
+            settle(True)
+
+        @fragment()
+        def settled():
+            settle(False)
+
+        def run():
+            (polling if st.session_state.get(key, False) else settled)()
+
+        return run
+
+    return decorate
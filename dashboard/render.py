@@ -0,0 +1,352 @@
+import html
+
+import streamlit as st
+
+from dashboard import metrics
+from dashboard.diff import is_empty
+from dashboard.hashing import data_version
+from dashboard.shared_cache import cached_call
+
+LEVEL_CLASSES = {
+    "Low": "status-on-track",
+    "Medium": "status-at-risk",
+    "High": "status-escalation",
+}
+
+STATUS_CLASSES = {
+    "ON TRACK": "status-on-track",
+    "AT RISK": "status-at-risk",
+}
+
+
+def _e(value):
+    return html.escape(str(value))
+
+
+def bullet_list_html(items):
+    return "<ul>" + "".join(f"<li>{_e(item)}</li>" for item in items) + "</ul>"
+
+
+def activity_feed_html(activities):
+    return "".join(
+        "<div style='display: flex; margin-bottom: 15px;'>"
+        f"<div style='min-width: 150px; font-weight: 500;'>{_e(activity['date'])}</div>"
+        f"<div>{_e(activity['activity'])}</div>"
+        "</div>"
+        for activity in activities
+    )
+
+
+def risk_table_html(risk_data):
+    rows = []
+    for i, risk in enumerate(risk_data, start=1):
+        impact_class = LEVEL_CLASSES.get(risk["Impact"], "status-escalation")
+        likelihood_class = LEVEL_CLASSES.get(risk["Likelihood"], "status-escalation")
+        rows.append(
+            "<div style='display: flex; margin-bottom: 15px;'>"
+            f"<div style='min-width: 30px; font-weight: 600;'>{i}.</div>"
+            f"<div style='flex-grow: 1;'>{_e(risk['Risk'])}</div>"
+            f"<div style='min-width: 100px;' class='{impact_class}'>Impact: {_e(risk['Impact'])}</div>"
+            f"<div style='min-width: 150px;' class='{likelihood_class}'>Likelihood: {_e(risk['Likelihood'])}</div>"
+            "</div>"
+        )
+    return "".join(rows)
+
+
+def risk_cell_html(cell):
+    # The risks in one risk matrix cell, numbered as in the risk table
+    return "<ul>" + "".join(
+        f"<li><strong>{number}.</strong> {_e(risk)}</li>" for number, risk in zip(cell["Numbers"], cell["Risks"])
+    ) + "</ul>"
+
+
+def status_overview_html(statuses):
+    return "".join(
+        "<div style='display: flex; margin-bottom: 10px;'>"
+        f"<div style='min-width: 250px; font-weight: 500;'>{_e(area)}</div>"
+        f"<div class='{STATUS_CLASSES.get(status, 'status-escalation')}'>{_e(status)}</div>"
+        "</div>"
+        for area, status in statuses.items()
+    )
+
+
+# Entries listed per section of the "What changed" card
+MAX_CHANGES_LISTED = 10
+
+
+def _percent(value):
+    return "—" if value is None else f"{value}%"
+
+
+def _change_list(items):
+    shown = "".join(f"<li>{item}</li>" for item in items[:MAX_CHANGES_LISTED])
+    more = len(items) - MAX_CHANGES_LISTED
+    if more > 0:
+        shown += f"<li>and {more} more</li>"
+    return f"<ul>{shown}</ul>"
+
+
+def _status_span(status):
+    return f"<span class='{STATUS_CLASSES.get(status, 'status-escalation')}'>{_e(status)}</span>"
+
+
+def changes_html(delta):
+    if is_empty(delta):
+        return "<p>Nothing changed.</p>"
+    sections = []
+    if delta["phases"]:
+        sections.append(("Phase completion", [
+            f"{_e(change['phase'])}: {_percent(change['before'])} → {_percent(change['after'])}"
+            for change in delta["phases"]
+        ]))
+    if delta["statuses"]:
+        sections.append(("Status", [
+            f"{_e(change['area'])}: "
+            + " → ".join(_status_span(status) if status else "—" for status in (change["before"], change["after"]))
+            for change in delta["statuses"]
+        ]))
+    risks = (
+        [f"Added: {_e(risk['Risk'])} (Impact: {_e(risk['Impact'])}, Likelihood: {_e(risk['Likelihood'])})"
+         for risk in delta["risks_added"]]
+        + [f"Re-rated: {_e(change['risk'])} "
+           f"(Impact: {_e(change['before']['Impact'])} → {_e(change['after']['Impact'])}, "
+           f"Likelihood: {_e(change['before']['Likelihood'])} → {_e(change['after']['Likelihood'])})"
+           for change in delta["risks_rerated"]]
+        + [f"Removed: {_e(risk['Risk'])}" for risk in delta["risks_removed"]]
+    )
+    if risks:
+        sections.append(("Risks", risks))
+    if delta["activities"]:
+        sections.append(("New activities", [
+            f"<strong>{_e(entry['date'])}</strong> {_e(entry['activity'])}" for entry in delta["activities"]
+        ]))
+    return "".join(f"<h4>{title}</h4>{_change_list(items)}" for title, items in sections)
+
+
+def portfolio_table_html(page):
+    # page: {"rows": [...], "total": n} from Portfolio.query
+    header = "".join(
+        f"<th style='text-align: left; padding: 4px 8px;'>{title}</th>"
+        for title in ("Project", "Owner", "Phase", "Status", "Completion", "Risks")
+    )
+    rows = "".join(
+        "<tr>"
+        f"<td style='padding: 4px 8px;'>{_e(row['name'])}</td>"
+        f"<td style='padding: 4px 8px;'>{_e(row['owner'])}</td>"
+        f"<td style='padding: 4px 8px;'>{_e(row['phase'])}</td>"
+        f"<td style='padding: 4px 8px;'>{_status_span(row['status'])}</td>"
+        f"<td style='padding: 4px 8px;'>{_percent(row['completion'])}</td>"
+        f"<td style='padding: 4px 8px;'>{row['risks']}</td>"
+        "</tr>"
+        for row in page["rows"]
+    )
+    shown = len(page["rows"])
+    caption = f"<p>Showing {shown} of {page['total']} projects.</p>" if shown < page["total"] else ""
+    return f"<table style='width: 100%;'><tr>{header}</tr>{rows}</table>{caption}"
+
+
+def _size(n_bytes):
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if n_bytes < 1024 or unit == "GiB":
+            return f"{n_bytes:.0f} {unit}" if unit == "B" else f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024
+
+
+def _table(header, rows):
+    cell = "padding: 4px 8px; text-align: left;"
+    head = "".join(f"<th style='{cell}'>{title}</th>" for title in header)
+    body = "".join("<tr>" + "".join(f"<td style='{cell}'>{value}</td>" for value in row) + "</tr>" for row in rows)
+    return f"<table style='width: 100%;'><tr>{head}</tr>{body}</table>"
+
+
+def _tiles(items):
+    # A row of (value, label) figures above a card's table
+    tiles = "".join(
+        "<div style='flex: 1; text-align: center;'>"
+        f"<div style='font-size: 1.8rem; font-weight: 700;'>{value}</div><div>{label}</div></div>"
+        for value, label in items
+    )
+    return f"<div style='display: flex; margin-bottom: 15px;'>{tiles}</div>"
+
+
+def _rate_span(rate, warn=0.01, bad=0.05):
+    # Null rates: green below warn, amber below bad, red above
+    css = "status-on-track" if rate < warn else "status-at-risk" if rate < bad else "status-escalation"
+    return f"<span class='{css}'>{rate:.2%}</span>"
+
+
+def profile_files_html(profiles):
+    # One row per profiled custodian file: worst null rate and total type
+    # violations across its columns
+    rows = []
+    for profile in profiles:
+        columns = profile["columns"]
+        worst = max(columns, key=lambda column: column["null_rate"], default=None)
+        violations = sum(column["violations"] for column in columns)
+        rows.append((
+            _e(profile["file"]), _e(profile["custodian"]), f"{profile['rows']:,}", _size(profile["bytes"]),
+            f"{_rate_span(worst['null_rate'])} ({_e(worst['name'])})" if worst else "—",
+            f"<span class='{'status-escalation' if violations else 'status-on-track'}'>{violations:,}</span>",
+        ))
+    return _table(("File", "Custodian", "Rows", "Size", "Worst null rate", "Type violations"), rows)
+
+
+def column_profile_html(profile):
+    rows = []
+    for column in profile["columns"]:
+        quantiles = column["quantiles"]
+        spread = " / ".join(_e(quantiles.get(key, "—")) for key in ("p01", "p50", "p99")) if quantiles else "—"
+        examples = ", ".join(f"<code>{_e(value)}</code>" for value in column["examples"])
+        rows.append((
+            _e(column["name"]), _e(column["type"]), _rate_span(column["null_rate"]), f"~{column['distinct']:,}",
+            "—" if column["min"] is None else f"{_e(column['min'])} – {_e(column['max'])}", spread,
+            f"{column['violations']:,}" + (f" ({examples})" if examples else ""),
+        ))
+    return _table(("Column", "Type", "Nulls", "Distinct", "Range", "p1 / p50 / p99", "Type violations"), rows)
+
+
+# Layouts listed in the schema detection panel, most files first
+MAX_LAYOUTS_LISTED = 15
+
+
+def schema_run_html(report):
+    # report: {"run": last_run.json, "layouts": layouts.json}
+    run, layouts = report["run"], report["layouts"]
+    tiles = _tiles((
+        (f"{run['processed']:,} / {run['files']:,}", "Files processed"),
+        (f"{run['matched']:,}", "Schemas matched"),
+        (f"{len(run['new_layouts']):,}", "New layouts inferred"),
+        (f"{len(run['failed']):,}", "Failed"),
+    ))
+    ranked = sorted(run["layout_files"].items(), key=lambda item: (-item[1], item[0]))
+    rows = []
+    for layout_id, count in ranked[:MAX_LAYOUTS_LISTED]:
+        layout = layouts.get(layout_id, {})
+        columns = layout.get("columns", [])
+        mapped = sum(1 for column in columns if column.get("maps_to"))
+        rows.append((
+            _e(layout.get("name", layout_id)) + (" <em>(new)</em>" if layout_id in run["new_layouts"] else "")
+            + (f"<br><small>e.g. {_e(layout['example'])}</small>" if layout.get("example") else ""),
+            f"{count:,}", len(columns), f"{mapped} of {len(columns)}",
+        ))
+    more = len(ranked) - MAX_LAYOUTS_LISTED
+    caption = f"<p>and {more} more layouts</p>" if more > 0 else ""
+    failures = _change_list([f"{_e(failure['file'])}: {_e(failure['error'])}" for failure in run["failed"]]) if run["failed"] else ""
+    return (
+        tiles + _table(("Layout", "Files", "Columns", "Mapped to known fields"), rows) + caption + failures
+    )
+
+
+def _money(amount):
+    return f"${amount:,.2f}" if amount is not None else "—"
+
+
+def reconciliation_html(result):
+    # result: a dashboard.reconcile.reconcile summary
+    left, right = result["left"]["custodian"], result["right"]["custodian"]
+    counts, amounts = result["counts"], result["amounts"]
+    breaks = counts["mismatched"] + counts["missing_left"] + counts["missing_right"]
+    tiles = _tiles((
+        (f"<span class='{'status-on-track' if result['match_rate'] >= 0.99 else 'status-at-risk'}'>{result['match_rate']:.2%}</span>", "Matched or within tolerance"),
+        (f"{result['keys']:,}", "Positions compared"),
+        (f"{breaks:,}", "Breaks"),
+        (_money(amounts["mismatched"] + amounts["missing_left"] + amounts["missing_right"]), "Break amount"),
+    ))
+    labels = {
+        "matched": "Matched",
+        "within_tolerance": "Within tolerance",
+        "mismatched": "Mismatched",
+        "missing_left": f"Only at {_e(right)}",
+        "missing_right": f"Only at {_e(left)}",
+    }
+    summary = _table(
+        ("Class", "Positions", "Difference"),
+        [(labels[name], f"{counts[name]:,}", _money(amounts[name])) for name in labels],
+    )
+    top = _table(
+        ("Account", "CUSIP", "Date", _e(left), _e(right), "Difference", "Class"),
+        [
+            (_e(row["account"]), _e(row["security"]), _e(row["date"]), _money(row["value_left"]),
+             _money(row["value_right"]), _money(row["difference"]), labels[row["class"]])
+            for row in result["top_breaks"]
+        ],
+    ) if result["top_breaks"] else ""
+    dropped = result["left"]["dropped"] + result["right"]["dropped"]
+    caption = f"<p>{dropped:,} rows without a usable key or market value were left out.</p>" if dropped else ""
+    return tiles + summary + ("<h4>Largest breaks</h4>" + top if top else "") + caption
+
+
+def _compact_money(amount):
+    for scale, suffix in ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if abs(amount) >= scale:
+            return f"${amount / scale:,.1f}{suffix}"
+    return f"${amount:,.0f}"
+
+
+# Flags listed in the AUA anomalies card, newest first
+MAX_ANOMALIES_LISTED = 15
+
+
+def anomalies_html(report):
+    # report: {"summary": AnomalyDetector.summary(), "flags": [...]}
+    summary, flags = report["summary"], report["flags"]
+    recent = [flag for flag in flags if summary["through"] and flag["date"] >= report["recent_since"]]
+    tiles = _tiles((
+        (f"{summary['series']:,}", "Series monitored"),
+        (_e(summary["through"] or "—"), "Data through"),
+        (f"<span class='{'status-at-risk' if recent else 'status-on-track'}'>{len(recent):,}</span>", "Flags, last 30 days"),
+        (f"{summary['threshold']:g}", "Score threshold"),
+    ))
+    if not flags:
+        return tiles + "<p>No anomalies flagged.</p>"
+    rows = [
+        (_e(flag["date"]), _e(flag["series"]), _compact_money(flag["previous"]), _compact_money(flag["value"]),
+         f"{flag['change']:+.2%}", f"<span class='status-escalation'>{flag['score']:+.1f}</span>",
+         "—" if flag["zscore"] is None else f"{flag['zscore']:+.1f}")
+        for flag in flags[:MAX_ANOMALIES_LISTED]
+    ]
+    more = len(flags) - MAX_ANOMALIES_LISTED
+    caption = f"<p>and {more} earlier flags</p>" if more > 0 else ""
+    return tiles + _table(("Date", "Series", "Previous", "Value", "Change", "Robust score", "z-score"), rows) + caption
+
+
+BLOCK_BUILDERS = {
+    "bullets": bullet_list_html,
+    "activities": activity_feed_html,
+    "risk_table": risk_table_html,
+    "risk_cell": risk_cell_html,
+    "status_overview": status_overview_html,
+    "changes": changes_html,
+    "portfolio_table": portfolio_table_html,
+    "profile_files": profile_files_html,
+    "column_profile": column_profile_html,
+    "schema_run": schema_run_html,
+    "reconciliation": reconciliation_html,
+    "anomalies": anomalies_html,
+}
+
+
+def card_html(title, body):
+    # Everything inside one markdown element, so the card div really wraps it
+    return f"<div class='card'><div class='sub-header'>{_e(title)}</div>{body}</div>"
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _cached_block(name, version, title, _data):
+    metrics.record_miss()
+    body = cached_call(BLOCK_BUILDERS[name], (version,), _data)
+    return card_html(title, body) if title is not None else body
+
+
+def get_block(name, data, title=None):
+    with metrics.cache_lookup("html_block"):
+        return _cached_block(name, data_version(data), title, data)
+
+
+def render_block(name, data, title=None):
+    # One st.markdown call (one delta message) for the whole section
+    st.markdown(get_block(name, data, title), unsafe_allow_html=True)
+
+
+def invalidate_blocks():
+    _cached_block.clear()
@@ -0,0 +1,302 @@
+import concurrent.futures
+import csv
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+from datetime import datetime
+
+from dashboard.data import DATA_DIR, DataStore
+from dashboard.shared_cache import _FileLock
+
+logger = logging.getLogger(__name__)
+
+# Nightly RPAG drop (delimited text files in many layouts)
+RPAG_DIR = os.environ.get("DASHBOARD_RPAG_DIR", os.path.join(DATA_DIR, "rpag"))
+
+# Known layouts (layouts.json), the per-file fingerprint cache (files.json)
+# and the last run's summary (last_run.json)
+SCHEMA_DIR = os.environ.get("DASHBOARD_SCHEMA_DIR", os.path.join(DATA_DIR, "schemas"))
+
+# How much of each file is read to fingerprint it
+SAMPLE_BYTES = 64 * 1024
+SAMPLE_ROWS = 20
+
+# Rows read when inferring an unseen layout
+INFER_ROWS = 5000
+
+DELIMITERS = [",", "|", "\t", ";"]
+
+DATE_FORMATS = ["%Y-%m-%d", "%m/%d/%Y", "%Y%m%d", "%d-%b-%Y", "%m/%d/%y"]
+
+# Canonical fields a layout's columns are mapped to, by normalized name
+FIELD_SYNONYMS = {
+    "plan_id": ["planid", "plannumber", "planno", "plan", "contractid", "contractnumber"],
+    "participant_id": ["participantid", "participant", "ssn", "memberid", "employeeid"],
+    "fund_id": ["fundid", "fundcode", "cusip", "ticker", "investmentid"],
+    "fund_name": ["fundname", "investmentname", "securityname", "secname", "description"],
+    "units": ["units", "shares", "quantity", "unitbalance"],
+    "price": ["price", "nav", "unitvalue", "shareprice"],
+    "market_value": ["marketvalue", "mktval", "balance", "amount", "value"],
+    "as_of_date": ["asofdate", "asofdt", "valuationdate", "effectivedate", "tradedate", "date"],
+}
+_FIELD_BY_NAME = {synonym: field for field, synonyms in FIELD_SYNONYMS.items() for synonym in synonyms}
+
+_NUMBER = re.compile(r"^[+-]?(\d[\d,]*\.?\d*|\.\d+)$")
+_INTEGER = re.compile(r"^[+-]?\d+$")
+
+
+def normalize(name):
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def _value_class(value):
+    value = value.strip()
+    if not value:
+        return "empty"
+    if _NUMBER.match(value):
+        return "number"
+    if any(_parses(value, fmt) for fmt in DATE_FORMATS):
+        return "date"
+    return "text"
+
+
+def _parses(value, fmt):
+    try:
+        datetime.strptime(value, fmt)
+        return True
+    except ValueError:
+        return False
+
+
+def sample(path):
+    # Structural fingerprint from the first rows: delimiter, header names
+    # (normalized, in order) or, without a header, column count and the
+    # value class of each column. Files in the same layout share it
+    # whatever their data.
+    with open(path, "rb") as f:
+        raw = f.read(SAMPLE_BYTES)
+    lines = raw.decode("utf-8-sig", errors="replace").splitlines()
+    if len(raw) == SAMPLE_BYTES:
+        lines = lines[:-1]  # probably cut off
+    lines = [line for line in lines[:SAMPLE_ROWS + 1] if line.strip()]
+    if not lines:
+        raise ValueError("empty file")
+
+    # The delimiter that splits every sampled line into the same, largest
+    # number of fields
+    def score(delimiter):
+        counts = {len(row) for row in csv.reader(lines, delimiter=delimiter)}
+        return (len(counts) == 1, max(counts))
+
+    delimiter = max(DELIMITERS, key=score)
+    rows = list(csv.reader(lines, delimiter=delimiter))
+    first, data = rows[0], rows[1:]
+    has_header = (
+        all(_value_class(cell) == "text" for cell in first)
+        and len({normalize(cell) for cell in first}) == len(first)
+        and (not data or any(_value_class(cell) != "text" for row in data for cell in row))
+    )
+    if has_header:
+        structure = ["header", delimiter, [normalize(cell) for cell in first]]
+    else:
+        classes = []
+        for column in zip(*rows):
+            present = [_value_class(cell) for cell in column if cell.strip()]
+            classes.append(max(set(present), key=present.count) if present else "empty")
+        structure = ["positional", delimiter, len(first), classes]
+    fingerprint = hashlib.sha1(json.dumps(structure).encode("utf-8")).hexdigest()[:16]
+    return {"fingerprint": fingerprint, "delimiter": delimiter, "has_header": has_header}
+
+
+def _column_type(values):
+    present = [value.strip() for value in values if value.strip()]
+    if not present:
+        return "empty"
+    # Dates first: 20250306 is a date before it is an integer
+    for fmt in DATE_FORMATS:
+        if all(_parses(value, fmt) for value in present):
+            return f"date:{fmt}"
+    if all(_INTEGER.match(value) for value in present):
+        return "integer"
+    if all(_NUMBER.match(value) for value in present):
+        return "decimal"
+    if {value.upper() for value in present} <= {"Y", "N", "TRUE", "FALSE", "0", "1"}:
+        return "boolean"
+    return "text"
+
+
+def infer_layout(path, delimiter, has_header):
+    # Full inference for an unseen fingerprint; runs in a worker process.
+    # Types come from up to INFER_ROWS rows; columns are mapped to
+    # canonical fields by name.
+    with open(path, newline="", encoding="utf-8-sig", errors="replace") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        rows = [row for _, row in zip(range(INFER_ROWS + 1), reader)]
+    header = rows[0] if has_header else [f"column_{i + 1}" for i in range(len(rows[0]))]
+    data = rows[1:] if has_header else rows
+    columns = []
+    for i, name in enumerate(header):
+        values = [row[i] for row in data if i < len(row)]
+        columns.append({
+            "name": name,
+            "type": _column_type(values),
+            "null_rate": round(1 - sum(1 for value in values if value.strip()) / len(values), 4) if values else 1.0,
+            "maps_to": _FIELD_BY_NAME.get(normalize(name)) if has_header else None,
+        })
+    return {"delimiter": delimiter, "has_header": has_header, "columns": columns}
+
+
+def _layout_name(path):
+    # "rpag_plan0042_20250306.csv" -> "rpag_plan#_#"
+    stem = os.path.basename(path).split(".")[0]
+    return re.sub(r"\d+", "#", stem)
+
+
+def _write_json(path, value):
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(value, f)
+    os.replace(tmp, path)
+
+
+class SchemaIndex:
+    # Known layouts keyed by id, an index from structural fingerprint to
+    # layout id, and a cache of each file's fingerprint by (size, mtime) so
+    # an unchanged file is not even sampled again
+
+    def __init__(self, directory=SCHEMA_DIR):
+        self.directory = directory
+        self.layouts = self._read("layouts.json", {})
+        self.files = self._read("files.json", {})
+        self.by_fingerprint = {
+            fingerprint: layout_id
+            for layout_id, layout in self.layouts.items()
+            for fingerprint in layout.get("fingerprints", [])
+        }
+
+    def _read(self, name, default):
+        try:
+            with open(os.path.join(self.directory, name)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+
+    def add_layout(self, fingerprint, layout, name, example):
+        layout_id = f"auto-{fingerprint[:8]}"
+        self.layouts[layout_id] = dict(layout, name=name, example=example, fingerprints=[fingerprint], learned_at=time.time())
+        self.by_fingerprint[fingerprint] = layout_id
+        return layout_id
+
+    def save(self, last_run=None):
+        os.makedirs(self.directory, exist_ok=True)
+        with _FileLock(os.path.join(self.directory, ".lock")):
+            _write_json(os.path.join(self.directory, "layouts.json"), self.layouts)
+            _write_json(os.path.join(self.directory, "files.json"), self.files)
+            if last_run is not None:
+                _write_json(os.path.join(self.directory, "last_run.json"), last_run)
+
+
+def _sample_cached(index, path):
+    stat = os.stat(path)
+    signature = [stat.st_size, stat.st_mtime_ns]
+    cached = index.files.get(path)
+    if cached is not None and cached["signature"] == signature:
+        return cached
+    entry = dict(sample(path), signature=signature)
+    index.files[path] = entry
+    return entry
+
+
+def detect(paths, index, workers=None, io_threads=16):
+    # Fingerprints every file (threads: I/O bound, reads SAMPLE_BYTES each),
+    # matches known fingerprints through the index and infers each unseen
+    # fingerprint once, from its first file, in a process pool. Returns the
+    # run summary.
+    started = time.time()
+    began = time.perf_counter()
+    failures = []
+    groups = {}  # fingerprint -> [paths]
+    samples = {}
+    with concurrent.futures.ThreadPoolExecutor(io_threads) as pool:
+        for path, future in [(path, pool.submit(_sample_cached, index, path)) for path in paths]:
+            try:
+                entry = future.result()
+            except Exception as exc:
+                failures.append({"file": os.path.basename(path), "error": repr(exc)})
+                continue
+            samples[entry["fingerprint"]] = samples.get(entry["fingerprint"]) or (path, entry)
+            groups.setdefault(entry["fingerprint"], []).append(path)
+
+    unseen = [fingerprint for fingerprint in groups if fingerprint not in index.by_fingerprint]
+    new_layouts = []
+    if unseen:
+        with concurrent.futures.ProcessPoolExecutor(workers or os.cpu_count()) as pool:
+            futures = {
+                fingerprint: pool.submit(infer_layout, samples[fingerprint][0], samples[fingerprint][1]["delimiter"], samples[fingerprint][1]["has_header"])
+                for fingerprint in unseen
+            }
+            for fingerprint, future in futures.items():
+                path = samples[fingerprint][0]
+                try:
+                    layout = future.result()
+                except Exception as exc:
+                    failures.extend({"file": os.path.basename(p), "error": repr(exc)} for p in groups.pop(fingerprint))
+                    continue
+                new_layouts.append(index.add_layout(fingerprint, layout, _layout_name(path), os.path.basename(path)))
+
+    layout_files = {}
+    for fingerprint, group in groups.items():
+        layout_id = index.by_fingerprint[fingerprint]
+        layout_files[layout_id] = layout_files.get(layout_id, 0) + len(group)
+    inferred = sum(len(groups[fingerprint]) for fingerprint in unseen if fingerprint in groups)
+    processed = sum(len(group) for group in groups.values())
+    summary = {
+        "started_at": started,
+        "seconds": round(time.perf_counter() - began, 3),
+        "files": len(paths),
+        "processed": processed,
+        "matched": processed - inferred,
+        "inferred": inferred,
+        "new_layouts": new_layouts,
+        "failed": failures,
+        "layout_files": layout_files,
+    }
+    return summary
+
+
+def rpag_files(directory=RPAG_DIR):
+    try:
+        return sorted(entry.path for entry in os.scandir(directory) if entry.is_file() and not entry.name.startswith("."))
+    except FileNotFoundError:
+        return []
+
+
+def run(directory=RPAG_DIR, schema_dir=SCHEMA_DIR, workers=None):
+    index = SchemaIndex(schema_dir)
+    summary = detect(rpag_files(directory), index, workers=workers)
+    # Files that left the drop need not stay in the cache
+    index.files = {path: entry for path, entry in index.files.items() if os.path.exists(path)}
+    index.save(last_run=summary)
+    return summary, index
+
+
+# Read side for the dashboard: parsed once per file change, like data/
+results = DataStore(SCHEMA_DIR, {"last_run": "last_run.json", "layouts": "layouts.json"})
+
+
+def last_run():
+    try:
+        return results.get("last_run")
+    except FileNotFoundError:
+        return None
+
+
+def known_layouts():
+    try:
+        return results.get("layouts")
+    except FileNotFoundError:
+        return {}
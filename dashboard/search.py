@@ -0,0 +1,286 @@
+import ast
+import bisect
+import functools
+import hashlib
+import html
+import importlib.util
+import json
+import os
+import re
+
+import streamlit as st
+
+from dashboard import activity_log, data
+from dashboard.data import load_dataset
+from dashboard.views import PAGES
+
+MAX_RESULTS = 20
+SNIPPET_CHARS = 140
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_TAG = re.compile(r"<[^>]+>")
+_HEADER_DIV = re.compile(r"class='(?:main-header|sub-header)'>([^<]+)<")
+
+# Dataset -> (page, section); a None section means "one section per key"
+DATASET_SECTIONS = {
+    "achievements": ("Executive Dashboard", "Key Achievements"),
+    "challenges": ("Executive Dashboard", "Critical Challenges"),
+    "risk_data": ("Project Status", "Risks & Issues"),
+    "ai_ml_roadmap_phases": ("AI/ML Roadmap", None),
+    "success_metrics": ("AI/ML Roadmap", None),
+    "strategic_recommendations": ("Strategic Recommendations", None),
+}
+
+# st.* calls whose first argument is displayed text
+TEXT_CALLS = {"markdown", "info", "success", "warning", "error", "caption", "write"}
+
+# Headings as the browser sees them: markdown "#" headings, the header divs
+# and card titles (render.card_html)
+HEADING_SELECTOR = "h1, h2, h3, h4, .main-header, .sub-header"
+
+# Scrolls to the first heading reading parts[0], then to the first heading
+# after it reading parts[1], and so on. The page renders after the sidebar
+# and replaces the previous page's elements, so the first look is delayed
+# and it retries until the headings exist.
+SCROLL_SCRIPT = """<script>
+(function (parts, tries) {
+  const norm = (text) => text.replace(/\\s+/g, " ").trim().toLowerCase();
+  const seek = () => {
+    const headings = Array.from(document.querySelectorAll(%(selector)s));
+    let found = null, start = 0;
+    for (const part of parts) {
+      const index = headings.findIndex((h, i) => i >= start && norm(h.textContent) === norm(part));
+      if (index < 0) break;
+      found = headings[index];
+      start = index + 1;
+    }
+    if (found) found.scrollIntoView({behavior: "smooth", block: "start"});
+    else if (--tries > 0) setTimeout(seek, 150);
+  };
+  setTimeout(seek, 300);
+})(%(parts)s, 20);
+</script><!-- %(nonce)s -->"""
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def _clean(text):
+    text = html.unescape(_TAG.sub(" ", text))
+    return re.sub(r"[*`#]+", "", text).strip(" -\t")
+
+
+class _PageText(ast.NodeVisitor):
+    # Collects (section, text) from the string literals a view passes to
+    # st.markdown and friends, in source order. "###" headings and header
+    # divs start a section, "####" headings a subsection.
+
+    def __init__(self):
+        self.section = None
+        self.subsection = None
+        self.items = []
+
+    def visit_Call(self, node):
+        func = node.func
+        name = func.attr if isinstance(func, ast.Attribute) else None
+        if name in TEXT_CALLS and node.args:
+            text = self._literal(node.args[0])
+            if text:
+                self._add(text)
+        self.generic_visit(node)
+
+    @staticmethod
+    def _literal(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        if isinstance(node, ast.JoinedStr):
+            # Keep the literal parts of f-strings
+            return "".join(v.value for v in node.values if isinstance(v, ast.Constant))
+        return None
+
+    def _add(self, text):
+        header = _HEADER_DIV.search(text)
+        if header:
+            self.section, self.subsection = header.group(1).strip(), None
+            return
+        for line in text.splitlines():
+            stripped = line.strip()
+            if stripped.startswith("#### "):
+                self.subsection = _clean(stripped)
+            elif stripped.startswith("#"):
+                self.section, self.subsection = _clean(stripped), None
+            else:
+                cleaned = _clean(stripped)
+                if cleaned:
+                    section = " › ".join(part for part in (self.section, self.subsection) if part)
+                    self.items.append((section, cleaned))
+
+
+def _view_source(module_name):
+    # Read the page module's source without importing it, so pages stay
+    # lazily imported
+    spec = importlib.util.find_spec(module_name)
+    with open(spec.origin, encoding="utf-8") as f:
+        return f.read()
+
+
+def content_version():
+    # Changes whenever any indexed data file, the activity log or a page's
+    # source changes
+    parts = [sorted(data.store.versions().items()), activity_log.log.version()]
+    for module_name, _ in PAGES.values():
+        stat = os.stat(importlib.util.find_spec(module_name).origin)
+        parts.append((module_name, stat.st_mtime_ns, stat.st_size))
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+
+def collect_documents():
+    # (page, section, text) for everything the dashboard displays
+    documents = []
+    for page, (module_name, _) in PAGES.items():
+        visitor = _PageText()
+        visitor.visit(ast.parse(_view_source(module_name)))
+        documents.extend((page, section, text) for section, text in visitor.items)
+
+    for name, (page, section) in DATASET_SECTIONS.items():
+        value = load_dataset(name)
+        if isinstance(value, dict):
+            for key, items in value.items():
+                documents.append((page, key, key))
+                documents.extend((page, key, str(item)) for item in items)
+        elif name == "risk_data":
+            documents.extend(
+                (page, section, f"{risk['Risk']} (Impact: {risk['Impact']}, Likelihood: {risk['Likelihood']})")
+                for risk in value
+            )
+        else:
+            documents.extend((page, section, str(item)) for item in value)
+
+    log = activity_log.log
+    documents.extend(
+        ("Project Status", "Recent Activities", f"{entry['date']}: {entry['activity']}")
+        for entry in log.read(log.matching())
+    )
+
+    # The same text often appears in a dataset and inline on a page
+    seen = set()
+    unique = []
+    for document in documents:
+        key = (document[0], document[2].lower())
+        if key not in seen:
+            seen.add(key)
+            unique.append(document)
+    return unique
+
+
+class SearchIndex:
+    # Positional inverted index: token -> {doc id: positions}. Bare query
+    # terms match as prefixes (bisect over the sorted vocabulary), "quoted
+    # phrases" match consecutive exact tokens; all parts must match.
+
+    def __init__(self, documents):
+        self.documents = documents
+        postings = {}
+        for doc_id, (_, _, text) in enumerate(documents):
+            for position, token in enumerate(tokenize(text)):
+                postings.setdefault(token, {}).setdefault(doc_id, []).append(position)
+        self.postings = postings
+        self.vocabulary = sorted(postings)
+        # Queries repeat across reruns and sessions; the index never changes
+        self.search = functools.lru_cache(maxsize=1024)(self._search)
+
+    def _prefix(self, prefix):
+        counts = {}
+        vocabulary = self.vocabulary
+        for i in range(bisect.bisect_left(vocabulary, prefix), len(vocabulary)):
+            token = vocabulary[i]
+            if not token.startswith(prefix):
+                break
+            for doc_id, positions in self.postings[token].items():
+                counts[doc_id] = counts.get(doc_id, 0) + len(positions)
+        return counts
+
+    def _phrase(self, tokens):
+        lists = [self.postings.get(token) for token in tokens]
+        if not lists or any(postings is None for postings in lists):
+            return {}
+        counts = {}
+        for doc_id in set(lists[0]).intersection(*lists[1:]):
+            following = [set(postings[doc_id]) for postings in lists[1:]]
+            hits = sum(
+                1 for start in lists[0][doc_id]
+                if all(start + offset in positions for offset, positions in enumerate(following, start=1))
+            )
+            if hits:
+                counts[doc_id] = hits
+        return counts
+
+    def _search(self, query, limit=MAX_RESULTS):
+        phrases = re.findall(r'"([^"]+)"', query)
+        terms = tokenize(re.sub(r'"[^"]*"?', " ", query))
+        parts = [self._phrase(tokenize(phrase)) for phrase in phrases if tokenize(phrase)]
+        parts += [self._prefix(term) for term in terms]
+        if not parts:
+            return ()
+        parts.sort(key=len)
+        scores = dict(parts[0])
+        for part in parts[1:]:
+            scores = {doc_id: score + part[doc_id] for doc_id, score in scores.items() if doc_id in part}
+            if not scores:
+                return ()
+        ranked = sorted(scores, key=lambda doc_id: (-scores[doc_id], doc_id))[:limit]
+        return tuple(self.documents[doc_id] for doc_id in ranked)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _index(version):
+    return SearchIndex(collect_documents())
+
+
+def search(query, limit=MAX_RESULTS):
+    return _index(content_version()).search(query.strip(), limit)
+
+
+def snippet(text, query):
+    # Window of the text around the first matching word
+    words = tokenize(query.replace('"', " "))
+    lowered = text.lower()
+    hits = [index for index in (lowered.find(word) for word in words) if index >= 0]
+    start = max(min(hits) - SNIPPET_CHARS // 3, 0) if hits else 0
+    piece = text[start:start + SNIPPET_CHARS]
+    return ("…" if start else "") + piece + ("…" if start + SNIPPET_CHARS < len(text) else "")
+
+
+def scroll_script(section, nonce):
+    # The nonce makes a repeated jump to the same section a new element,
+    # so the script runs again
+    parts = json.dumps(section.split(" › ")).replace("</", "<\\/")
+    return SCROLL_SCRIPT % {"selector": json.dumps(HEADING_SELECTOR), "parts": parts, "nonce": nonce}
+
+
+def _open_page(page, section):
+    st.session_state.page = page
+    if section:
+        st.session_state.search_jumps = st.session_state.get("search_jumps", 0) + 1
+        st.session_state.search_jump = section
+
+
+def render_search():
+    query = st.sidebar.text_input("Search", key="search_query", placeholder='e.g. governance or "data quality"')
+    # A result clicked on the last rerun: scroll the page to its section once
+    section = st.session_state.pop("search_jump", None)
+    if section:
+        st.sidebar.html(scroll_script(section, st.session_state.search_jumps), unsafe_allow_javascript=True)
+    if not query.strip():
+        return
+    results = search(query)
+    if not results:
+        st.sidebar.caption("No matches.")
+        return
+    for i, (page, section, text) in enumerate(results):
+        st.sidebar.button(
+            f"{page} › {section}" if section else page, key=f"search_result_{i}",
+            on_click=_open_page, args=(page, section),
+        )
+        st.sidebar.caption(snippet(text, query))
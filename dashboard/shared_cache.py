@@ -0,0 +1,220 @@
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import tempfile
+import time
+
+from dashboard import metrics
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, just recompute
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# All dashboard processes on a host share this directory. Set
+# DASHBOARD_SHARED_CACHE=0 to keep caching per process only.
+SHARED_CACHE_ENABLED = os.environ.get("DASHBOARD_SHARED_CACHE", "1") != "0"
+SHARED_CACHE_DIR = os.environ.get(
+    "DASHBOARD_SHARED_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), f"gg-dashboard-cache-{os.getuid() if hasattr(os, 'getuid') else 0}"),
+)
+SHARED_CACHE_MAX_BYTES = int(os.environ.get("DASHBOARD_SHARED_CACHE_MAX_BYTES", str(256 * 2**20)))
+
+# Eviction trims the cache to this fraction of the limit so it does not run
+# on every write once the cache is full
+EVICT_TO = 0.8
+
+
+@functools.lru_cache(maxsize=None)
+def code_version(func):
+    # Artifacts built by changed code must not be reused; hashing the whole
+    # module also covers the helpers the builder calls
+    try:
+        with open(inspect.getsourcefile(func), "rb") as f:
+            source = f.read()
+    except (OSError, TypeError):
+        source = func.__qualname__.encode("utf-8")
+    return hashlib.sha1(source).hexdigest()[:12]
+
+
+def artifact_key(*parts):
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+class _FileLock:
+    def __init__(self, path, blocking=True):
+        self.path = path
+        self.blocking = blocking
+        self.fd = None
+        self.acquired = False
+
+    def __enter__(self):
+        if fcntl is None:
+            self.acquired = True
+            return self
+        self.fd = os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600)
+        flags = fcntl.LOCK_EX if self.blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            fcntl.flock(self.fd, flags)
+            self.acquired = True
+        except BlockingIOError:
+            self.acquired = False
+        return self
+
+    def __exit__(self, *exc):
+        if self.fd is not None:
+            if self.acquired:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+
+
+class DiskCache:
+    # Content-addressed pickles under <directory>/<key[:2]>/<key>. Writes go
+    # to a temp file and are renamed into place, so readers never see a
+    # partial file. File mtime is bumped on every hit and eviction drops the
+    # least recently used files once the total size passes max_bytes.
+
+    def __init__(self, directory, max_bytes=SHARED_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # Never unpickle files another user could have planted
+        if hasattr(os, "getuid") and os.stat(directory).st_uid != os.getuid():
+            raise PermissionError(f"{directory} is not owned by this user")
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return default
+        except (EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            logger.warning("Discarding unreadable cache entry %s", key)
+            self._remove(path)
+            return default
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except BaseException:
+            self._remove(tmp)
+            raise
+        self.evict()
+
+    def get_or_compute(self, key, compute):
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            metrics.CACHE_REQUESTS.inc(cache="shared", result="hit")
+            return value
+
+        # One process computes, the others wait on the lock and then read
+        # the artifact it wrote
+        lock_path = self._path(key) + ".lock"
+        os.makedirs(os.path.dirname(lock_path), mode=0o700, exist_ok=True)
+        with _FileLock(lock_path):
+            value = self.get(key, missing)
+            if value is not missing:
+                metrics.CACHE_REQUESTS.inc(cache="shared", result="hit")
+                return value
+            metrics.CACHE_REQUESTS.inc(cache="shared", result="miss")
+            value = compute()
+            self.set(key, value)
+        self._remove(lock_path)
+        return value
+
+    def entries(self):
+        for dirpath, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                if filename.startswith(".") or filename.endswith(".lock"):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        # Only one process evicts at a time; the rest skip it
+        with _FileLock(os.path.join(self.directory, ".evict.lock"), blocking=False) as lock:
+            if not lock.acquired:
+                return 0
+            entries = list(self.entries())
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_bytes:
+                return 0
+            removed = 0
+            target = self.max_bytes * EVICT_TO
+            for path, size, _ in sorted(entries, key=lambda entry: entry[2]):
+                if total <= target:
+                    break
+                self._remove(path)
+                total -= size
+                removed += 1
+            return removed
+
+    def clear(self):
+        for path, _, _ in list(self.entries()):
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+_cache = None
+_cache_failed_at = 0.0
+
+
+def shared_cache():
+    global _cache, _cache_failed_at
+    if not SHARED_CACHE_ENABLED:
+        return None
+    if _cache is None and time.time() - _cache_failed_at > 60:
+        try:
+            _cache = DiskCache(SHARED_CACHE_DIR)
+        except OSError as exc:
+            logger.warning("Shared cache disabled: %s", exc)
+            _cache_failed_at = time.time()
+    return _cache
+
+
+def cached_call(builder, key_parts, *args, **kwargs):
+    # builder(*args, **kwargs) through the host-wide cache. key_parts must
+    # identify the inputs (e.g. their data version); the builder's module
+    # and code version are added to the key here.
+    cache = shared_cache()
+    if cache is None:
+        return builder(*args, **kwargs)
+    key = artifact_key(builder.__module__, builder.__qualname__, code_version(builder), key_parts)
+    try:
+        return cache.get_or_compute(key, lambda: builder(*args, **kwargs))
+    except OSError as exc:
+        logger.warning("Shared cache unavailable, building locally: %s", exc)
+        return builder(*args, **kwargs)
@@ -0,0 +1,32 @@
+import os
+
+import streamlit as st
+
+from dashboard.assets import asset_url, image_html, minify_css
+
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles.css")
+
+# Set when static/ is fronted by a server that sends .css as text/css.
+# Streamlit's own static handler serves .css as text/plain with nosniff,
+# which browsers refuse to apply, so by default the CSS is inlined.
+LINK_STYLESHEET = os.environ.get("DASHBOARD_LINK_STYLESHEET", "") == "1"
+
+
+@st.cache_resource(show_spinner=False)
+def _inline_stylesheet(mtime_ns):
+    with open(CSS_PATH) as f:
+        return f"<style>{minify_css(f.read())}</style>"
+
+
+def stylesheet_html():
+    url = asset_url("styles.css") if LINK_STYLESHEET else None
+    if url is not None:
+        return f"<link rel='stylesheet' href='{url}'>"
+    return _inline_stylesheet(os.stat(CSS_PATH).st_mtime_ns)
+
+
+def inject_css():
+    logo = image_html("gg_logo.png", "Great Gray Trust Company Logo", placeholder=False)
+    if logo:
+        logo = f"<div class='sidebar-logo'>{logo}</div>"
+    st.markdown(stylesheet_html() + logo, unsafe_allow_html=True)
@@ -0,0 +1,21 @@
+import importlib
+
+# Sidebar label -> (module, page function). Modules are imported on first
+# visit only, so a page's data and heavy imports (pandas, plotly) are not
+# paid for by sessions that never open it.
+PAGES = {
+    "Executive Dashboard": ("dashboard.views.executive", "executive_dashboard"),
+    "Project Status": ("dashboard.views.project_status", "project_status_page"),
+    "Analytics Hub": ("dashboard.views.analytics_hub", "analytics_hub"),
+    "Data Quality": ("dashboard.views.data_quality", "data_quality_page"),
+    "AI/ML Roadmap": ("dashboard.views.ai_ml_roadmap", "ai_ml_roadmap"),
+    "Strategic Recommendations": ("dashboard.views.strategic_recommendations", "strategic_recommendations"),
+}
+
+
+def load_page(title):
+    module_name, function_name = PAGES[title]
+    # import_module returns the sys.modules entry after the first import,
+    # so subsequent reruns only pay a dict lookup
+    module = importlib.import_module(module_name)
+    return getattr(module, function_name)
@@ -0,0 +1,266 @@
+import streamlit as st
+
+from dashboard.figures import render_figure
+from dashboard.history import viewing_date
+from dashboard.loading import load_sources, render_load_notice
+from dashboard.refresh import DatasetSource
+from dashboard.render import render_block
+
+SOURCES = [DatasetSource("timeline_data"), DatasetSource("success_metrics")]
+
+
+def ai_ml_roadmap():
+    data = load_sources(SOURCES)
+    timeline_data = data.get("timeline_data", ())
+    success_metrics = data.get("success_metrics", {})
+    
+    st.markdown("<div class='main-header'>AI/ML Technical Roadmap</div>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Q2 2025 - Q2 2026</div>", unsafe_allow_html=True)
+    render_load_notice(data)
+    
+    # Executive summary
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### Executive Summary")
+    st.markdown("""
+    This technical roadmap outlines a structured approach to implementing AI/ML capabilities at Great Gray, with a strong focus on addressing immediate data quality and processing challenges while building toward a scalable Data as a Service (DaaS) foundation. The plan leverages the existing Analytics Hub infrastructure while introducing new AI/ML components to enhance automation, improve data quality, and enable advanced analytics.
+    """)
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Strategic objectives
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### Strategic Objectives")
+    
+    objectives = [
+        "**Reduce Manual Effort**: Automate repetitive data processing tasks to free up operational resources",
+        "**Improve Data Quality**: Implement proactive monitoring and correction of data issues",
+        "**Enable New Insights**: Develop AI-powered analytics capabilities",
+        "**Enable Scalability**: Build systems that can handle growing data volumes and complexity",
+        "**Foundation for DaaS**: Establish the infrastructure and processes to offer Data as a Service"
+    ]
+    
+    for objective in objectives:
+        st.markdown(f"- {objective}")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Timeline with phases
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### Implementation Timeline")
+    
+    # Create a timeline visualization
+    if timeline_data:
+        render_figure("timeline", timeline_data, current_date=viewing_date().isoformat())
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Phases breakdown
+    phases_tabs = st.tabs(["Phase 1", "Phase 2", "Phase 3"])
+    
+    with phases_tabs[0]:
+        st.markdown("<div class='card'>", unsafe_allow_html=True)
+        st.markdown("### Phase 1: Intelligent Data Ingestion (Q2-Q3 2025)")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Core Components")
+            st.markdown("1. **ML-Powered File Ingestion Service**")
+            st.markdown("   - Classification models for categorizing files")
+            st.markdown("   - Feature extraction for schema detection")
+            st.markdown("   - Transformer-based models for column mapping")
+            st.markdown("   - Anomaly detection for data validation")
+            
+            st.markdown("2. **Adaptive Data Pipeline Framework**")
+            st.markdown("   - Pipeline template library")
+            st.markdown("   - Self-optimizing transformation rules")
+            st.markdown("   - Feedback loop for continuous improvement")
+        
+        with col2:
+            st.markdown("#### Key Milestones")
+            st.markdown("**Q2 2025 (Months 1-3)**")
+            st.markdown("- RPAG ML-Powered Ingestion POC")
+            st.markdown("- Team Onboarding & Infrastructure Setup")
+            
+            st.markdown("**Q3 2025 (Months 4-6)**")
+            st.markdown("- Expand ML Ingestion to All File Types")
+            st.markdown("- Adaptive Pipeline Framework")
+            
+            st.markdown("#### Key Deliverables")
+            st.markdown("- Working POC for RPAG file types")
+            st.markdown("- ML development infrastructure")
+            st.markdown("- Full production implementation")
+            st.markdown("- Documentation and knowledge transfer")
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    with phases_tabs[1]:
+        st.markdown("<div class='card'>", unsafe_allow_html=True)
+        st.markdown("### Phase 2: Proactive Data Quality Management (Q3-Q4 2025)")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Core Components")
+            st.markdown("1. **ML-Based Data Quality Monitoring**")
+            st.markdown("   - Statistical profiling for data sources")
+            st.markdown("   - Anomaly detection algorithms")
+            st.markdown("   - Time-series forecasting for trend analysis")
+            st.markdown("   - Classification models for issue categorization")
+            
+            st.markdown("2. **Intelligent Data Reconciliation**")
+            st.markdown("   - Entity resolution models")
+            st.markdown("   - Semantic matching algorithms")
+            st.markdown("   - Confidence scoring and decision rules")
+            st.markdown("   - Human-in-the-loop feedback mechanisms")
+        
+        with col2:
+            st.markdown("#### Key Milestones")
+            st.markdown("**Q3 2025 (Months 6-7)**")
+            st.markdown("- Data Quality Baseline")
+            
+            st.markdown("**Q4 2025 (Months 8-10)**")
+            st.markdown("- Predictive DQ Monitoring")
+            st.markdown("- Intelligent Reconciliation")
+            
+            st.markdown("#### Key Deliverables")
+            st.markdown("- End-to-end data quality monitoring system")
+            st.markdown("- Predictive alerts for potential data issues")
+            st.markdown("- Automated reconciliation for multi-source data")
+            st.markdown("- Comprehensive data quality reporting")
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    with phases_tabs[2]:
+        st.markdown("<div class='card'>", unsafe_allow_html=True)
+        st.markdown("### Phase 3: Advanced Analytics & Data as a Service (Q1-Q2 2026)")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Core Components")
+            st.markdown("1. **AI-Powered Analytics Engine**")
+            st.markdown("   - Pattern recognition for trend identification")
+            st.markdown("   - Causal inference models")
+            st.markdown("   - Natural language generation for insights")
+            st.markdown("   - Recommendation systems for action items")
+            
+            st.markdown("2. **Data as a Service (DaaS) Platform**")
+            st.markdown("   - API gateway with ML-based access control")
+            st.markdown("   - Data virtualization layer")
+            st.markdown("   - Real-time feature store")
+            st.markdown("   - ML model registry and deployment platform")
+        
+        with col2:
+            st.markdown("#### Key Milestones")
+            st.markdown("**Q1 2026 (Months 11-13)**")
+            st.markdown("- AI-Powered Analytics")
+            st.markdown("- DaaS Framework")
+            
+            st.markdown("**Q2 2026 (Months 14-16)**")
+            st.markdown("- DaaS Platform")
+            
+            st.markdown("#### Key Deliverables")
+            st.markdown("- AI-powered analytics capabilities in Power BI")
+            st.markdown("- Complete DaaS platform for internal/external use")
+            st.markdown("- Documentation and training materials")
+            st.markdown("- Governance framework for ongoing operations")
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Technology stack
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### Technology Stack")
+    
+    tech_tabs = st.tabs(["Core ML Components", "Integration Components", "Team Structure"])
+    
+    with tech_tabs[0]:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Data Processing & Feature Engineering")
+            st.markdown("- PySpark (Databricks)")
+            st.markdown("- Feature Store: Feast or Databricks Feature Store")
+            st.markdown("- Data validation: Great Expectations")
+            
+            st.markdown("#### Model Development")
+            st.markdown("- Frameworks: Scikit-learn, TensorFlow, PyTorch")
+            st.markdown("- AI: Claude suite, Cursor and Phi 4 (Azure)")
+            st.markdown("- NLP: Hugging Face Transformers, spaCy")
+            st.markdown("- Time-series: Prophet, statsmodels")
+            st.markdown("- AutoML: Databricks AutoML")
+        
+        with col2:
+            st.markdown("#### MLOps")
+            st.markdown("- Experiment tracking: MLflow")
+            st.markdown("- Model registry: MLflow Model Registry")
+            st.markdown("- Deployment: Docker containers, Kubernetes")
+            st.markdown("- Monitoring: Prometheus, Grafana")
+            
+            st.markdown("#### Data Quality")
+            st.markdown("- Profiling: Databricks Data Profiler")
+            st.markdown("- Monitoring: Custom ML models + Great Expectations")
+            st.markdown("- Alerting: Integration with existing monitoring tools")
+    
+    with tech_tabs[1]:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Data Ingestion")
+            st.markdown("- Apache Airflow for orchestration")
+            st.markdown("- Custom ML-powered ingestion service")
+            st.markdown("- SFTP/API connectors for data sources")
+        
+        with col2:
+            st.markdown("#### Data Storage")
+            st.markdown("- Delta Lake (existing)")
+            st.markdown("- Real-time feature store")
+            st.markdown("- Model artifact storage")
+            
+            st.markdown("#### API & Services")
+            st.markdown("- FastAPI for service endpoints")
+            st.markdown("- API Gateway for access control")
+            st.markdown("- Authentication & authorization services")
+    
+    with tech_tabs[2]:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Core Team (Immediate Hiring)")
+            st.markdown("**Data Engineers (2)**")
+            st.markdown("- Databricks/Spark expertise")
+            st.markdown("- Data pipeline development")
+            st.markdown("- Integration experience")
+            
+            st.markdown("**Data Scientists (2)**")
+            st.markdown("- ML model development")
+            st.markdown("- Feature engineering")
+            st.markdown("- Model evaluation and validation")
+        
+        with col2:
+            st.markdown("**Project Manager (1)**")
+            st.markdown("- Agile project management")
+            st.markdown("- ML/data science project experience")
+            st.markdown("- Stakeholder management")
+            
+            st.markdown("#### Extended Team (Future Consideration)")
+            st.markdown("- MLOps Engineer")
+            st.markdown("- Data Governance Specialist")
+            st.markdown("- AI Product Manager")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Success metrics
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### Success Metrics")
+    
+    metrics_tabs = st.tabs(["Phase 1 Metrics", "Phase 2 Metrics", "Phase 3 Metrics"])
+    
+    with metrics_tabs[0]:
+        render_block("bullets", success_metrics.get("Phase 1", ()))
+    
+    with metrics_tabs[1]:
+        render_block("bullets", success_metrics.get("Phase 2", ()))
+    
+    with metrics_tabs[2]:
+        render_block("bullets", success_metrics.get("Phase 3", ()))
+    
+    st.markdown("</div>", unsafe_allow_html=True)
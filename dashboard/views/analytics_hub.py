@@ -0,0 +1,192 @@
+from datetime import date, timedelta
+
+import streamlit as st
+
+from dashboard.anomaly import WINDOW, detector
+from dashboard.aua import MAX_POINTS
+from dashboard.aua import store as aua_store
+from dashboard.data import FrozenDict, FrozenList
+from dashboard.figures import render_figure
+from dashboard.loading import load_sources, render_load_notice
+from dashboard.refresh import DatasetSource
+from dashboard.render import render_block
+
+SOURCES = [DatasetSource("challenges")]
+
+# Flags this recent count towards the card's headline figure
+RECENT_DAYS = 30
+
+
+# Series drawn until the user picks others
+DEFAULT_SERIES = 10
+
+
+def aua_trend_chart(frequency, key):
+    # AUA history from the Parquet store: at most MAX_POINTS per series
+    # reach the browser (LTTB), so the chart costs the same for two years
+    # or twenty. Narrowing the date range re-reads just that range at
+    # finer resolution.
+    first, last = aua_store.date_range()
+    if first is None:
+        st.info("No daily AUA history loaded yet.")
+        return
+    names = aua_store.series_names()
+    chosen = st.multiselect("Series", names, default=names[:DEFAULT_SERIES], key=f"{key}_series")
+    start, end = st.slider("Date range", min_value=first, max_value=last, value=(first, last), format="YYYY-MM-DD", key=f"{key}_range")
+    trend = aua_store.trend(chosen, start, end, frequency)
+    flags = FrozenList(
+        flag for flag in detector.flags()
+        if frequency == "D" and flag["series"] in chosen and str(start) <= flag["date"] <= str(end)
+    )
+    chart = FrozenDict(trend=trend, flags=flags)
+    chart.data_version = f"{trend.data_version}:{detector.flags().data_version}"
+    render_figure("aua_trend", chart, key=key)
+    if frequency != "D":
+        period = "month" if frequency == "M" else "quarter"
+        st.caption(f"{trend['shown']:,} {period}-end values from {trend['rows']:,} daily values.")
+    elif trend["shown"] < trend["rows"]:
+        st.caption(
+            f"{trend['shown']:,} of {trend['rows']:,} daily values shown, downsampled to at most "
+            f"{MAX_POINTS:,} per series; narrow the date range for full detail."
+        )
+
+
+def aua_anomalies_card():
+    # Daily AUA/AUM series scored against their rolling median and MAD; new
+    # days in the store are applied incrementally on the way in
+    summary = detector.summary()
+    if summary is None or not summary["series"]:
+        st.info("No daily AUA history loaded yet.")
+        return
+    flags = detector.flags()
+    through = date.fromisoformat(summary["through"])
+    report = FrozenDict(summary=summary, flags=flags, recent_since=str(through - timedelta(days=RECENT_DAYS)))
+    report.data_version = flags.data_version
+    render_block("anomalies", report, title="AUA Anomalies")
+    st.caption(
+        f"Each day's change is scored against the median and MAD of the series' last {WINDOW} changes; "
+        f"a score of ±{summary['threshold']:g} or more is flagged."
+    )
+
+
+def analytics_hub():
+    data = load_sources(SOURCES)
+    challenges = data.get("challenges", ())
+    
+    st.markdown("<div class='main-header'>Analytics Hub</div>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Overview & Capabilities</div>", unsafe_allow_html=True)
+    render_load_notice(data)
+    
+    # About the Analytics Hub
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### About the Analytics Hub")
+    st.markdown("""
+    The Analytics Hub is a modern, indefinitely scalable analytics platform for business-critical reporting needs. It establishes a 'certified' data asset that serves as the single source of truth for organization-wide analytics and consumption.
+    """)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Key Benefits")
+        st.markdown("""
+        - **Reduced Time-to-Insight**: Key reports are delivered daily across all desired time horizons (daily, monthly, and quarterly)
+        - **Single Source of Truth**: Key operational and financial data is consolidated and centralized
+        - **Automation**: Eliminated and/or greatly reduced manual data acquisition, processing, reformatting, and report builds
+        - **Foundation for Future Growth**: Highly-scalable and flexible modern data platform
+        """)
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Capabilities and reports
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### Capabilities Delivered")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Automated Executive Reporting")
+        st.markdown("- **Daily**: AUA/AUM Metrics (10 reports)")
+        st.markdown("- **Monthly**: Portfolio Metrics (12 reports)")
+        st.markdown("- **Quarterly**: KPI Reporting (11 reports)")
+    
+    with col2:
+        st.markdown("#### Business Enablement")
+        st.markdown("- 'Self-Service' data analysis and access")
+        st.markdown("- SSO implementation for accessing Analytics Hub data assets")
+        st.markdown("- Training in Databricks and Power BI / SQL")
+        st.markdown("- Office Hours for questions and support")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Technical architecture
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### Technical Architecture")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Data Sources")
+        st.markdown("- Northern Trust - transactional data (balances)")
+        st.markdown("- State Street - transactional data (balances)")
+        st.markdown("- FactSet – operational system")
+        st.markdown("- Boarding Pass – onboarding application")
+        
+        st.markdown("#### Data Processing")
+        st.markdown("- Databricks")
+    
+    with col2:
+        st.markdown("#### Data Marts")
+        st.markdown("**Medallion Data Store (Delta Tables)**")
+        st.markdown("- **Bronze**: Raw, unprocessed data")
+        st.markdown("- **Silver**: Cleansed, de-duplicated and transformed data")
+        st.markdown("- **Gold**: Curated, aggregated and enriched data")
+        
+        st.markdown("**Data Warehouse (MSSQL Server)**")
+        st.markdown("- Dimensional Data for Reporting")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Report examples with tabs
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### Report Examples")
+    
+    report_tabs = st.tabs(["Daily AUA Reports", "Monthly MOR Reports", "Quarterly QOR Reports"])
+    
+    with report_tabs[0]:
+        aua_trend_chart("D", "aua_daily")
+        st.markdown("""
+        These key operational reports are automatically sent out daily to users from Power BI. Benefits compared to existing reports:
+        - Interactive, allowing users to select any day to see history
+        - Automated generation eliminates manual effort
+        - Consistent formatting and calculations
+        """)
+    
+    with report_tabs[1]:
+        aua_trend_chart("M", "aua_monthly")
+        st.markdown("""
+        Monthly Operating Review ("MOR") reports show trends and further analysis at a higher level. Improvements:
+        - Interactive and available on demand in Power BI
+        - Previously static and manually prepared monthly
+        - Includes drill-down capabilities for detailed analysis
+        """)
+    
+    with report_tabs[2]:
+        aua_trend_chart("Q", "aua_quarterly")
+        st.markdown("""
+        Quarterly Operating Review ("QOR") reports show trends and further analysis at a higher level. Improvements:
+        - Interactive and available on demand in Power BI
+        - Previously static and manually prepared quarterly
+        - Comprehensive KPIs with historical trend analysis
+        """)
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    aua_anomalies_card()
+    
+    # Current challenges
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("### Current Challenges")
+    
+    render_block("bullets", challenges)
+    
+    st.markdown("</div>", unsafe_allow_html=True)
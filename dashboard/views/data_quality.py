@@ -0,0 +1,120 @@
+import time
+
+import streamlit as st
+
+from dashboard import schemas
+from dashboard.data import FrozenDict, FrozenList
+from dashboard.profiling import CUSTODIAN_DIR, profiler
+from dashboard.reconcile import ABS_TOLERANCE, REL_TOLERANCE, pairs, reconciler
+from dashboard.refresh import poll_while_pending
+from dashboard.render import render_block
+
+# Rerun interval of a section while files are still being profiled or
+# reconciled in the background, so results appear without a manual
+# refresh; a section that has everything stops polling
+PENDING_POLL_INTERVAL = 2
+
+
+@poll_while_pending(PENDING_POLL_INTERVAL)
+def custodian_profiles():
+    # Never waits on the profiler: files not profiled yet are reported as
+    # pending and the section polls until they are
+    files = profiler.files()
+    if not files:
+        st.info(f"No custodian files found in {CUSTODIAN_DIR}.")
+        return False
+
+    profiles, pending, failed = [], [], []
+    for path in files:
+        profile = profiler.profile(path)
+        if profile is not None:
+            profiles.append(profile)
+        elif profiler.error(path):
+            failed.append(path)
+        else:
+            pending.append(path)
+
+    if pending:
+        st.info(f"Profiling {len(pending)} file(s) in the background; this section updates when they are done.")
+    for path in failed:
+        st.error(f"Could not profile {path}: {profiler.error(path)}")
+    if not profiles:
+        return bool(pending)
+
+    overview = FrozenList(profiles)
+    overview.data_version = ":".join(profile.data_version for profile in profiles)
+    render_block("profile_files", overview, title="Custodian Files")
+
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Column Profile</div>", unsafe_allow_html=True)
+    names = [profile["file"] for profile in profiles]
+    chosen = st.selectbox("File", names, key="profile_file")
+    profile = profiles[names.index(chosen)]
+    st.caption(
+        f"{profile['rows']:,} rows profiled in {profile['seconds']:.1f}s on "
+        f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(profile['profiled_at']))}; "
+        "distinct counts and percentiles are approximate."
+    )
+    render_block("column_profile", profile)
+    st.markdown("</div>", unsafe_allow_html=True)
+    return bool(pending)
+
+
+@poll_while_pending(PENDING_POLL_INTERVAL)
+def reconciliation_card():
+    # Northern Trust vs State Street balances for each date both delivered;
+    # polls only while the selected date is being reconciled
+    by_date = pairs(profiler.files())
+    if not by_date:
+        st.info("No date with both a Northern Trust and a State Street file to reconcile.")
+        return False
+    days = list(by_date)
+    day = days[0]
+    if len(days) > 1:
+        day = st.selectbox("As of", days, key="reconciliation_date", format_func=lambda d: f"{d[:4]}-{d[4:6]}-{d[6:]}")
+    left, right = by_date[day]
+    result = reconciler.result(left, right)
+    if result is None:
+        error = reconciler.error(left, right)
+        if error:
+            st.error(f"Could not reconcile {day}: {error}")
+            return False
+        st.info(f"Reconciling {day} in the background; this section updates when it is done.")
+        return True
+    render_block("reconciliation", result, title="Reconciliation Breaks")
+    st.caption(
+        f"{result['left']['rows']:,} {result['left']['custodian']} and {result['right']['rows']:,} "
+        f"{result['right']['custodian']} rows reconciled in {result['seconds']:.1f}s. Differences within "
+        f"${ABS_TOLERANCE:,.2f} or {REL_TOLERANCE:.2%} of the balance are within tolerance."
+    )
+    return False
+
+
+def schema_detection_panel():
+    # Summary of the last nightly tools/detect_schemas.py run
+    run = schemas.last_run()
+    if run is None:
+        st.info("No RPAG schema detection run yet.")
+        return
+    report = FrozenDict(run=run, layouts=schemas.known_layouts())
+    report.data_version = f"{run.data_version}:{getattr(report['layouts'], 'data_version', '')}"
+    started = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["started_at"]))
+    render_block("schema_run", report, title="RPAG File Formats")
+    st.caption(f"Last run {started}, {run['seconds']:.1f}s.")
+
+
+def data_quality_page():
+    st.markdown("<div class='main-header'>Data Quality</div>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Custodian File Profiling</div>", unsafe_allow_html=True)
+
+    st.markdown("""
+    Daily balance files from Northern Trust and State Street are profiled as they arrive: null rates, distinct counts, value ranges, percentiles and values that do not match the column's expected type. Each file is streamed in fixed-size blocks, so even multi-gigabyte files are profiled in bounded memory, and a profile is computed once per file content.
+    """)
+
+    custodian_profiles()
+
+    # Positions joined across custodians on account, CUSIP and date
+    reconciliation_card()
+
+    # 400+ RPAG file formats, matched to known layouts by fingerprint
+    schema_detection_panel()
@@ -0,0 +1,159 @@
+import html
+
+import streamlit as st
+
+from dashboard.data import FrozenDict
+from dashboard.diff import KEYS as DIFFED_DATASETS, diff_snapshots
+from dashboard.figures import render_figure
+from dashboard.loading import load_sources, render_load_notice
+from dashboard.history import dataset_as_of, display_date, selected_date, store as history_store, viewing_date
+from dashboard.portfolio import SORT_KEYS, portfolio, portfolio_mode
+from dashboard.refresh import CHART_REFRESH_INTERVAL, TILE_REFRESH_INTERVAL, DatasetSource, fragment, latest_snapshot
+from dashboard.render import render_block
+
+PHASE_2 = "Phase 2 - Ownership/Omnibus & Invoice Reporting"
+
+# Fetched together before the page renders; KPIs and phase completion come
+# from the refresher snapshot instead
+SOURCES = [DatasetSource("achievements"), DatasetSource("challenges")]
+
+
+def metric_tile_html(value, label, background, border):
+    return f"""
+        <div class='metric-card' style='background-color: {background}; border: 1px solid {border};'>
+            <div class='metric-value' style='color: #333333;'>{html.escape(str(value))}</div>
+            <div class='metric-label' style='color: #555555;'>{html.escape(label)}</div>
+        </div>
+        """
+
+
+# KPIs come from the background refresher's latest snapshot, never from the
+# sources directly, so a slow source cannot stall the rerun. Tiles and chart
+# are fragments: their auto-refresh reruns only them, not the whole page.
+@fragment(run_every=TILE_REFRESH_INTERVAL)
+def metric_tiles():
+    snapshot = latest_snapshot()
+    kpis = snapshot.get("kpis", {})
+    phase_completion = dataset_as_of("phase_completion", live=snapshot.get("phase_completion", {}))
+    
+    empty_left, col1, col2, col3, empty_right = st.columns([1, 2, 2, 2, 1])
+    
+    with col1:
+        st.markdown(metric_tile_html(kpis.get("automated_reports", "—"), "Automated Reports", "#E6F7EF", "#8DD3C7"), unsafe_allow_html=True)
+    
+    with col2:
+        phase_2 = phase_completion.get(PHASE_2)
+        st.markdown(metric_tile_html("—" if phase_2 is None else f"{phase_2}%", "Phase 2 Completion", "#FFF3D9", "#E45F9D"), unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(metric_tile_html(kpis.get("ai_ml_launch_target", "—"), "AI/ML Launch Target", "#E6F0FF", "#8DD3C7"), unsafe_allow_html=True)
+
+
+@fragment(run_every=CHART_REFRESH_INTERVAL)
+def phase_completion_chart():
+    phase_completion = dataset_as_of("phase_completion", live=latest_snapshot().get("phase_completion", {}))
+    render_figure("phase_completion", phase_completion)
+
+
+def phase_burnup_chart():
+    # Needs at least two recorded snapshots to draw a trend
+    burnup = history_store.phase_burnup(until=selected_date())
+    if len(burnup["dates"]) < 2:
+        return
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Phase Burn-up</div>", unsafe_allow_html=True)
+    render_figure("burnup", burnup)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def what_changed_card():
+    # Date being viewed against an earlier recorded snapshot (by default
+    # the latest one before it)
+    viewed = viewing_date()
+    earlier = [day for day in history_store.dates() if day < viewed]
+    if not earlier:
+        return
+    since = st.selectbox("Compare with", earlier[::-1], format_func=display_date, key="compare_with")
+    before = {name: history_store.get(name, since) or {} for name in DIFFED_DATASETS}
+    after = {name: dataset_as_of(name) for name in DIFFED_DATASETS}
+    delta = diff_snapshots(before, after, since=since, until=viewed)
+    render_block("changes", delta, title=f"What changed since {display_date(since)}")
+
+
+def _any(label, options, key):
+    # Selectbox with an "All" entry standing for no filter
+    choice = st.selectbox(label, ["All"] + options, key=key)
+    return None if choice == "All" else choice
+
+
+def portfolio_section():
+    # Roll-ups are maintained by the portfolio as project files change;
+    # reading them here is O(number of statuses), not O(projects)
+    summary = portfolio.summary()
+    st.markdown("<div class='sub-header'>Portfolio</div>", unsafe_allow_html=True)
+
+    columns = st.columns(2 + len(summary["status_counts"]))
+    columns[0].markdown(metric_tile_html(summary["projects"], "Projects", "#E6F0FF", "#8DD3C7"), unsafe_allow_html=True)
+    columns[1].markdown(metric_tile_html(f"{summary['average_completion']}%", "Average Completion", "#FFF3D9", "#E45F9D"), unsafe_allow_html=True)
+    for column, (status, count) in zip(columns[2:], summary["status_counts"].items()):
+        column.markdown(metric_tile_html(count, status.title(), "#E6F7EF", "#8DD3C7"), unsafe_allow_html=True)
+
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Risk Exposure</div>", unsafe_allow_html=True)
+    render_figure("risk_exposure", summary)
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    options = portfolio.options()
+    status_col, owner_col, phase_col, sort_col = st.columns(4)
+    with status_col:
+        status = _any("Status", options["status"], "portfolio_status")
+    with owner_col:
+        owner = _any("Owner", options["owner"], "portfolio_owner")
+    with phase_col:
+        phase = _any("Phase", options["phase"], "portfolio_phase")
+    with sort_col:
+        sort = st.selectbox("Sort by", SORT_KEYS, format_func=str.title, key="portfolio_sort")
+    descending = st.checkbox("Descending", key="portfolio_descending")
+
+    rows, total = portfolio.query(status=status, owner=owner, phase=phase, sort=sort, descending=descending)
+    page = FrozenDict(rows=rows, total=total)
+    page.data_version = f"{summary.data_version}:{status}:{owner}:{phase}:{sort}:{descending}"
+    render_block("portfolio_table", page, title="Projects")
+
+
+def executive_dashboard():
+    data = load_sources(SOURCES)
+    achievements = data.get("achievements", ())
+    challenges = data.get("challenges", ())
+    
+    # Header
+    st.markdown("<div class='main-header'>Great Gray Analytics Hub</div>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Executive Dashboard</div>", unsafe_allow_html=True)
+    st.markdown(f"Last updated: {display_date(viewing_date())}")
+    render_load_notice(data)
+    
+    # Key metrics at the top - with 3 centered tiles
+    metric_tiles()
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # More than one project file in the portfolio directory
+    if portfolio_mode():
+        portfolio_section()
+    
+    what_changed_card()
+    
+    # Phase Completion section
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Phase Completion</div>", unsafe_allow_html=True)
+    
+    phase_completion_chart()
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    phase_burnup_chart()
+    
+    # Key Achievements section
+    render_block("bullets", achievements, title="Key Achievements")
+    
+    # Critical challenges
+    render_block("bullets", challenges, title="Critical Challenges")
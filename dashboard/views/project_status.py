@@ -0,0 +1,122 @@
+import streamlit as st
+
+from dashboard import activity_log
+from dashboard.figures import get_risk_matrix_cells, render_figure
+from dashboard.history import dataset_as_of, display_date, selected_date, viewing_date
+from dashboard.loading import load_sources, render_load_notice
+from dashboard.refresh import DatasetSource
+from dashboard.render import render_block
+
+# Live values; an earlier "View as of" date reads the history store instead
+SOURCES = [DatasetSource("risk_data"), DatasetSource("project_status_data")]
+
+
+def _set_activity_page(number):
+    st.session_state.activity_page = number
+
+
+def _activity_feed():
+    # Only one page of the log is read and rendered, however long it gets
+    log = activity_log.log
+    bounds = log.date_range()
+    if bounds is None:
+        st.markdown("No activities recorded yet.")
+        return
+
+    start = end = None
+    with st.expander("Filter by date"):
+        selected = st.date_input(
+            "Date range", value=bounds, min_value=bounds[0], max_value=bounds[1],
+            key="activity_dates", on_change=_set_activity_page, args=(0,),
+        )
+    if isinstance(selected, (list, tuple)):
+        start, end = (tuple(selected) + (None, None))[:2]
+    # Viewing an earlier date hides what was logged after it
+    as_of = selected_date()
+    if as_of is not None:
+        end = min(end or as_of, as_of)
+
+    number = st.session_state.get("activity_page", 0)
+    entries, total = log.page(number, start=start, end=end)
+    pages = max(-(-total // activity_log.PAGE_SIZE), 1)
+    if number >= pages:
+        # The filter narrowed the results below the current page
+        number = pages - 1
+        entries, total = log.page(number, start=start, end=end)
+    render_block("activities", entries)
+
+    newer, position, older = st.columns([1, 2, 1])
+    newer.button("Newer", disabled=number == 0, key="activity_newer",
+                 on_click=_set_activity_page, args=(number - 1,))
+    position.markdown(f"Page {number + 1} of {pages} ({total} activities)")
+    older.button("Older", disabled=number + 1 >= pages, key="activity_older",
+                 on_click=_set_activity_page, args=(number + 1,))
+
+
+def project_status_page():
+    data = load_sources(SOURCES)
+    risk_data = dataset_as_of("risk_data", live=data.get("risk_data", ()))
+    project_status_data = dataset_as_of("project_status_data", live=data.get("project_status_data", {}))
+    
+    st.markdown("<div class='main-header'>Project Status</div>", unsafe_allow_html=True)
+    st.markdown(f"Last updated: {display_date(viewing_date())}")
+    render_load_notice(data)
+    
+    # Project status overview
+    render_block("status_overview", project_status_data, title="Status Overview")
+    
+    # Recent activities
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Recent Activities</div>", unsafe_allow_html=True)
+    
+    _activity_feed()
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Plan for next week
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Planned Activities</div>", unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Phase 1 – AUA Reporting")
+        st.markdown("- Deploy the cutover to State Street SFTP")
+        st.markdown("- Begin ingestion and development work for Enhanced Data Quality Checks")
+        
+        st.markdown("#### Phase 2 - Ownership/Omnibus & Invoice Reporting")
+        st.markdown("- Develop and finalize additional enhancement requests")
+        st.markdown("- Include high priority updates for Tax IDs, value precision, and new account file contents joined to account balances")
+    
+    with col2:
+        st.markdown("#### Production Enablement")
+        st.markdown("- Continue supporting enablement for Power BI and Databricks for Ownership, Omnibus, & Invoice Reporting")
+        
+        st.markdown("#### Other Updates")
+        st.markdown("- Require signed SOW for current phase of work")
+        st.markdown("- Focus on making AUA fully usable with enhanced DQ checks and SSB SFTP files")
+        st.markdown("- Continue enablement and Office Hours")
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    # Risks and issues
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("<div class='sub-header'>Risks & Issues</div>", unsafe_allow_html=True)
+    
+    render_figure("risk_matrix", risk_data)
+    
+    # Drill down into a single matrix cell
+    cells = get_risk_matrix_cells(risk_data)
+    cell_labels = [
+        f"Impact: {cell['Impact']} / Likelihood: {cell['Likelihood']} ({cell['Count']} risk{'s' if cell['Count'] > 1 else ''})"
+        for cell in cells
+    ]
+    if cell_labels:
+        with st.expander("Drill down into a risk matrix cell"):
+            selected = st.selectbox("Cell", range(len(cell_labels)), format_func=cell_labels.__getitem__)
+            render_block("risk_cell", cells[selected])
+    
+    # Risk table
+    render_block("risk_table", risk_data)
+    
+    st.markdown("</div>", unsafe_allow_html=True)
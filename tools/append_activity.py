@@ -0,0 +1,37 @@
+"""Append an entry to the Project Status activity log.
+
+The log (data/activities.jsonl) is append-only; running dashboards index
+the new line on their next read.
+
+    python tools/append_activity.py "State Street SFTP cutover completed."
+    python tools/append_activity.py --date 2025-03-04 "SFTP cutover completed."
+"""
+import argparse
+import os
+import sys
+from datetime import date
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def main():
+    from dashboard import activity_log
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("activity")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today(), help="YYYY-MM-DD (default today)")
+    args = parser.parse_args()
+
+    log = activity_log.log
+    bounds = log.date_range()
+    if bounds is not None and args.date < bounds[1]:
+        # Still valid, but date filters fall back to scanning the index
+        print(f"warning: {args.date} is earlier than the newest entry ({bounds[1]})", file=sys.stderr)
+    log.append(args.date, args.activity)
+    print(f"Appended to {log.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Time the Analytics Hub AUA charts against a large synthetic history.
+
+Fills a temporary AUA store with --series series of --days daily values,
+then times trend() (Parquet read, period reduction and LTTB) for the full
+range, a zoomed range and the monthly view, and reports the points and
+figure JSON bytes each would send to the browser.
+
+    python tools/bench_aua_trend.py --series 20 --days 20000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dashboard import aua  # noqa: E402
+from dashboard.data import FrozenDict, FrozenList  # noqa: E402
+from dashboard.figures import build_aua_trend_figure, figure_json  # noqa: E402
+from detect_anomalies import generate  # noqa: E402
+
+
+def measure(store, label, names, start, end, frequency):
+    began = time.perf_counter()
+    trend = store.trend(names, start, end, frequency)
+    cold = time.perf_counter() - began
+    began = time.perf_counter()
+    store.trend(names, start, end, frequency)
+    warm = time.perf_counter() - began
+    spec = figure_json(build_aua_trend_figure(FrozenDict(trend=trend, flags=FrozenList())))
+    print(
+        f"{label:<22} {trend['rows']:>10,} rows -> {trend['shown']:>7,} points  "
+        f"{cold * 1000:7.1f} ms (cached {warm * 1000:.2f} ms)  figure {len(spec) / 2**10:,.0f} KiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--series", type=int, default=20)
+    parser.add_argument("--days", type=int, default=20000)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="aua-bench-")
+    try:
+        table, _, names, dates = generate(args.series, args.days, "2025-03-06")
+        store = aua.AuaStore(root)
+        began = time.perf_counter()
+        store.record_table(table)
+        print(f"wrote {table.num_rows:,} rows in {time.perf_counter() - began:.1f}s")
+        first, last = store.date_range()
+        zoom_start = (np.datetime64(last) - np.timedelta64(365, "D")).astype(object)
+        measure(store, "full range, daily", names, first, last, "D")
+        measure(store, "last year, daily", names, zoom_start, last, "D")
+        measure(store, "full range, monthly", names, first, last, "M")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Serialization cost per rerun: st.plotly_chart versus cached figure JSON.
+
+For each dashboard figure this times what st.plotly_chart does on every
+rerun (rebuild a validated go.Figure from the cached one, then encode it
+with Plotly's default JSON encoder) against the pre-serialized path
+(render_figure: one cache lookup returning the JSON encoded once per data
+version), and the one-off encode that path pays on a cache miss.
+
+    python tools/bench_figure_json.py --runs 50
+    python tools/bench_figure_json.py --scale 50   # 50x risks/phases
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from bench_pages import use_scaled_data
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# Dataset each figure is built from
+FIGURE_DATASETS = {
+    "phase_completion": "phase_completion",
+    "risk_matrix": "risk_data",
+    "timeline": "timeline_data",
+}
+
+
+def median_ms(func, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def plotly_chart_encode(fig):
+    # The work st.plotly_chart does before sending a figure
+    import plotly.io as pio
+    import plotly.tools
+
+    figure = plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True)
+    return pio.to_json(figure, validate=False, engine="json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="timed repetitions per figure")
+    parser.add_argument("--scale", type=int, default=1, help="multiply growing datasets")
+    args = parser.parse_args()
+
+    if args.scale > 1:
+        use_scaled_data(args.scale)
+
+    from dashboard import data, figures
+
+    print(f"JSON engine: {figures.JSON_ENGINE}")
+    print(f"{'Figure':<18}{'bytes':>10}{'plotly_chart ms':>17}{'encode once ms':>16}{'cached ms':>11}{'saved ms':>10}")
+    total_saved = 0.0
+    for name, dataset in FIGURE_DATASETS.items():
+        value = data.store.get(dataset)
+        fig = figures.get_figure(name, value)
+
+        before = median_ms(lambda: plotly_chart_encode(fig), args.runs)
+        once = median_ms(lambda: figures.figure_json(fig), args.runs)
+        spec = figures.get_figure_json(name, value)  # warm the cache
+        cached = median_ms(lambda: figures.get_figure_json(name, value), args.runs)
+
+        saved = before - cached
+        total_saved += saved
+        print(f"{name:<18}{len(spec):>10}{before:>17.2f}{once:>16.2f}{cached:>11.3f}{saved:>10.2f}")
+
+    print(f"Saved per rerun of all three figures: {total_saved:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
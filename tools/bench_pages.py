@@ -0,0 +1,224 @@
+"""Rerun-cost benchmark for every dashboard page, driven through AppTest.
+
+For each page selectable in the sidebar radio this records the fastest
+script wall time of --runs reruns (the least noisy estimate), the number
+of elements emitted, the serialized size of all Plotly figures and the
+peak Python memory allocated during a rerun, measured in a separate pass
+so tracemalloc does not skew the timings. Results are compared against
+tools/bench_baseline.json and the script exits non-zero when any metric
+regresses past --tolerance. Baseline times are scaled by how fast a fixed
+calibration workload runs now against when they were recorded, and a page
+that still looks slower is timed once more first, so load on a shared
+machine is not reported as a regression.
+
+    python tools/bench_pages.py                    # compare to baseline
+    python tools/bench_pages.py --update-baseline  # record a new baseline
+    python tools/bench_pages.py --scale 50         # 50x risks/phases/activity log
+
+--scale multiplies the list- and dict-shaped datasets into a temporary data
+directory, to see how reruns grow with the data we expect.
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from element_tree import tree_stats, walk
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+BASELINE_PATH = os.path.join(ROOT_DIR, "tools", "bench_baseline.json")
+
+# Datasets that grow with the programme and are multiplied by --scale
+SCALED_DATASETS = ("risk_data", "phase_completion")
+
+# Wall-time regressions smaller than this are treated as noise; on a
+# shared single-core runner the fastest of 10 reruns still varies by ~8 ms
+MIN_TIME_DELTA_S = 0.01
+
+
+def calibrate(runs=5):
+    # Fastest time for a fixed pure-Python workload: a yardstick for how
+    # fast this machine is running right now
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        sorted(str(i) for i in range(200_000))
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def use_scaled_data(factor):
+    from dashboard import activity_log, data
+
+    target = tempfile.mkdtemp(prefix="dashboard-bench-")
+    shutil.copytree(data.DATA_DIR, target, dirs_exist_ok=True)
+    for name in SCALED_DATASETS:
+        path = os.path.join(target, data.DATASETS[name])
+        with open(path) as f:
+            value = json.load(f)
+        if isinstance(value, list):
+            value = value * factor
+        else:
+            value = {
+                (key if copy == 0 else f"{key} #{copy + 1}"): item
+                for copy in range(factor) for key, item in value.items()
+            }
+        with open(path, "w") as f:
+            json.dump(value, f)
+
+    # The activity log grows by appending, so repeat its lines
+    log_path = os.path.join(target, os.path.basename(activity_log.LOG_PATH))
+    with open(log_path) as f:
+        lines = f.readlines()
+    with open(log_path, "w") as f:
+        f.writelines(lines * factor)
+
+    # AppTest runs the app in this process, so swapping the store is
+    # enough: the dashboard reads both through their modules (data.store,
+    # activity_log.log), never a reference taken at import
+    data.store = data.DataStore(target, data.DATASETS)
+    activity_log.log = activity_log.ActivityLog(log_path, os.path.join(target, "activities.bench.idx"))
+    return target
+
+
+def figure_bytes(at):
+    return sum(
+        node.proto.ByteSize()
+        for node in walk(at._tree)
+        if getattr(node, "type", None) == "plotly_chart"
+    )
+
+
+def measure_page(at, page, runs):
+    at.sidebar.radio[0].set_value(page).run()
+
+    # One untimed rerun first, so per-page caches are warm
+    at.run()
+
+    # Timed without tracemalloc, which slows allocation-heavy code unevenly
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - start)
+
+    # Peak memory in a separate, untimed pass
+    peak = 0
+    for _ in range(runs):
+        tracemalloc.start()
+        at.run()
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    elements, _ = tree_stats(at)
+    return {
+        "wall_time_s": round(min(samples), 5),
+        "elements": elements,
+        "figure_bytes": figure_bytes(at),
+        "peak_memory_bytes": peak,
+    }
+
+
+def run_suite(app_path, runs):
+    from streamlit.testing.v1 import AppTest
+    from dashboard.views import PAGES
+
+    at = AppTest.from_file(app_path, default_timeout=120)
+    at.run()
+    return at, {page: measure_page(at, page, runs) for page in PAGES}
+
+
+def slower(old, value, tolerance):
+    return value - old >= MIN_TIME_DELTA_S and value > old * (1 + tolerance)
+
+
+def retime_slow_pages(at, results, baseline, runs, tolerance):
+    for page, metrics in results.items():
+        old = baseline.get(page, {}).get("wall_time_s")
+        if old and slower(old, metrics["wall_time_s"], tolerance):
+            again = measure_page(at, page, runs)["wall_time_s"]
+            metrics["wall_time_s"] = min(metrics["wall_time_s"], again)
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for page, metrics in results.items():
+        before = baseline.get(page)
+        if before is None:
+            continue
+        for metric, value in metrics.items():
+            old = before.get(metric)
+            if not old:
+                continue
+            if metric == "wall_time_s" and not slower(old, value, tolerance):
+                continue
+            if value > old * (1 + tolerance):
+                regressions.append(f"{page}: {metric} {old} -> {value} (+{(value / old - 1):.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default=os.path.join(ROOT_DIR, "app.py"))
+    parser.add_argument("--runs", type=int, default=10, help="reruns per page")
+    parser.add_argument("--scale", type=int, default=1, help="multiply growing datasets")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    if args.scale > 1:
+        use_scaled_data(args.scale)
+
+    speed = calibrate()
+    at, results = run_suite(os.path.abspath(args.app), args.runs)
+    speed = min(speed, calibrate())
+    key = f"scale={args.scale}"
+
+    try:
+        with open(args.baseline) as f:
+            baselines = json.load(f)
+    except FileNotFoundError:
+        baselines = {}
+
+    baseline = None
+    if not args.update_baseline and key in baselines:
+        recorded = baselines[key]
+        factor = speed / recorded["calibration_s"]
+        baseline = {
+            page: dict(metrics, wall_time_s=round(metrics["wall_time_s"] * factor, 5))
+            for page, metrics in recorded["pages"].items()
+        }
+        print(f"Machine speed against the baseline's: x{1 / factor:.2f}")
+        retime_slow_pages(at, results, baseline, args.runs, args.tolerance)
+
+    print(f"{'Page':<28}{'wall (s)':>10}{'elements':>10}{'figure B':>12}{'peak mem B':>14}")
+    for page, m in results.items():
+        print(f"{page:<28}{m['wall_time_s']:>10.4f}{m['elements']:>10}{m['figure_bytes']:>12}{m['peak_memory_bytes']:>14}")
+
+    if args.update_baseline:
+        baselines[key] = {"calibration_s": round(speed, 5), "pages": results}
+        with open(args.baseline, "w") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline for {key} written to {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"No baseline for {key}; run with --update-baseline to record one")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Build the dashboard's static assets into static/ with content-hashed names.
+
+Images under assets/ are downscaled to at most MAX_WIDTH pixels (Pillow),
+re-encoded, and written as static/<path>/<stem>.<hash><ext>. The stylesheet
+dashboard/styles.css is minified the same way. static/manifest.json maps
+each source name (e.g. "reports/daily_aua.png") to its built file, and
+dashboard.assets resolves names through it. Files from a previous build
+that are no longer referenced are removed.
+
+    python tools/build_assets.py
+"""
+import hashlib
+import io
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dashboard.assets import MANIFEST_PATH, STATIC_DIR, minify_css  # noqa: E402
+
+SOURCE_DIR = os.path.join(ROOT_DIR, "assets")
+CSS_PATH = os.path.join(ROOT_DIR, "dashboard", "styles.css")
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+
+# Widest an image is ever displayed; per-file overrides below
+MAX_WIDTH = 1200
+MAX_WIDTHS = {
+    "gg_logo.png": 400,
+}
+
+
+def resize_image(path, max_width):
+    from PIL import Image
+
+    with Image.open(path) as image:
+        fmt = image.format
+        if image.width > max_width:
+            height = round(image.height * max_width / image.width)
+            image = image.resize((max_width, height), Image.LANCZOS)
+        out = io.BytesIO()
+        image.save(out, format=fmt, optimize=True)
+        return out.getvalue()
+
+
+def write_hashed(name, payload):
+    digest = hashlib.sha256(payload).hexdigest()[:12]
+    stem, ext = os.path.splitext(name)
+    built = f"{stem}.{digest}{ext}"
+    target = os.path.join(STATIC_DIR, built)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if not os.path.exists(target):
+        with open(target, "wb") as f:
+            f.write(payload)
+    return {"file": built, "hash": digest}
+
+
+def source_images():
+    if not os.path.isdir(SOURCE_DIR):
+        return
+    for dirpath, _, filenames in os.walk(SOURCE_DIR):
+        for filename in sorted(filenames):
+            if filename.lower().endswith(IMAGE_EXTENSIONS):
+                path = os.path.join(dirpath, filename)
+                yield os.path.relpath(path, SOURCE_DIR).replace(os.sep, "/"), path
+
+
+def main():
+    try:
+        with open(MANIFEST_PATH) as f:
+            previous = json.load(f)
+    except FileNotFoundError:
+        previous = {}
+
+    manifest = {}
+    for name, path in source_images():
+        payload = resize_image(path, MAX_WIDTHS.get(name, MAX_WIDTH))
+        manifest[name] = write_hashed(name, payload)
+
+    with open(CSS_PATH) as f:
+        manifest["styles.css"] = write_hashed("styles.css", minify_css(f.read()).encode("utf-8"))
+
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+    current = {entry["file"] for entry in manifest.values()}
+    for entry in previous.values():
+        if entry["file"] not in current:
+            try:
+                os.remove(os.path.join(STATIC_DIR, entry["file"]))
+            except FileNotFoundError:
+                pass
+
+    for name, entry in sorted(manifest.items()):
+        print(f"{name} -> {entry['file']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Check render_figure's direct chart path against st.plotly_chart.
+
+render_figure sends each figure's cached JSON to Streamlit's element queue
+itself, through internals, on the releases in DIRECT_CHART_VERSIONS. This
+renders the phase completion and risk matrix figures both ways through AppTest, on the installed
+Streamlit, and checks that the direct path was used without falling back,
+that it sends the same figure, config and theme st.plotly_chart does, and
+that a chart drawn twice on a page gets two ids. Run it before widening
+DIRECT_CHART_VERSIONS to a new Streamlit release.
+
+    python tools/check_figure_path.py
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# Each figure drawn from its live dataset, then the phase chart twice from
+# one line with a key; with "direct" off, every figure goes through st.plotly_chart
+APP = f"""
+import sys
+sys.path.insert(0, {ROOT_DIR!r})
+import streamlit as st
+from dashboard import figures
+from dashboard.data import load_dataset
+
+if not st.session_state.get("direct", True):
+    figures._direct_charts = False
+for name, dataset in (("phase_completion", "phase_completion"), ("risk_matrix", "risk_data")):
+    figures.render_figure(name, load_dataset(dataset))
+for copy in range(2):
+    figures.render_figure("phase_completion", load_dataset("phase_completion"), key=copy)
+st.session_state["used_direct"] = figures._direct_charts
+"""
+
+
+def pruned(value):
+    # Without empty objects, which plotly.js treats as absent: the builders'
+    # figures keep e.g. an empty axis title that st.plotly_chart's
+    # re-validation drops
+    if isinstance(value, dict):
+        value = {key: pruned(item) for key, item in value.items()}
+        return {key: item for key, item in value.items() if item != {}}
+    if isinstance(value, list):
+        return [pruned(item) for item in value]
+    return value
+
+
+def render(app_path, direct):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=60)
+    at.session_state["direct"] = direct
+    at.run()
+    assert not at.exception, at.exception
+    return at, [chart.proto for chart in at.get("plotly_chart")]
+
+
+def main():
+    argparse.ArgumentParser(description=__doc__.splitlines()[0]).parse_args()
+
+    import streamlit as st
+
+    from dashboard import figures
+
+    low, high = figures.DIRECT_CHART_VERSIONS
+    print(f"Streamlit {st.__version__}; direct path enabled for {low}-{high}: {figures._direct_charts}")
+    if not figures._direct_charts:
+        print("The direct path is off for this release; st.plotly_chart is used and there is nothing to check")
+        return 0
+
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False) as f:
+        f.write(APP)
+    try:
+        at, direct = render(f.name, True)
+        assert at.session_state["used_direct"], "the direct path raised and fell back to st.plotly_chart"
+        _, fallback = render(f.name, False)
+    finally:
+        os.remove(f.name)
+
+    assert len(direct) == len(fallback) == 4, (len(direct), len(fallback))
+    for ours, theirs in zip(direct, fallback):
+        assert pruned(json.loads(ours.spec)) == pruned(json.loads(theirs.spec)), "figure differs from st.plotly_chart's"
+        assert json.loads(ours.config) == json.loads(theirs.config), (ours.config, theirs.config)
+        assert ours.theme == theirs.theme, (ours.theme, theirs.theme)
+    ids = [proto.id for proto in direct]
+    assert len(set(ids)) == len(ids), f"duplicate chart ids: {ids}"
+    print(f"OK: {len(direct)} charts sent directly match st.plotly_chart; ids unique")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
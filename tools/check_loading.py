@@ -0,0 +1,121 @@
+"""Check concurrent source loading against local fake sources.
+
+Uses StaticSource fakes with injected latency and failures to check that a
+page's sources load in roughly the time of the slowest one, that a slow or
+failing source falls back to its last good value, that a slow fetch still
+lands for the next load, and that a hung source is fetched only once.
+
+    python tools/check_loading.py
+"""
+import os
+import sys
+import threading
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dashboard.loading import SourceLoader  # noqa: E402
+from dashboard.refresh import SnapshotRefresher, StaticSource  # noqa: E402
+
+
+class CountingSource(StaticSource):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fetches = 0
+        self._lock = threading.Lock()
+
+    def fetch(self):
+        with self._lock:
+            self.fetches += 1
+        return super().fetch()
+
+
+def _timed_load(loader, sources):
+    began = time.perf_counter()
+    result = loader.load(sources)
+    return result, time.perf_counter() - began
+
+
+def check_concurrent():
+    sources = [
+        StaticSource("warehouse", {"phase": 75}, delay=0.3),
+        StaticSource("delta", [1, 2, 3], delay=0.3),
+        StaticSource("tickets", ["a"], delay=0.5),
+    ]
+    result, elapsed = _timed_load(SourceLoader(timeout=2), sources)
+    total = sum(source.delay for source in sources)
+    assert not result.errors and not result.stale, result.errors
+    assert result["tickets"] == ("a",)
+    assert elapsed < 0.5 + 0.15, f"took {elapsed:.2f}s, slowest source is 0.5s"
+    print(f"concurrent:  {elapsed:.2f}s for sources totalling {total:.1f}s")
+
+
+def check_timeout_falls_back():
+    loader = SourceLoader(timeout=2)
+    slow = StaticSource("warehouse", {"phase": 50}, timeout=0.2)
+    fast = StaticSource("tickets", ["a"])
+    loader.load([slow, fast])
+
+    slow.value, slow.delay = {"phase": 60}, 0.6
+    result, elapsed = _timed_load(loader, [slow, fast])
+    assert result["warehouse"] == {"phase": 50}, result["warehouse"]
+    assert "warehouse" in result.stale and "timed out" in result.errors["warehouse"]
+    assert "tickets" not in result.errors
+    assert elapsed < 0.2 + 0.15, f"took {elapsed:.2f}s, timeout is 0.2s"
+    print(f"timeout:     stale value after {elapsed:.2f}s")
+
+    # The abandoned fetch finishes in the background and is picked up next time
+    time.sleep(0.6)
+    slow.delay = 0.0
+    result = loader.load([slow])
+    assert result["warehouse"] == {"phase": 60} and not result.errors, result.values
+    print("late result: used by the next load")
+
+
+def check_failure_falls_back():
+    loader = SourceLoader(timeout=1)
+    source = StaticSource("tracker", ["open"])
+    loader.load([source])
+    source.error = ConnectionError("tracker down")
+    result = loader.load([source])
+    assert result["tracker"] == ("open",) and "tracker down" in result.errors["tracker"]
+
+    never = StaticSource("never", None, error=ConnectionError("no route"))
+    result = loader.load([never])
+    assert "never" not in result.values and "never" in result.errors
+    print("failure:     last good value served; never-loaded source reported missing")
+
+
+def check_hung_source_fetched_once():
+    loader = SourceLoader(timeout=0.1)
+    hung = CountingSource("hung", 1, delay=0.8)
+    for _ in range(5):
+        loader.load([hung])
+    assert hung.fetches == 1, hung.fetches
+    print("in flight:   5 loads of a hung source started 1 fetch")
+
+
+def check_refresher():
+    loader = SourceLoader(timeout=0.2)
+    sources = [StaticSource("kpis", {"reports": 12}), StaticSource("phase_completion", {"p": 1})]
+    refresher = SnapshotRefresher(sources, loader=loader)
+    refresher.refresh_once()
+    sources[0].delay = 0.5
+    snapshot = refresher.refresh_once()
+    assert snapshot.get("kpis") == {"reports": 12} and "kpis" in snapshot.errors
+    print("refresher:   snapshot keeps the last good value of a slow source")
+
+
+def main():
+    check_concurrent()
+    check_timeout_falls_back()
+    check_failure_falls_back()
+    check_hung_source_fetched_once()
+    check_refresher()
+    print("ok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""Exercise the shared disk cache from several processes at once.
+
+Starts --workers processes that all ask for the same artifact at the same
+moment through a fresh cache directory and checks that it was built exactly
+once, that every worker got the same value, and that LRU eviction keeps the
+directory under its size limit.
+
+    python tools/check_shared_cache.py --workers 8
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dashboard.shared_cache import DiskCache  # noqa: E402
+
+
+def slow_build(builds_path):
+    with open(builds_path, "a") as f:
+        f.write(f"{os.getpid()}\n")
+    time.sleep(0.5)
+    return {"built_by": os.getpid(), "payload": "x" * 10_000}
+
+
+def worker(directory, builds_path, start_at, results):
+    cache = DiskCache(directory)
+    time.sleep(max(0.0, start_at - time.time()))
+    value = cache.get_or_compute("a" * 64, lambda: slow_build(builds_path))
+    results.put(value["built_by"])
+
+
+def check_concurrent_build(workers):
+    directory = tempfile.mkdtemp(prefix="shared-cache-check-")
+    builds_path = os.path.join(directory, "builds.log")
+    results = multiprocessing.Queue()
+    start_at = time.time() + 1.0
+    procs = [
+        multiprocessing.Process(target=worker, args=(directory, builds_path, start_at, results))
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+    with open(builds_path) as f:
+        builds = f.read().split()
+    built_by = {results.get() for _ in procs}
+    assert len(builds) == 1, f"artifact built {len(builds)} times"
+    assert len(built_by) == 1, f"workers saw different artifacts: {built_by}"
+    print(f"{workers} workers, 1 build (pid {builds[0]})")
+
+
+def check_eviction():
+    directory = tempfile.mkdtemp(prefix="shared-cache-check-")
+    cache = DiskCache(directory, max_bytes=50_000)
+    for i in range(20):
+        cache.set(f"{i:064x}", "x" * 10_000)
+        time.sleep(0.01)
+    assert cache.size() <= 50_000, f"cache holds {cache.size()} bytes"
+    assert cache.get(f"{19:064x}") is not None, "newest entry was evicted"
+    assert cache.get(f"{0:064x}") is None, "oldest entry survived"
+    print(f"eviction keeps cache at {cache.size()} bytes (limit 50000)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+    check_concurrent_build(args.workers)
+    check_eviction()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Apply new days in the AUA store to the anomaly detector and list flags.
+
+Meant to run after the nightly AUA load; the Analytics Hub page also
+catches up on its own when it finds new days. Only days after the saved
+state are read, so each night costs one vectorized update.
+
+    python tools/detect_anomalies.py
+    python tools/detect_anomalies.py --rebuild
+    python tools/detect_anomalies.py --generate 10 --days 520 --end 2025-03-06
+
+--rebuild drops the saved state and replays the whole store (after a past
+day was corrected). --generate writes synthetic series into the store.
+--bench SERIES generates --days of history for SERIES series with known
+anomalies into a temporary store, times a full replay and a one-day
+update, and reports the false positive rate (share of normal days
+flagged), the share of flags that are false, and the anomalies found.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from datetime import date
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dashboard import anomaly, aua  # noqa: E402
+
+SERIES_NAMES = [
+    "Total AUA", "Stable Value AUA", "Target Date AUA", "Collective Trust AUA", "Managed Accounts AUM",
+    "Northern Trust AUA", "State Street AUA", "Retirement Plans AUA", "Institutional AUM", "Advisor Channel AUA",
+]
+
+# Per series and day: one-day spikes (a bad feed, reverting the next day),
+# lasting level shifts, and days a series is missing
+SPIKE_RATE = 0.001
+SHIFT_RATE = 0.001
+MISSING_RATE = 0.001
+
+
+def generate(series, days, end, seed=0):
+    # (AUA table, boolean [series, day] array of the days that are anomalies)
+    rng = np.random.default_rng(seed)
+    dates = np.busday_offset(np.datetime64(end, "D"), np.arange(-days + 1, 1), roll="backward")
+    names = SERIES_NAMES[:series] if series <= len(SERIES_NAMES) else [f"series-{i:05d}" for i in range(series)]
+    volatility = rng.uniform(0.002, 0.01, (series, 1))
+    # Fat-tailed daily changes: Student's t with 4 degrees of freedom
+    # (variance 2), scaled to each series' volatility
+    changes = 0.0002 + volatility * rng.standard_t(4, (series, days)) / np.sqrt(2)
+    jumps = rng.choice([-1, 1], (series, days)) * rng.uniform(0.05, 0.2, (series, days))
+    spikes = rng.random((series, days)) < SPIKE_RATE
+    shifts = (rng.random((series, days)) < SHIFT_RATE) & ~spikes
+    changes[:, 0] = 0
+    spikes[:, [0, -1]] = shifts[:, 0] = False
+    level = np.log(rng.uniform(1e8, 5e10, (series, 1))) + np.cumsum(changes + np.where(shifts, jumps, 0), axis=1)
+    level += np.where(spikes, jumps, 0)
+    values = np.exp(level)
+    missing = rng.random((series, days)) < MISSING_RATE
+    anomalous = shifts | spikes | np.roll(spikes, 1, axis=1)
+
+    keep = ~missing
+    table = pa.table({
+        "date": pa.array(np.broadcast_to(dates, (series, days)).T[keep.T]),
+        "series": pa.array(np.broadcast_to(np.array(names, dtype=object)[:, None], (series, days)).T[keep.T], pa.string()),
+        "value": pa.array(np.round(values, 2).T[keep.T]),
+    })
+    return table, anomalous & keep & ~np.roll(missing, 1, axis=1), names, dates
+
+
+def report_flags(flags, limit):
+    for flag in list(flags)[:limit]:
+        print(f"  {flag['date']}  {flag['series']:<28} {flag['change']:+8.2%}  score {flag['score']:+7.1f}")
+
+
+def bench(series, days):
+    root = tempfile.mkdtemp(prefix="anomaly-bench-")
+    try:
+        table, anomalous, names, dates = generate(series, days, "2025-03-06")
+        store = aua.AuaStore(os.path.join(root, "aua"))
+        anomaly.MAX_FLAGS = anomalous.size  # keep every flag for the rates
+        store.record_table(table.filter(pc.less(table.column("date"), pa.scalar(dates[-1].astype(object), pa.date32()))))
+        detector = anomaly.AnomalyDetector(store, os.path.join(root, "state"))
+        applied, seconds = detector.refresh()
+        print(f"replayed {applied:,} rows ({series:,} series x {days - 1} days) in {seconds:.2f}s")
+        store.record_table(table.filter(pc.equal(table.column("date"), pa.scalar(dates[-1].astype(object), pa.date32()))))
+        applied, seconds = detector.refresh()
+        print(f"one new day ({applied:,} rows) in {seconds * 1000:.1f} ms")
+
+        flags = detector.flags()
+        row = {name: i for i, name in enumerate(names)}
+        day = {str(d): i for i, d in enumerate(dates)}
+        hits = np.array([anomalous[row[flag["series"]], day[flag["date"]]] for flag in flags], dtype=bool)
+        warm = anomalous[:, anomaly.MIN_HISTORY + 1:]
+        found = hits.sum()
+        print(
+            f"{len(flags):,} flags at threshold {anomaly.THRESHOLD}: {len(flags) - found:,} false positives "
+            f"({(len(flags) - found) / max(len(flags), 1):.1%} of flags, "
+            f"{(len(flags) - found) / max(warm.size - warm.sum(), 1):.4%} of normal days); "
+            f"{found:,} of {warm.sum():,} injected anomalies found"
+        )
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rebuild", action="store_true", help="replay the whole store")
+    parser.add_argument("--generate", type=int, metavar="SERIES", help="write synthetic series into the store")
+    parser.add_argument("--bench", type=int, metavar="SERIES")
+    parser.add_argument("--days", type=int, default=520)
+    parser.add_argument("--end", type=date.fromisoformat, default=date(2025, 3, 6))
+    parser.add_argument("--limit", type=int, default=20, help="flags listed")
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.bench, args.days)
+        return 0
+    if args.generate:
+        table = generate(args.generate, args.days, args.end)[0]
+        aua.store.record_table(table)
+        print(f"Wrote {table.num_rows:,} rows to {aua.store.directory}")
+        return 0
+    if args.rebuild:
+        shutil.rmtree(anomaly.detector.directory, ignore_errors=True)
+    applied, seconds = anomaly.detector.refresh()
+    summary = anomaly.detector.summary()
+    print(f"Applied {applied:,} rows in {seconds:.2f}s; {summary['series']} series through {summary['through']}")
+    report_flags(anomaly.detector.flags(), args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
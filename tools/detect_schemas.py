@@ -0,0 +1,112 @@
+"""Detect the layout of every file in the RPAG drop and record the run.
+
+Meant to run nightly after the drop lands. Files whose structural
+fingerprint is already known are matched through the index; each unseen
+fingerprint is inferred once, in a process pool across all cores, and
+becomes a known layout. The Data Quality page shows the last run.
+
+    python tools/detect_schemas.py
+    python tools/detect_schemas.py --dir /mnt/rpag/2025-03-06 --workers 8
+
+--bench FILES instead generates FILES synthetic files in --formats layouts
+into a temporary drop and times a cold run (empty index), a run over the
+same files (fingerprint cache) and a run over a fresh drop of new files in
+the same layouts (index matches only).
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dashboard import schemas  # noqa: E402
+
+EXTRA_COLUMNS = ["Source System", "Batch ID", "Record Type", "Comment", "Region", "Advisor", "Status"]
+
+
+def _format(rng, number):
+    fields = rng.sample(sorted(schemas.FIELD_SYNONYMS), rng.randint(4, len(schemas.FIELD_SYNONYMS)))
+    columns = [(rng.choice(schemas.FIELD_SYNONYMS[field]).title(), field) for field in fields]
+    columns += [(name, None) for name in rng.sample(EXTRA_COLUMNS, rng.randint(0, 3))]
+    rng.shuffle(columns)
+    return {
+        "name": f"rpag_fmt{number:03d}",
+        "delimiter": rng.choice(schemas.DELIMITERS),
+        "header": rng.random() > 0.1,
+        "columns": columns,
+        "date_format": rng.choice(schemas.DATE_FORMATS[:3]),
+    }
+
+
+def _cell(rng, field, date_format):
+    if field in ("units", "price", "market_value"):
+        return f"{rng.lognormvariate(6, 2):.2f}"
+    if field == "as_of_date":
+        return time.strftime(date_format, time.localtime(1741219200 - rng.randrange(30) * 86400))
+    if field in ("plan_id", "participant_id"):
+        return str(rng.randrange(10 ** 6, 10 ** 7))
+    if field == "fund_id":
+        return f"F{rng.randrange(10 ** 5):05d}"
+    return rng.choice(["Alpha", "Beta", "Gamma", "Delta", "North", "South"])
+
+
+def generate(directory, files, formats, seed=0, day="20250306"):
+    rng = random.Random(seed)
+    layouts = [_format(random.Random(number), number) for number in range(formats)]
+    os.makedirs(directory, exist_ok=True)
+    for number in range(files):
+        layout = layouts[number % formats]
+        delimiter = layout["delimiter"]
+        lines = []
+        if layout["header"]:
+            lines.append(delimiter.join(name for name, _ in layout["columns"]))
+        for _ in range(rng.randint(200, 2000)):
+            lines.append(delimiter.join(_cell(rng, field, layout["date_format"]) for _, field in layout["columns"]))
+        with open(os.path.join(directory, f"{layout['name']}_plan{number:04d}_{day}.txt"), "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def report(label, summary):
+    print(
+        f"{label:<28} {summary['seconds']:6.2f}s  {summary['processed']} of {summary['files']} files, "
+        f"{summary['matched']} matched, {len(summary['new_layouts'])} new layouts, {len(summary['failed'])} failed"
+    )
+
+
+def bench(files, formats, workers):
+    root = tempfile.mkdtemp(prefix="rpag-bench-")
+    drop, schema_dir = os.path.join(root, "drop"), os.path.join(root, "schemas")
+    generate(drop, files, formats)
+    report("cold (empty index)", schemas.run(drop, schema_dir, workers=workers)[0])
+    report("same drop again", schemas.run(drop, schema_dir, workers=workers)[0])
+    next_drop = os.path.join(root, "next")
+    generate(next_drop, files, formats, seed=1, day="20250307")
+    report("next night, known layouts", schemas.run(next_drop, schema_dir, workers=workers)[0])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dir", default=schemas.RPAG_DIR, help="directory of the drop")
+    parser.add_argument("--schema-dir", default=schemas.SCHEMA_DIR)
+    parser.add_argument("--workers", type=int, help="inference processes (default: all cores)")
+    parser.add_argument("--bench", type=int, metavar="FILES", help="benchmark a synthetic drop instead")
+    parser.add_argument("--formats", type=int, default=120, help="layouts in the synthetic drop")
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.bench, args.formats, args.workers)
+        return 0
+
+    summary, _ = schemas.run(args.dir, args.schema_dir, workers=args.workers)
+    report(args.dir, summary)
+    for failure in summary["failed"]:
+        print(f"  failed: {failure['file']}: {failure['error']}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
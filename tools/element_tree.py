@@ -0,0 +1,25 @@
+"""Helpers for walking the element tree of a streamlit AppTest run.
+
+Shared by tools/measure_deltas.py and tools/bench_pages.py.
+"""
+
+
+def walk(node):
+    # Every node of the tree, depth first
+    yield node
+    children = getattr(node, "children", None) or {}
+    for child in children.values():
+        yield from walk(child)
+
+
+def tree_stats(at):
+    # Number of elements/blocks in the rendered tree and their proto size
+    deltas = 0
+    payload_bytes = 0
+    for node in walk(at._tree):
+        proto = getattr(node, "proto", None)
+        if proto is None or not hasattr(proto, "ByteSize"):
+            continue
+        deltas += 1
+        payload_bytes += proto.ByteSize()
+    return deltas, payload_bytes
@@ -0,0 +1,333 @@
+"""Export all dashboard pages as a self-contained static HTML bundle.
+
+Each page in the sidebar radio is run once through AppTest and its element
+tree is converted to HTML: markdown becomes HTML, columns become flex rows,
+tabs become stacked sections, expanders become <details>, and Plotly
+charts are embedded as figure JSON drawn by a single shared plotly.min.js.
+The bundle is rebuilt only when the data or dashboard code changed (its
+version is stored in VERSION), and can be served by any static file server.
+
+    python tools/export_static.py --out dist/snapshot
+    python -m http.server -d dist/snapshot
+"""
+import argparse
+import glob
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import sys
+import textwrap
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} - Status Assessment Dashboard</title>
+<link rel="stylesheet" href="styles.css">
+<script src="plotly.min.js"></script>
+</head>
+<body>
+<nav class="sidebar">
+<h1>Navigation</h1>
+{nav}
+<p class="info">This dashboard provides an overview of Great Gray's Analytics Hub project.<br>Snapshot {version}</p>
+</nav>
+<main>
+{body}
+</main>
+<script>
+document.querySelectorAll("script[type='application/json'][data-figure]").forEach(function (el) {{
+  var fig = JSON.parse(el.textContent);
+  Plotly.newPlot(el.dataset.figure, fig.data || [], fig.layout || {{}}, {{responsive: true, displaylogo: false}});
+}});
+</script>
+</body>
+</html>
+"""
+
+# Layout for the bundle itself, on top of the dashboard stylesheet
+BUNDLE_CSS = """
+body { margin: 0; display: flex; font-family: "Source Sans Pro", sans-serif; background: #121212; color: white; }
+nav.sidebar { width: 260px; min-height: 100vh; padding: 1.5rem; box-sizing: border-box; background: #1E1E1E; }
+nav.sidebar a { display: block; padding: 0.4rem 0; color: white; text-decoration: none; }
+nav.sidebar a.active { color: #8DD3C7; font-weight: 600; }
+nav.sidebar .info { margin-top: 2rem; font-size: 0.9rem; color: rgba(255, 255, 255, 0.7); }
+main { flex: 1; padding: 2rem 3rem; max-width: 1400px; }
+.columns { display: flex; gap: 1.5rem; }
+.column { min-width: 0; }
+.tab-label { border-bottom: 2px solid #8DD3C7; padding-bottom: 0.3rem; }
+details { margin: 1rem 0; }
+a { color: #8DD3C7; }
+"""
+
+FIGURE_HEIGHT_DEFAULT = 450
+
+
+def slugify(title):
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+
+
+def _inline(text, allow_html):
+    if not allow_html:
+        text = html.escape(text, quote=False)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    text = re.sub(r"`([^`]+)`", r"<code>\1</code>", text)
+    return text
+
+
+def markdown_to_html(text, allow_html=False):
+    # Enough Markdown for this dashboard: headings, lists, bold, code, rules
+    text = textwrap.dedent(text).strip("\n")
+    if allow_html and text.lstrip().startswith("<"):
+        return text
+
+    out = []
+    paragraph = []
+    lists = []  # stack of (indent, tag)
+
+    def flush_paragraph():
+        if paragraph:
+            out.append(f"<p>{' '.join(paragraph)}</p>")
+            paragraph.clear()
+
+    def close_lists(indent=-1):
+        while lists and lists[-1][0] > indent:
+            out.append(f"</li></{lists.pop()[1]}>")
+
+    for line in text.split("\n"):
+        stripped = line.strip()
+        item = re.match(r"^(\s*)(?:([-*])|(\d+)\.)\s+(.*)$", line)
+        if not stripped:
+            flush_paragraph()
+            close_lists()
+        elif item:
+            flush_paragraph()
+            indent = len(item.group(1))
+            tag = "ul" if item.group(2) else "ol"
+            close_lists(indent)
+            if lists and lists[-1][0] == indent:
+                out.append("</li>")
+            else:
+                out.append(f"<{tag}>")
+                lists.append((indent, tag))
+            out.append(f"<li>{_inline(item.group(4), allow_html)}")
+        elif re.match(r"^#{1,6}\s", stripped):
+            flush_paragraph()
+            close_lists()
+            level = len(stripped) - len(stripped.lstrip("#"))
+            out.append(f"<h{level}>{_inline(stripped[level:].strip(), allow_html)}</h{level}>")
+        elif re.match(r"^-{3,}$", stripped):
+            flush_paragraph()
+            close_lists()
+            out.append("<hr>")
+        else:
+            close_lists()
+            paragraph.append(_inline(stripped, allow_html))
+
+    flush_paragraph()
+    close_lists()
+    return "\n".join(out)
+
+
+def _block_label(node, field):
+    # Newer AppTest block nodes hold the block's own proto (with .label);
+    # older ones hold the parent Block message
+    label = getattr(node, "label", None)
+    return label if label is not None else getattr(node.proto, field).label
+
+
+def _is_column_row(node):
+    # Newer Streamlit wraps st.columns in a generic flex container
+    children = list((getattr(node, "children", None) or {}).values())
+    return bool(children) and all(getattr(child, "type", None) == "column" for child in children)
+
+
+class PageExporter:
+    def __init__(self):
+        self.figures = 0
+
+    def children_html(self, node):
+        children = getattr(node, "children", None) or {}
+        return "\n".join(self.node_html(children[key]) for key in sorted(children))
+
+    def node_html(self, node):
+        kind = getattr(node, "type", None)
+        proto = getattr(node, "proto", None)
+        inner = self.children_html(node) if getattr(node, "children", None) else ""
+
+        if kind == "horizontal" or (kind == "flex_container" and _is_column_row(node)):
+            return f"<div class='columns'>{inner}</div>"
+        if kind == "column":
+            weight = getattr(getattr(proto, "column", None), "weight", 1) or 1
+            return f"<div class='column' style='flex: {weight};'>{inner}</div>"
+        if kind == "tab":
+            label = html.escape(_block_label(node, "tab"))
+            return f"<section class='tab'><h4 class='tab-label'>{label}</h4>{inner}</section>"
+        if kind in ("expandable", "expander"):
+            label = html.escape(_block_label(node, "expandable"))
+            return f"<details><summary>{label}</summary>{inner}</details>"
+        if getattr(node, "children", None) is not None and kind not in ("markdown", "plotly_chart"):
+            return f"<div>{inner}</div>" if inner else ""
+
+        if kind == "markdown":
+            return self.markdown_html(proto)
+        if kind == "plotly_chart":
+            return self.figure_html(proto)
+        if kind in ("info", "success", "warning", "error"):
+            return f"<div class='highlight'>{markdown_to_html(proto.body)}</div>"
+        if kind == "code":
+            return f"<pre><code>{html.escape(proto.code_text)}</code></pre>"
+        # Interactive widgets have no static equivalent
+        return ""
+
+    def markdown_html(self, proto):
+        body = proto.body
+        # The live app's CSS is linked from styles.css instead
+        if body.lstrip().startswith("<style>"):
+            return ""
+        # Lone card open/close tags never wrap anything in Streamlit either
+        if re.fullmatch(r"\s*</?div[^>]*>\s*", body):
+            return ""
+        return markdown_to_html(body, allow_html=proto.allow_html)
+
+    def figure_html(self, proto):
+        spec = getattr(proto, "spec", "") or proto.figure.spec
+        self.figures += 1
+        figure_id = f"figure-{self.figures}"
+        height = json.loads(spec).get("layout", {}).get("height", FIGURE_HEIGHT_DEFAULT)
+        # "</" inside a <script> would end it early
+        payload = spec.replace("</", "<\\/")
+        return (
+            f"<div id='{figure_id}' class='plotly-figure' style='height: {height}px;'></div>"
+            f"<script type='application/json' data-figure='{figure_id}'>{payload}</script>"
+        )
+
+
+def directory_signature(directory):
+    # (path, size, mtime) of every file under directory, skipping lock and
+    # temporary files (dot files)
+    signature = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(files):
+            if name.startswith("."):
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            signature.append((os.path.relpath(path, directory), stat.st_size, stat.st_mtime_ns))
+    return signature
+
+
+def bundle_version():
+    from dashboard import activity_log
+    from dashboard.anomaly import ANOMALY_DIR
+    from dashboard.aua import AUA_DIR
+    from dashboard.data import store
+    from dashboard.history import HISTORY_DIR
+    from dashboard.portfolio import PORTFOLIO_DIR
+    from dashboard.profiling import CUSTODIAN_DIR
+    from dashboard.schemas import SCHEMA_DIR
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps(store.versions(), sort_keys=True).encode("utf-8"))
+    digest.update(activity_log.log.version().encode("utf-8"))
+    # Pages also read these stores and the results derived from them
+    for directory in (HISTORY_DIR, PORTFOLIO_DIR, CUSTODIAN_DIR, SCHEMA_DIR, AUA_DIR, ANOMALY_DIR):
+        digest.update(json.dumps(directory_signature(directory)).encode("utf-8"))
+    for path in sorted(glob.glob(os.path.join(ROOT_DIR, "dashboard", "**", "*.py"), recursive=True)):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def write_assets(out_dir):
+    import plotly.offline
+
+    from dashboard.assets import STATIC_DIR, minify_css
+    from dashboard.styles import CSS_PATH
+
+    with open(os.path.join(out_dir, "plotly.min.js"), "w", encoding="utf-8") as f:
+        f.write(plotly.offline.get_plotlyjs())
+    with open(CSS_PATH) as f:
+        css = minify_css(f.read()) + minify_css(BUNDLE_CSS)
+    with open(os.path.join(out_dir, "styles.css"), "w") as f:
+        f.write(css)
+    # Local images are referenced as app/static/..., as in the live app
+    if os.path.isdir(STATIC_DIR):
+        shutil.copytree(STATIC_DIR, os.path.join(out_dir, "app", "static"), dirs_exist_ok=True)
+
+
+def export(out_dir, force=False):
+    from streamlit.testing.v1 import AppTest
+
+    from dashboard.anomaly import detector
+    from dashboard.views import PAGES
+
+    # The Analytics Hub page would catch the anomaly state up with the AUA
+    # store while exporting; do it first so the version covers that state
+    detector.refresh()
+    version = bundle_version()
+    version_path = os.path.join(out_dir, "VERSION")
+    if not force and os.path.exists(version_path):
+        with open(version_path) as f:
+            if f.read().strip() == version:
+                print(f"Snapshot {version} is up to date in {out_dir}")
+                return version
+
+    # Build next to the target and swap it in, so a static server never
+    # serves a half-written bundle
+    tmp_dir = out_dir.rstrip(os.sep) + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    write_assets(tmp_dir)
+
+    at = AppTest.from_file(os.path.join(ROOT_DIR, "app.py"), default_timeout=120)
+    at.run()
+    titles = list(PAGES)
+    for title in titles:
+        at.sidebar.radio[0].set_value(title).run()
+        exporter = PageExporter()
+        body = exporter.children_html(at.main)
+        nav = "\n".join(
+            f"<a href='{slugify(other)}.html' class='{'active' if other == title else ''}'>{html.escape(other)}</a>"
+            for other in titles
+        )
+        page_html = PAGE_TEMPLATE.format(title=html.escape(title), nav=nav, body=body, version=version)
+        with open(os.path.join(tmp_dir, f"{slugify(title)}.html"), "w", encoding="utf-8") as f:
+            f.write(page_html)
+        print(f"{title}: {exporter.figures} figure(s)")
+
+    shutil.copyfile(os.path.join(tmp_dir, f"{slugify(titles[0])}.html"), os.path.join(tmp_dir, "index.html"))
+    with open(os.path.join(tmp_dir, "VERSION"), "w") as f:
+        f.write(version + "\n")
+
+    old_dir = out_dir.rstrip(os.sep) + ".old"
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if os.path.exists(out_dir):
+        os.rename(out_dir, old_dir)
+    os.rename(tmp_dir, out_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    print(f"Snapshot {version} written to {out_dir}")
+    return version
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default=os.path.join(ROOT_DIR, "dist", "snapshot"))
+    parser.add_argument("--force", action="store_true", help="rebuild even if the version is unchanged")
+    args = parser.parse_args()
+    export(os.path.abspath(args.out), force=args.force)
+
+
+if __name__ == "__main__":
+    main()
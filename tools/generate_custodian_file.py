@@ -0,0 +1,97 @@
+"""Generate a synthetic custodian balance file and optionally profile it.
+
+Writes --rows rows in the named custodian's layout (see
+dashboard.profiling.CUSTODIANS) with a sprinkling of blanks and malformed
+values, so the Data Quality page has nulls and type violations to show.
+--bench then profiles the file in-process and reports time, throughput and
+peak RSS growth, which should stay flat as --rows grows.
+
+    python tools/generate_custodian_file.py --custodian state_street --rows 500 --out /tmp/state_street_20250306.csv
+    python tools/generate_custodian_file.py --rows 20000000 --out /tmp/nt.csv --bench
+"""
+import argparse
+import csv
+import os
+import random
+import resource
+import sys
+import time
+from datetime import date, timedelta
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dashboard.profiling import BLOCK_BYTES, CUSTODIANS, profile_file  # noqa: E402
+
+# Share of values left blank, and of numbers/dates written malformed
+BLANK_RATE = 0.01
+BAD_VALUE_RATE = 0.002
+BAD_VALUES = ["N/A", "#VALUE!", "--", "TBD"]
+
+FUNDS = [f"Stable Value Fund {letter}" for letter in "ABCDEFGH"] + [f"Target Date {year}" for year in range(2025, 2070, 5)]
+
+
+def _value(kind, column, rng, as_of, date_format):
+    if rng.random() < BLANK_RATE:
+        return ""
+    if kind in ("number", "date") and rng.random() < BAD_VALUE_RATE:
+        return rng.choice(BAD_VALUES)
+    if kind == "date":
+        return (as_of - timedelta(days=rng.random() < 0.01)).strftime(date_format)
+    if kind == "number":
+        return f"{rng.lognormvariate(9, 2):.2f}"
+    lowered = column.lower()
+    if "cusip" in lowered:
+        return f"{rng.randrange(36 ** 8):08X}"[:8] + str(rng.randrange(10))
+    if "desc" in lowered or "name" in lowered:
+        return rng.choice(FUNDS)
+    if "cur" in lowered or "ccy" in lowered:
+        return "USD"
+    return f"{rng.randrange(10 ** 6):06d}"
+
+
+def generate(custodian, rows, out, as_of, seed=0):
+    layout = CUSTODIANS[custodian]
+    columns = list(layout["types"].items())
+    rng = random.Random(seed)
+    with open(out, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([name for name, _ in columns])
+        for _ in range(rows):
+            writer.writerow([_value(kind, name, rng, as_of, layout["date_format"]) for name, kind in columns])
+
+
+def bench(path, block_bytes):
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    began = time.perf_counter()
+    profile = profile_file(path, block_bytes=block_bytes)
+    elapsed = time.perf_counter() - began
+    size_mb = profile["bytes"] / 2**20
+    print(f"profiled {profile['rows']} rows ({size_mb:.1f} MiB) in {elapsed:.1f}s ({size_mb / elapsed:.1f} MiB/s)")
+    print(f"peak RSS growth: {(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024:.1f} MiB")
+    for column in profile["columns"]:
+        print(
+            f"  {column['name']:<22} {column['type']:<7} nulls {column['null_rate']:.2%}"
+            f"  distinct ~{column['distinct']}  violations {column['violations']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--custodian", choices=sorted(CUSTODIANS), default="northern_trust")
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date(2025, 3, 6))
+    parser.add_argument("--out", required=True)
+    parser.add_argument("--bench", action="store_true", help="profile the file after writing it")
+    parser.add_argument("--block-bytes", type=int, default=BLOCK_BYTES)
+    args = parser.parse_args()
+
+    generate(args.custodian, args.rows, args.out, args.as_of, seed=sorted(CUSTODIANS).index(args.custodian))
+    print(f"Wrote {args.rows} rows to {args.out}")
+    if args.bench:
+        bench(args.out, args.block_bytes)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
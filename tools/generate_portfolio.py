@@ -0,0 +1,102 @@
+"""Generate a synthetic project portfolio and benchmark portfolio mode.
+
+Writes --projects project files (modelled on the Analytics Hub project the
+portfolio builds from the dashboard's own datasets, with randomised owners, phases, statuses, completion and risks) to --out,
+then times the Executive Dashboard's portfolio reads against them: the
+summary roll-ups, filtered and sorted queries, and a single-project update.
+
+    python tools/generate_portfolio.py --projects 1000 --out /tmp/portfolio
+    DASHBOARD_PORTFOLIO_DIR=/tmp/portfolio streamlit run app.py
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+OWNERS = ["Data & Analytics", "Operations", "Finance", "Client Services", "Technology", "Compliance", "Product"]
+PHASES = ["Planning", "Discovery", "Execution", "Testing", "Rollout", "Closed"]
+STATUSES = ["ON TRACK", "ON TRACK", "ON TRACK", "AT RISK", "ESCALATION"]
+LEVELS = ["Low", "Medium", "High"]
+
+
+def make_project(seed, number):
+    rng = random.Random(number)
+    return {
+        "name": f"Project {number:04d}",
+        "owner": rng.choice(OWNERS),
+        "phase": rng.choice(PHASES),
+        "status": {area: rng.choice(STATUSES) for area in seed["status"]},
+        "phase_completion": {phase: rng.randrange(0, 101, 5) for phase in seed["phase_completion"]},
+        "risks": [
+            dict(risk, Impact=rng.choice(LEVELS), Likelihood=rng.choice(LEVELS))
+            for risk in rng.sample(seed["risks"], rng.randint(0, len(seed["risks"])))
+        ],
+    }
+
+
+def generate(count, out):
+    from dashboard.portfolio import home_project
+
+    seed = home_project()[0]
+    os.makedirs(out, exist_ok=True)
+    for number in range(1, count + 1):
+        with open(os.path.join(out, f"project-{number:04d}.json"), "w") as f:
+            json.dump(make_project(seed, number), f)
+    return seed
+
+
+def _timed(function, repeat):
+    began = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - began) / repeat * 1000
+
+
+def bench(out, repeat):
+    from dashboard.portfolio import Portfolio, Project
+
+    portfolio = Portfolio(out)
+    began = time.perf_counter()
+    portfolio.refresh(force=True)
+    print(f"initial load:          {(time.perf_counter() - began) * 1000:.1f} ms for {len(portfolio.projects)} projects")
+
+    print(f"summary:               {_timed(portfolio.summary, repeat):.3f} ms")
+    print(f"query (sorted, all):   {_timed(lambda: portfolio.query(sort='completion', descending=True), repeat):.3f} ms")
+    print(f"query (status+owner):  {_timed(lambda: portfolio.query(status='AT RISK', owner=OWNERS[0], sort='status'), repeat):.3f} ms")
+
+    ids = list(portfolio.projects)
+    rng = random.Random(0)
+
+    def update():
+        project_id = rng.choice(ids)
+        raw = make_project({"status": {"Overall Project": None}, "phase_completion": {"Phase": None}, "risks": []}, rng.randrange(10**6))
+        portfolio.update(Project(project_id, raw, None))
+
+    print(f"single-project update: {_timed(update, repeat):.3f} ms")
+    began = time.perf_counter()
+    portfolio.refresh(force=True)
+    print(f"rescan (no changes):   {(time.perf_counter() - began) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--out", required=True, help="directory for the project files")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--no-bench", action="store_true", help="only write the files")
+    args = parser.parse_args()
+
+    generate(args.projects, args.out)
+    print(f"Wrote {args.projects} projects to {args.out}")
+    if not args.no_bench:
+        bench(args.out, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
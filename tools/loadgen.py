@@ -0,0 +1,252 @@
+"""Concurrent-session load generator for the dashboard.
+
+Starts app.py under `streamlit run` on a free local port and opens
+--sessions simulated browser sessions against it over Streamlit's websocket
+protocol (BackMsg/ForwardMsg protobufs on /_stcore/stream). Each session
+walks the sidebar radio through --pattern, waits for the rerun to finish,
+then pauses for --think seconds. At the end it reports p50/p95/p99 rerun
+latency, throughput, and peak server RSS growth per session.
+
+    python tools/loadgen.py --sessions 50 --rounds 5
+    python tools/loadgen.py --url http://localhost:8501   # existing server
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# ScriptFinishedStatus values that end a full-page rerun (fragment-only
+# runs and runs interrupted by a newer rerun are ignored)
+FULL_RUN_FINISHED = (0, 1)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port):
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", os.path.join(ROOT_DIR, "app.py"),
+        "--server.headless", "true",
+        "--server.port", str(port),
+        "--browser.gatherUsageStats", "false",
+    ]
+    proc = subprocess.Popen(cmd, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"{url}/_stcore/health", timeout=1) as resp:
+                if resp.status == 200:
+                    return proc, url
+        except OSError:
+            time.sleep(0.25)
+    proc.kill()
+    raise RuntimeError("Streamlit server did not become healthy within 60s")
+
+
+def rss_bytes(pid):
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss
+    except ImportError:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    return 0
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class _WebsocketsConnection:
+    # The subset of tornado's client connection that Session uses
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def write_message(self, message, binary=False):
+        await self.conn.send(message)
+
+    async def read_message(self):
+        import websockets
+
+        try:
+            return await self.conn.recv()
+        except websockets.ConnectionClosed:
+            return None
+
+    def close(self):
+        asyncio.ensure_future(self.conn.close())
+
+
+class Session:
+    def __init__(self, url):
+        self.ws_url = url.replace("http", "ws", 1) + "/_stcore/stream"
+        self.conn = None
+        self.radio_id = None
+
+    async def connect(self):
+        # Tornado ships with Streamlit releases served by Tornado; newer
+        # releases run on uvicorn and bring the websockets package instead
+        try:
+            from tornado.websocket import websocket_connect
+        except ImportError:
+            import websockets
+
+            self.conn = _WebsocketsConnection(await websockets.connect(self.ws_url, max_size=256 * 1024 * 1024))
+        else:
+            self.conn = await websocket_connect(self.ws_url, max_message_size=256 * 1024 * 1024)
+
+    async def rerun(self, page_index=None):
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        msg = BackMsg()
+        msg.rerun_script.query_string = ""
+        if page_index is not None and self.radio_id is not None:
+            widget = msg.rerun_script.widget_states.widgets.add()
+            widget.id = self.radio_id
+            widget.int_value = page_index
+
+        start = time.perf_counter()
+        await self.conn.write_message(msg.SerializeToString(), binary=True)
+        await self._wait_finished()
+        return time.perf_counter() - start
+
+    async def _wait_finished(self):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        while True:
+            raw = await self.conn.read_message()
+            if raw is None:
+                raise ConnectionError("server closed the websocket")
+            fwd = ForwardMsg()
+            fwd.ParseFromString(raw)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and self.radio_id is None:
+                element = fwd.delta.new_element
+                if element.WhichOneof("type") == "radio":
+                    self.radio_id = element.radio.id
+            elif kind == "script_finished" and fwd.script_finished in FULL_RUN_FINISHED:
+                return
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+
+
+async def run_session(url, pattern, rounds, think, latencies, ready):
+    session = Session(url)
+    await session.connect()
+    await session.rerun()
+    ready.append(session)
+    try:
+        for _ in range(rounds):
+            for page_index in pattern:
+                latencies.append(await session.rerun(page_index))
+                if think:
+                    await asyncio.sleep(random.uniform(0, 2 * think))
+    finally:
+        session.close()
+
+
+async def sample_rss(pid, peak, done):
+    # Sessions release their state on disconnect, so track the peak while
+    # they are all open rather than reading RSS at the end
+    while not done.is_set():
+        peak[0] = max(peak[0], rss_bytes(pid))
+        try:
+            await asyncio.wait_for(done.wait(), 0.5)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_load(url, sessions, pattern, rounds, think, ramp, pid=None):
+    latencies = []
+    ready = []
+    tasks = []
+    peak = [0]
+    done = asyncio.Event()
+    sampler = asyncio.ensure_future(sample_rss(pid, peak, done)) if pid else None
+
+    start = time.perf_counter()
+    for _ in range(sessions):
+        tasks.append(asyncio.ensure_future(run_session(url, pattern, rounds, think, latencies, ready)))
+        if ramp:
+            await asyncio.sleep(ramp)
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    if sampler is not None:
+        await sampler
+    errors = [r for r in results if isinstance(r, Exception)]
+    return latencies, elapsed, errors, peak[0]
+
+
+def main():
+    from dashboard.views import PAGES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3, help="times each session walks the pattern")
+    parser.add_argument("--pattern", default=",".join(str(i) for i in range(len(PAGES))),
+                        help="comma-separated sidebar radio indexes to visit in order")
+    parser.add_argument("--think", type=float, default=0.5, help="mean pause between page switches (s)")
+    parser.add_argument("--ramp", type=float, default=0.05, help="delay between session starts (s)")
+    parser.add_argument("--url", help="use an already running server instead of starting one")
+    args = parser.parse_args()
+
+    pattern = [int(i) for i in args.pattern.split(",")]
+
+    proc = None
+    if args.url:
+        url = args.url.rstrip("/")
+    else:
+        proc, url = start_server(free_port())
+
+    try:
+        rss_before = rss_bytes(proc.pid) if proc else 0
+        latencies, elapsed, errors, rss_peak = asyncio.run(
+            run_load(url, args.sessions, pattern, args.rounds, args.think, args.ramp, proc.pid if proc else None)
+        )
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    print(f"sessions:        {args.sessions} ({len(errors)} failed)")
+    print(f"reruns:          {len(latencies)} in {elapsed:.1f}s ({len(latencies) / elapsed:.1f}/s)")
+    if latencies:
+        print(f"latency p50:     {percentile(latencies, 50) * 1000:.1f} ms")
+        print(f"latency p95:     {percentile(latencies, 95) * 1000:.1f} ms")
+        print(f"latency p99:     {percentile(latencies, 99) * 1000:.1f} ms")
+        print(f"latency mean:    {statistics.mean(latencies) * 1000:.1f} ms")
+    if proc is not None:
+        growth = rss_peak - rss_before
+        print(f"server RSS:      {rss_before / 2**20:.1f} -> {rss_peak / 2**20:.1f} MiB peak "
+              f"({growth / max(args.sessions, 1) / 2**20:.2f} MiB/session)")
+    for error in errors[:5]:
+        print(f"error: {error!r}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
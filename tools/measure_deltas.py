@@ -0,0 +1,58 @@
+"""Count the delta messages and payload bytes each dashboard page sends.
+
+Every element Streamlit emits is one delta on the websocket; its payload is
+the serialized protobuf. Point --app at an older copy of app.py to compare
+before/after, e.g.
+
+    git show <rev>:app.py > /tmp/app_before.py
+    python tools/measure_deltas.py --app /tmp/app_before.py
+    python tools/measure_deltas.py
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# Every page in the sidebar, as tools/bench_pages.py measures them
+from dashboard.views import PAGES  # noqa: E402
+from element_tree import tree_stats  # noqa: E402
+
+
+def measure(app_path):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=60)
+    at.run()
+    rows = []
+    for page in PAGES:
+        at.sidebar.radio[0].set_value(page).run()
+        deltas, payload_bytes = tree_stats(at)
+        rows.append({"page": page, "deltas": deltas, "payload_bytes": payload_bytes})
+    return rows
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default=os.path.join(root, "app.py"))
+    parser.add_argument("--json", action="store_true", help="print raw JSON rows")
+    args = parser.parse_args()
+
+    app_path = os.path.abspath(args.app)
+    sys.path.insert(0, os.path.dirname(app_path))
+    rows = measure(app_path)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'Page':<28}{'deltas':>10}{'payload bytes':>16}")
+    for row in rows:
+        print(f"{row['page']:<28}{row['deltas']:>10}{row['payload_bytes']:>16}")
+
+
+if __name__ == "__main__":
+    main()
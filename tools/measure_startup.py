@@ -0,0 +1,83 @@
+"""Measure cold-start and per-rerun time of each dashboard page.
+
+Every page is measured in a fresh interpreter so module imports (pandas,
+plotly) count towards the cold start. Point --app at an older copy of
+app.py to get a before/after comparison, e.g.
+
+    git show <rev>:app.py > /tmp/app_before.py
+    python tools/measure_startup.py --app /tmp/app_before.py
+    python tools/measure_startup.py
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+# Every page in the sidebar, as tools/bench_pages.py measures them
+from dashboard.views import PAGES  # noqa: E402
+
+# Runs inside the child interpreter
+_CHILD = r"""
+import json, statistics, sys, time
+from streamlit.testing.v1 import AppTest
+
+app_path, page, reruns = sys.argv[1], sys.argv[2], int(sys.argv[3])
+
+start = time.perf_counter()
+at = AppTest.from_file(app_path, default_timeout=60)
+at.run()
+at.sidebar.radio[0].set_value(page).run()
+cold = time.perf_counter() - start
+
+samples = []
+for _ in range(reruns):
+    start = time.perf_counter()
+    at.run()
+    samples.append(time.perf_counter() - start)
+
+print(json.dumps({
+    "page": page,
+    "cold_start_s": round(cold, 4),
+    "rerun_median_s": round(statistics.median(samples), 4),
+    "rerun_max_s": round(max(samples), 4),
+}))
+"""
+
+
+def measure(app_path, page, reruns):
+    app_dir = os.path.dirname(os.path.abspath(app_path))
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD, os.path.abspath(app_path), page, str(reruns)],
+        cwd=app_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default=os.path.join(root, "app.py"))
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="print raw JSON rows")
+    args = parser.parse_args()
+
+    rows = [measure(args.app, page, args.reruns) for page in PAGES]
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'Page':<28}{'cold start (s)':>16}{'rerun p50 (s)':>16}{'rerun max (s)':>16}")
+    for row in rows:
+        print(f"{row['page']:<28}{row['cold_start_s']:>16.4f}{row['rerun_median_s']:>16.4f}{row['rerun_max_s']:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
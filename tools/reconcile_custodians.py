@@ -0,0 +1,148 @@
+"""Reconcile a Northern Trust and a State Street balance file, or generate a pair.
+
+    python tools/reconcile_custodians.py data/custodian/northern_trust_20250306.csv data/custodian/state_street_20250306.csv
+    python tools/reconcile_custodians.py --generate 500 --out-dir data/custodian --date 20250306
+    python tools/reconcile_custodians.py --bench 20000000
+
+--generate writes a pair of files over the same positions in each
+custodian's layout and formatting (zero-padded State Street accounts,
+lower-case CUSIPs), with a known share of rounding differences, real
+breaks and positions missing on either side. --bench generates a pair
+into a temporary directory, reconciles it and reports time and peak RSS;
+past DASHBOARD_RECON_PARTITION_BYTES per file memory stays flat as the row
+count grows.
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from datetime import date
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from dashboard.profiling import CUSTODIANS  # noqa: E402
+from dashboard.reconcile import CLASSES, FIELDS, reconcile  # noqa: E402
+
+# Shares of positions with a rounding difference, a real break, or present
+# at only one custodian, of descriptions left blank and of market values
+# delivered malformed
+ROUNDING_RATE = 0.02
+BREAK_RATE = 0.01
+MISSING_RATE = 0.005
+BLANK_RATE = 0.01
+BAD_VALUE_RATE = 0.002
+
+FUNDS = np.array([f"Stable Value Fund {letter}" for letter in "ABCDEFGH"] + [f"Target Date {year}" for year in range(2025, 2070, 5)])
+
+
+def _write(path, side, values, header):
+    # values: reconciliation field -> array; the rest of the layout is filled in
+    fields = FIELDS[side]
+    by_column = {fields[name]: array for name, array in values.items() if name in fields}
+    n = len(values["value"])
+    columns = {}
+    for column, kind in CUSTODIANS[side]["types"].items():
+        if column in by_column:
+            columns[column] = by_column[column]
+        elif column in ("Price", "NAV"):
+            columns[column] = values["price"]
+        elif column in ("Currency", "CCY"):
+            columns[column] = np.full(n, "USD")
+        elif column in ("Security Description", "SEC_NAME"):
+            columns[column] = values["name"]
+        else:
+            columns[column] = np.char.mod("%06d", values["plan"])
+    with open(path, "ab") as f:
+        if header:
+            f.write((",".join(columns) + "\n").encode())
+        pa_csv.write_csv(pa.table(columns), f, write_options=pa_csv.WriteOptions(include_header=False, quoting_style="none"))
+
+
+def generate(rows, out_dir, day, seed=0, chunk_rows=1_000_000):
+    # The same positions as each custodian reports them: State Street pads
+    # account numbers to nine digits and lower-cases CUSIPs
+    rng = np.random.default_rng(seed)
+    as_of = date(int(day[:4]), int(day[4:6]), int(day[6:]))
+    paths = {side: os.path.join(out_dir, f"{side}_{day}.csv") for side in FIELDS}
+    for path in paths.values():
+        if os.path.exists(path):
+            os.remove(path)
+    for chunk, start in enumerate(range(0, rows, chunk_rows)):
+        n = min(chunk_rows, rows - start)
+        account = rng.integers(10**5, 10**6, n)
+        cusip = np.char.add(np.char.mod("%06X", rng.integers(0, 16**6, n)), np.char.mod("%03d", np.arange(start, start + n) % 1000))
+        units = np.round(rng.lognormal(6, 2, n), 2)
+        price = np.round(rng.uniform(5, 200, n), 4)
+        value = np.round(units * price, 2)
+        name = FUNDS[rng.integers(0, len(FUNDS), n)].astype(object)
+        name[rng.random(n) < BLANK_RATE] = None
+        position = {"price": price, "name": name, "plan": rng.integers(0, 10**6, n)}
+
+        other = value.copy()
+        roll = rng.random(n)
+        rounding = roll < ROUNDING_RATE
+        other[rounding] += rng.choice([-0.01, 0.01, 0.5], rounding.sum())
+        broken = (roll >= ROUNDING_RATE) & (roll < ROUNDING_RATE + BREAK_RATE)
+        other[broken] *= rng.uniform(0.5, 1.5, broken.sum())
+        missing = rng.random(n) < 2 * MISSING_RATE
+        only_left = missing & (rng.random(n) < 0.5)
+
+        for side, keep, account_ids, cusips, values, date_text in (
+            ("northern_trust", ~(missing & ~only_left), account.astype(str), cusip, value, as_of.strftime("%m/%d/%Y")),
+            ("state_street", ~only_left, np.char.zfill(account.astype(str), 9), np.char.lower(cusip), other, as_of.isoformat()),
+        ):
+            text = np.char.mod("%.2f", values).astype(object)
+            text[rng.random(n) < BAD_VALUE_RATE] = "N/A"
+            _write(paths[side], side, {
+                "date": np.full(keep.sum(), date_text), "account": account_ids[keep], "security": cusips[keep],
+                "units": units[keep], "value": text[keep],
+            } | {name: array[keep] for name, array in position.items()}, header=chunk == 0)
+    return paths["northern_trust"], paths["state_street"]
+
+
+def report(summary):
+    print(
+        f"{summary['left']['custodian']} {summary['left']['rows']:,} rows vs "
+        f"{summary['right']['custodian']} {summary['right']['rows']:,} rows: "
+        f"{summary['keys']:,} keys in {summary['seconds']:.1f}s ({summary['partitions']} partition(s))"
+    )
+    for name in CLASSES:
+        print(f"  {name:<18} {summary['counts'][name]:>12,}  ${summary['amounts'][name]:>18,.2f}")
+    print(f"  match rate         {summary['match_rate']:.2%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("files", nargs="*", help="Northern Trust file, State Street file")
+    parser.add_argument("--generate", type=int, metavar="ROWS")
+    parser.add_argument("--out-dir", default=tempfile.gettempdir())
+    parser.add_argument("--date", default="20250306")
+    parser.add_argument("--bench", type=int, metavar="ROWS")
+    args = parser.parse_args()
+
+    if args.generate:
+        for path in generate(args.generate, args.out_dir, args.date):
+            print(f"Wrote {path}")
+        return 0
+    if args.bench:
+        # Generate in a separate process so the peak RSS is the reconciliation's
+        out_dir = tempfile.mkdtemp(prefix="recon-bench-")
+        subprocess.run([sys.executable, __file__, "--generate", str(args.bench), "--out-dir", out_dir, "--date", args.date], check=True)
+        report(reconcile(*(os.path.join(out_dir, f"{side}_{args.date}.csv") for side in FIELDS)))
+        print(f"peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+        return 0
+    if len(args.files) != 2:
+        parser.error("give two files, or --generate / --bench")
+    report(reconcile(*args.files))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""Record the current status datasets as a snapshot in the history store.
+
+Run after each weekly data update (e.g. from the job that edits data/).
+The snapshot is dated with data/meta.json's as_of unless --date is given;
+recording a date again replaces that snapshot.
+
+    python tools/record_history.py
+    python tools/record_history.py --date 2025-02-28
+
+--bench WEEKS instead fills a temporary store with WEEKS synthetic weekly
+snapshots and times as-of reads and the burn-up series against it.
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def record(day):
+    from dashboard import history
+    from dashboard.data import load_dataset
+
+    values = {name: load_dataset(name) for name in history.TRACKED}
+    history.store.record(day, values)
+    print(f"Recorded {', '.join(values)} as of {day} in {history.store.directory}")
+
+
+def bench(weeks, reads):
+    from dashboard import history
+    from dashboard.data import load_dataset
+
+    store = history.HistoryStore(tempfile.mkdtemp(prefix="dashboard-history-"))
+    phases = dict(load_dataset("phase_completion"))
+    statuses = dict(load_dataset("project_status_data"))
+    risks = [dict(risk) for risk in load_dataset("risk_data")]
+    start = date(2025, 3, 7) - timedelta(weeks=weeks)
+
+    began = time.perf_counter()
+    for week in range(weeks):
+        day = start + timedelta(weeks=week)
+        progress = (week + 1) / weeks
+        values = {
+            "phase_completion": {phase: round(pct * progress) for phase, pct in phases.items()},
+            "project_status_data": {area: random.choice(["ON TRACK", "ON TRACK", "AT RISK"]) for area in statuses},
+            "risk_data": [dict(risk, Likelihood=random.choice(["Low", "Medium", "High"])) for risk in risks],
+        }
+        store.record(day, values)
+    print(f"recorded {weeks} weeks in {time.perf_counter() - began:.2f}s")
+
+    days = store.dates()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    began = time.perf_counter()
+    for _ in range(reads):
+        day = random.choice(days)
+        for name in history.TRACKED:
+            store.get(name, day)
+    per_read = (time.perf_counter() - began) / reads * 1000
+    began = time.perf_counter()
+    burnup = store.phase_burnup()
+    print(f"as-of read (3 datasets): {per_read:.3f} ms")
+    print(f"burn-up series:          {(time.perf_counter() - began) * 1000:.2f} ms for {len(burnup['dates'])} dates")
+    print(f"max RSS growth:          {(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024:.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--date", type=date.fromisoformat, help="snapshot date (default: meta.json as_of)")
+    parser.add_argument("--bench", type=int, metavar="WEEKS", help="benchmark a synthetic store instead")
+    parser.add_argument("--reads", type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.bench:
+        bench(args.bench, args.reads)
+        return 0
+
+    from dashboard.history import current_as_of
+
+    record(args.date or current_as_of())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())